@@ -5,13 +5,36 @@ and side effect notes. Emphasizes privacy and local storage.
 """
 
 import streamlit as st
-from datetime import datetime, date, time, timedelta
+from array import array
+from contextlib import contextmanager
+import copy
+import glob
+import heapq
+from datetime import datetime, date, time
 import json
 import os
+import threading
+import uuid
 from typing import Dict, List, Optional
 
+import numpy as np
+
+# Optional fast JSON codec; falls back to the standard library
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional compact binary codec for the medication list
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 # Medication types
-MEDICATION_TYPES = [
+MEDICATION_TYPES = (
     "💊 Prescription Medication",
     "💊 Over-the-Counter Medication",
     "🌿 Herbal Supplement",
@@ -22,10 +45,10 @@ MEDICATION_TYPES = [
     "🌙 Sleep Aid",
     "⚡ Energy Supplement",
     "🎯 Other"
-]
+)
 
 # Frequency options
-FREQUENCY_OPTIONS = [
+FREQUENCY_OPTIONS = (
     "Once daily",
     "Twice daily",
     "Three times daily",
@@ -34,10 +57,25 @@ FREQUENCY_OPTIONS = [
     "Weekly",
     "As needed",
     "Custom schedule"
-]
+)
+
+# Icon shown for each medication type
+MED_TYPE_ICONS = {med_type: med_type.split()[0] for med_type in MEDICATION_TYPES}
+
+# Expected doses per day for each frequency option
+FREQUENCY_TO_DOSES = {
+    "Once daily": 1,
+    "Twice daily": 2,
+    "Three times daily": 3,
+    "Four times daily": 4,
+    "Every other day": 0.5,
+    "Weekly": 1/7,
+    "As needed": 1,
+    "Custom schedule": 1
+}
 
 # Common side effects
-COMMON_SIDE_EFFECTS = [
+COMMON_SIDE_EFFECTS = (
     "Nausea",
     "Headache",
     "Drowsiness",
@@ -50,7 +88,27 @@ COMMON_SIDE_EFFECTS = [
     "Mood changes",
     "Appetite changes",
     "None observed"
-]
+)
+
+# Storage locations
+LEGACY_MEDICATIONS_FILE = "data/medications.json"
+MEDICATIONS_FILE = "data/medications.mpk" if MSGPACK_AVAILABLE else LEGACY_MEDICATIONS_FILE
+MEDICATION_LOGS_FILE = "data/medication_logs.jsonl"
+LEGACY_MEDICATION_LOGS_FILE = "data/medication_logs.json"
+MEDICATION_LOGS_ARCHIVE_PATTERN = "data/medication_logs_archive_{year}.jsonl"
+
+# All medication files live here; create the directory once at import
+os.makedirs("data", exist_ok=True)
+
+# Number of most recent log entries kept in memory; older ones are archived
+MAX_LIVE_LOGS = 2000
+# The log file is checked every ARCHIVE_BATCH_SIZE appends and archived once it
+# has grown that far past MAX_LIVE_LOGS, so it is not rewritten on every dose
+ARCHIVE_BATCH_SIZE = 200
+
+# Serializes log appends with the archive rewrite across sessions in this process
+_LOG_FILE_LOCK = threading.Lock()
+_appends_since_archive_check = 0
 
 # Time of day presets
 TIME_PRESETS = {
@@ -61,24 +119,100 @@ TIME_PRESETS = {
     "Evening": time(18, 0),
     "Bedtime": time(22, 0)
 }
+# (name, "HH:MM") pairs materialized once for the schedule checkboxes
+TIME_PRESET_ITEMS = tuple((name, preset.strftime("%H:%M")) for name, preset in TIME_PRESETS.items())
 
 
 def initialize_medication_state():
     """Initialize session state for medication tracker."""
     if "medications" not in st.session_state:
-        st.session_state.medications = load_medications()
+        # Deep copies, so in-session edits never touch the parse shared by other sessions
+        cached = _load_medications_cached(_file_mtime(MEDICATIONS_FILE))
+        st.session_state.medications = copy.deepcopy(cached)
     if "medication_logs" not in st.session_state:
-        st.session_state.medication_logs = load_medication_logs()
+        cached = _load_medication_logs_cached(_file_mtime(MEDICATION_LOGS_FILE))
+        logs = None
+        if len(cached) >= MAX_LIVE_LOGS + ARCHIVE_BATCH_SIZE:
+            # Only ever trim to what is left in the live file after archiving
+            logs = archive_old_logs()
+        st.session_state.medication_logs = copy.deepcopy(cached) if logs is None else logs
     if "refill_reminders" not in st.session_state:
         st.session_state.refill_reminders = []
 
 
+def _file_mtime(path: str) -> float:
+    """Return the file's modification time, or 0.0 if it does not exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_medications_cached(mtime: float) -> List[Dict]:
+    """Parse the medications file once per modification time, shared across sessions.
+
+    Only the parse for the current mtime is kept; callers must copy before mutating.
+    """
+    return load_medications()
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_medication_logs_cached(mtime: float) -> List[Dict]:
+    """Parse the medication log file once per modification time, shared across sessions.
+
+    Every append bumps the mtime, so only the newest parse is kept.
+    """
+    return load_medication_logs()
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(raw: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_atomic(path: str, chunks) -> None:
+    """Write byte chunks to a temp file and swap it into place with os.replace.
+
+    A crash mid-write leaves the previous file intact instead of a truncated one.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.writelines(chunks)
+    os.replace(tmp_path, path)
+
+
+def _dump_medications(path: str, data) -> None:
+    """Atomically write data to path, picking msgpack or JSON by file extension."""
+    payload = msgpack.packb(data) if path.endswith(".mpk") else _json_dumps(data)
+    _write_atomic(path, (payload,))
+
+
+def _load_medications_file(path: str):
+    """Read a medications file written by _dump_medications."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return msgpack.unpackb(raw) if path.endswith(".mpk") else _json_loads(raw)
+
+
 def load_medications() -> List[Dict]:
-    """Load medication list from file."""
+    """Load medication list from file.
+
+    Falls back to the older JSON file until the first msgpack save.
+    """
     try:
-        if os.path.exists("data/medications.json"):
-            with open("data/medications.json", "r") as f:
-                return json.load(f)
+        for path in (MEDICATIONS_FILE, LEGACY_MEDICATIONS_FILE):
+            if os.path.exists(path):
+                return _load_medications_file(path)
     except Exception as e:
         st.warning(f"Could not load medications: {e}")
     return []
@@ -87,79 +221,375 @@ def load_medications() -> List[Dict]:
 def save_medications(medications: List[Dict]) -> bool:
     """Save medication list to file."""
     try:
-        os.makedirs("data", exist_ok=True)
-        with open("data/medications.json", "w") as f:
-            json.dump(medications, f, indent=2)
+        _dump_medications(MEDICATIONS_FILE, medications)
         return True
     except Exception as e:
         st.error(f"Could not save medications: {e}")
         return False
 
 
+def _stored_fields(log: Dict) -> Dict:
+    """Drop in-memory helper fields (prefixed with "_") before a log is written."""
+    return {key: value for key, value in log.items() if not key.startswith("_")}
+
+
+def _iter_jsonl(path: str):
+    """Yield one decoded record per non-empty line of a JSONL file."""
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield _json_loads(line)
+
+
 def load_medication_logs() -> List[Dict]:
-    """Load medication logs from file."""
+    """Load medication logs from the append-only JSONL file.
+
+    Older installs stored logs as a single JSON array; that file is migrated
+    to JSONL the first time it is read and then left in place.
+    """
+    logs = []
     try:
-        if os.path.exists("data/medication_logs.json"):
-            with open("data/medication_logs.json", "r") as f:
-                return json.load(f)
+        if os.path.exists(MEDICATION_LOGS_FILE):
+            logs = list(_iter_jsonl(MEDICATION_LOGS_FILE))
+        elif os.path.exists(LEGACY_MEDICATION_LOGS_FILE):
+            with open(LEGACY_MEDICATION_LOGS_FILE, "rb") as f:
+                logs = _json_loads(f.read())
+            save_medication_logs(logs)
     except Exception as e:
         st.warning(f"Could not load medication logs: {e}")
-    return []
+    
+    return _with_date_ordinals(logs)
+
+
+def _with_date_ordinals(logs: List[Dict]) -> List[Dict]:
+    """Parse each date once so filters compare integers instead of strings."""
+    for log in logs:
+        log["_date_ord"] = _date_ordinal(log.get("date", ""))
+    return logs
+
+
+def append_medication_log(log_entry: Dict) -> bool:
+    """Append a single log entry to the JSONL file without rewriting history.
+
+    Every ARCHIVE_BATCH_SIZE appends (across all sessions) the file is
+    checked for entries to archive.
+    """
+    global _appends_since_archive_check
+    try:
+        with _LOG_FILE_LOCK:
+            with open(MEDICATION_LOGS_FILE, "ab") as f:
+                f.write(_json_dumps(_stored_fields(log_entry)) + b"\n")
+            _appends_since_archive_check += 1
+            archive_due = _appends_since_archive_check >= ARCHIVE_BATCH_SIZE
+            if archive_due:
+                _appends_since_archive_check = 0
+    except Exception as e:
+        st.error(f"Could not save medication log: {e}")
+        return False
+    if archive_due:
+        archive_old_logs()
+    return True
 
 
 def save_medication_logs(logs: List[Dict]) -> bool:
-    """Save medication logs to file."""
+    """Rewrite the whole JSONL log file (compaction/migration only)."""
     try:
-        os.makedirs("data", exist_ok=True)
-        with open("data/medication_logs.json", "w") as f:
-            json.dump(logs, f, indent=2)
+        _write_atomic(MEDICATION_LOGS_FILE, (_json_dumps(_stored_fields(log)) + b"\n" for log in logs))
         return True
     except Exception as e:
         st.error(f"Could not save medication logs: {e}")
         return False
 
 
-def check_refill_needed(med: Dict) -> bool:
-    """Check if medication needs refill soon."""
-    if med.get("quantity_remaining", 0) <= med.get("refill_threshold", 7):
-        return True
-    return False
+def archive_old_logs() -> Optional[List[Dict]]:
+    """Move all but the newest MAX_LIVE_LOGS entries of the log file into per-year archives.
+
+    Does nothing until the file has grown ARCHIVE_BATCH_SIZE entries past
+    the limit. The file is re-read under _LOG_FILE_LOCK, so sessions racing
+    to archive never copy the same entries twice.
+
+    Returns the entries left in the live file (archived or not), or None if
+    it could not be read; a session may replace its copy with them without
+    losing anything that was not archived.
+
+    Adherence only looks back 30 days, so archived entries are only needed
+    when browsing older history.
+    """
+    with _LOG_FILE_LOCK:
+        try:
+            logs = list(_iter_jsonl(MEDICATION_LOGS_FILE))
+        except Exception as e:
+            st.warning(f"Could not archive old medication logs: {e}")
+            return None
+        if len(logs) < MAX_LIVE_LOGS + ARCHIVE_BATCH_SIZE:
+            return _with_date_ordinals(logs)
+        
+        ordered = sorted(logs, key=_log_sort_key)
+        overflow = len(ordered) - MAX_LIVE_LOGS
+        archived, live = ordered[:overflow], ordered[overflow:]
+        
+        by_year: Dict[str, List[Dict]] = {}
+        for log in archived:
+            by_year.setdefault(log.get("date", "")[:4] or "unknown", []).append(log)
+        
+        try:
+            for year, entries in by_year.items():
+                with open(MEDICATION_LOGS_ARCHIVE_PATTERN.format(year=year), "ab") as f:
+                    f.writelines(_json_dumps(_stored_fields(log)) + b"\n" for log in entries)
+        except Exception as e:
+            st.warning(f"Could not archive old medication logs: {e}")
+            return _with_date_ordinals(logs)
+        
+        if not save_medication_logs(live):
+            return _with_date_ordinals(logs)
+        return _with_date_ordinals(live)
+
+
+def load_archived_logs() -> List[Dict]:
+    """Read every archived log entry (only used on demand from the history view)."""
+    archived = []
+    try:
+        for path in sorted(glob.glob(MEDICATION_LOGS_ARCHIVE_PATTERN.format(year="*"))):
+            archived.extend(_iter_jsonl(path))
+    except Exception as e:
+        st.warning(f"Could not load archived medication logs: {e}")
+    return archived
+
+
+class _PendingWrites:
+    """Dirty flag for the medication save deferred until the end of a grouped_writes() block."""
+
+    def __init__(self):
+        self.depth = 0
+        self.meds_dirty = False
+
+
+def _get_pending_writes() -> _PendingWrites:
+    if "_pending_writes" not in st.session_state:
+        st.session_state._pending_writes = _PendingWrites()
+    return st.session_state._pending_writes
+
+
+def mark_medications_dirty():
+    """Schedule the medication list to be saved at the end of the current write group.
 
+    Outside a group (e.g. when a fragment reruns on its own) it is saved immediately.
+    """
+    st.session_state.pop("_refill_count_cache", None)
+    pending = _get_pending_writes()
+    pending.meds_dirty = True
+    if pending.depth == 0:
+        flush_pending_writes()
 
-def calculate_adherence_rate(med_id: str, days: int = 7) -> float:
-    """Calculate adherence rate for a medication over specified days."""
+
+def flush_pending_writes():
+    """Save the medication list if it was marked dirty since the last flush."""
+    pending = _get_pending_writes()
+    if pending.meds_dirty:
+        pending.meds_dirty = False
+        save_medications(st.session_state.medications)
+
+
+@contextmanager
+def grouped_writes():
+    """Coalesce saves requested inside the block into a single flush on exit.
+
+    The flush runs in ``finally`` so writes still land when a button handler
+    ends the script early with ``st.rerun()``.
+    """
+    pending = _get_pending_writes()
+    pending.depth += 1
+    try:
+        yield pending
+    finally:
+        pending.depth -= 1
+        if pending.depth == 0:
+            flush_pending_writes()
+
+
+def get_refill_count() -> int:
+    """Number of medications at or below their refill threshold.
+
+    Cached until the medication list changes or a quantity is updated
+    (see mark_medications_dirty).
+    """
+    meds = st.session_state.medications
+    signature = (id(meds), len(meds))
+    cached = st.session_state.get("_refill_count_cache")
+    if cached is None or cached[0] != signature:
+        count = sum(
+            1 for med in meds
+            if med.get("quantity_remaining", 0) <= med.get("refill_threshold", 7)
+        )
+        cached = (signature, count)
+        st.session_state["_refill_count_cache"] = cached
+    return cached[1]
+
+
+def _logs_signature() -> tuple:
+    """Cheap fingerprint of the logs, medications and current day, used to invalidate cached rates.
+
+    The day is included because adherence windows end today, so rates go
+    stale at midnight even when no log was added.
+    """
     logs = st.session_state.medication_logs
-    
-    # Get logs for this medication in the last X days
-    cutoff_date = (datetime.now() - timedelta(days=days)).date()
-    recent_logs = [
-        log for log in logs
-        if log.get("medication_id") == med_id
-        and datetime.fromisoformat(log.get("date", "")).date() >= cutoff_date
-        and log.get("taken", False)
-    ]
-    
-    # Find the medication
-    medication = next((m for m in st.session_state.medications if m.get("id") == med_id), None)
-    if not medication:
-        return 0.0
-    
-    # Calculate expected doses based on frequency
-    frequency = medication.get("frequency", "Once daily")
-    doses_per_day = 1
-    if "twice" in frequency.lower():
-        doses_per_day = 2
-    elif "three times" in frequency.lower():
-        doses_per_day = 3
-    elif "four times" in frequency.lower():
-        doses_per_day = 4
-    elif "every other day" in frequency.lower():
-        doses_per_day = 0.5
-    elif "weekly" in frequency.lower():
-        doses_per_day = 1/7
+    return (id(logs), len(logs), len(st.session_state.medications), date.today().toordinal())
+
+
+def get_medications_by_id() -> Dict[str, Dict]:
+    """Return an id -> medication lookup, rebuilt only when the medication list changes."""
+    meds = st.session_state.medications
+    signature = (id(meds), len(meds))
+    cached = st.session_state.get("_med_by_id_cache")
+    if cached is None or cached[0] != signature:
+        cached = (signature, {m.get("id"): m for m in meds})
+        st.session_state["_med_by_id_cache"] = cached
+    return cached[1]
+
+
+def _date_ordinal(value: str) -> int:
+    """Convert an ISO date/datetime string to a proleptic Gregorian ordinal."""
+    try:
+        return date.fromisoformat(value[:10]).toordinal()
+    except (TypeError, ValueError):
+        return 0
+
+
+class _LogColumns:
+    """Struct-of-arrays view (date ordinal, taken flag) over a set of logs."""
+
+    def __init__(self):
+        self.dates = array("q")
+        self.taken = array("b")
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def append(self, date_ordinal: int, taken: bool):
+        """Add one log entry to the parallel arrays."""
+        self.dates.append(date_ordinal)
+        self.taken.append(1 if taken else 0)
+
+    def count_since(self, cutoff_ordinal: int, taken_only: bool = False) -> int:
+        """Count logs on or after the cutoff, optionally only taken doses."""
+        mask = np.frombuffer(self.dates, dtype=np.int64) >= cutoff_ordinal
+        if taken_only:
+            mask &= np.frombuffer(self.taken, dtype=np.bool_)
+        return int(np.count_nonzero(mask))
+
+
+class _LogIndex(_LogColumns):
+    """Columns over all logs plus a pre-bucketed set of columns per medication."""
+
+    def __init__(self, logs: List[Dict]):
+        super().__init__()
+        self.source_id = id(logs)
+        self.codes: Dict[str, int] = {}
+        self.med_codes = array("q")
+        self.by_med: Dict[str, _LogColumns] = {}
+        for log in logs:
+            self.add(log)
+
+    def add(self, log: Dict):
+        """Index one log entry globally and in its medication's bucket."""
+        date_ordinal = log.get("_date_ord")
+        if date_ordinal is None:
+            date_ordinal = _date_ordinal(log.get("date", ""))
+        taken = log.get("taken", False)
+        self.append(date_ordinal, taken)
+        med_id = log.get("medication_id")
+        if med_id not in self.by_med:
+            self.codes[med_id] = len(self.codes)
+            self.by_med[med_id] = _LogColumns()
+        self.med_codes.append(self.codes[med_id])
+        self.by_med[med_id].append(date_ordinal, taken)
+
+    def taken_counts_since(self, cutoff_ordinal: int) -> Dict[str, int]:
+        """Count taken doses on or after the cutoff for every medication in one pass."""
+        mask = np.frombuffer(self.dates, dtype=np.int64) >= cutoff_ordinal
+        mask &= np.frombuffer(self.taken, dtype=np.bool_)
+        counts = np.bincount(np.frombuffer(self.med_codes, dtype=np.int64)[mask], minlength=len(self.codes))
+        return {med_id: int(counts[code]) for med_id, code in self.codes.items()}
+
+
+def get_log_index() -> _LogIndex:
+    """Return the columnar log index, rebuilding it only when the logs list changed."""
+    logs = st.session_state.medication_logs
+    index = st.session_state.get("_log_index")
+    if index is None or index.source_id != id(logs) or len(index) != len(logs):
+        index = _LogIndex(logs)
+        st.session_state["_log_index"] = index
+    return index
+
+
+def add_medication_log(log_entry: Dict) -> bool:
+    """Record a log entry in session state, the columnar index and the log file."""
+    index = get_log_index()
+    logs = st.session_state.medication_logs
+    logs.append(log_entry)
+    index.add(log_entry)
+    if not append_medication_log(log_entry):
+        return False
+    if len(logs) >= MAX_LIVE_LOGS + ARCHIVE_BATCH_SIZE:
+        # Swap in what the live file holds once it is archived; entries only
+        # leave the session after they have reached an archive file.
+        # A new list object, so the index and adherence caches rebuild
+        live = archive_old_logs()
+        if live is not None:
+            st.session_state.medication_logs = live
+    return True
+
+
+def _get_adherence_cache() -> Dict[tuple, float]:
+    """(med_id, days) -> adherence cache, dropped whenever the logs or the day change."""
+    signature = _logs_signature()
+    cached = st.session_state.get("_adherence_cache")
+    if cached is None or cached[0] != signature:
+        cached = (signature, {})
+        st.session_state["_adherence_cache"] = cached
+    return cached[1]
+
+
+def get_adherence_rate(med: Dict, days: int = 7) -> float:
+    """Return the adherence rate for a medication, memoized per (med_id, days).
+
+    The medication list and the adherence tab share a single computation
+    per rerun.
+    """
+    rates = _get_adherence_cache()
+    key = (med.get("id"), days)
+    if key not in rates:
+        rates[key] = calculate_adherence_rate(med, get_log_index().by_med.get(med.get("id")), days)
+    return rates[key]
+
+
+def get_adherence_rates(medications: List[Dict], days: int = 7) -> Dict[str, float]:
+    """Return adherence for every medication, counting doses in one vectorized pass."""
+    rates = _get_adherence_cache()
+    missing = [med for med in medications if (med.get("id"), days) not in rates]
+    if missing:
+        counts = get_log_index().taken_counts_since(date.today().toordinal() - days)
+        for med in missing:
+            rates[(med.get("id"), days)] = _adherence_from_count(med, counts.get(med.get("id"), 0), days)
+    return {med.get("id"): rates[(med.get("id"), days)] for med in medications}
+
+
+def calculate_adherence_rate(med: Dict, med_logs: Optional[_LogColumns], days: int = 7) -> float:
+    """Calculate adherence rate for a medication from its own bucket of logs."""
+    # Count taken doses for this medication in the last X days
+    cutoff_ordinal = date.today().toordinal() - days
+    actual_doses = med_logs.count_since(cutoff_ordinal, taken_only=True) if med_logs else 0
+    return _adherence_from_count(med, actual_doses, days)
+
+
+def _adherence_from_count(med: Dict, actual_doses: int, days: int) -> float:
+    """Convert a count of taken doses into a capped adherence percentage."""
+    # Expected doses are precomputed when the medication is added
+    doses_per_day = med.get("doses_per_day")
+    if doses_per_day is None:
+        doses_per_day = FREQUENCY_TO_DOSES.get(med.get("frequency", "Once daily"), 1)
     
     expected_doses = doses_per_day * days
-    actual_doses = len(recent_logs)
     
     if expected_doses == 0:
         return 0.0
@@ -167,20 +597,23 @@ def calculate_adherence_rate(med_id: str, days: int = 7) -> float:
     return min((actual_doses / expected_doses) * 100, 100)
 
 
+@st.fragment
 def render_medication_list():
     """Render the list of medications."""
     st.markdown("### 💊 My Medications & Supplements")
     
-    if not st.session_state.medications:
+    meds = st.session_state.medications
+    
+    if not meds:
         st.info("👋 No medications added yet. Click 'Add New Medication' to get started!")
         return
     
     # Check for refill reminders
-    needs_refill = [med for med in st.session_state.medications if check_refill_needed(med)]
-    if needs_refill:
-        st.warning(f"⚠️ {len(needs_refill)} medication(s) need refill soon!")
+    refill_count = get_refill_count()
+    if refill_count:
+        st.warning(f"⚠️ {refill_count} medication(s) need refill soon!")
     
-    for med in st.session_state.medications:
+    for med in meds:
         with st.expander(
             f"{med.get('icon', '💊')} {med.get('name', 'Unnamed')} - {med.get('dosage', '')}",
             expanded=False
@@ -211,7 +644,7 @@ def render_medication_list():
                     st.write(f"📦 Quantity remaining: {quantity}")
                 
                 # Adherence rate
-                adherence = calculate_adherence_rate(med.get('id', ''), 7)
+                adherence = get_adherence_rate(med, 7)
                 if adherence >= 90:
                     st.success(f"✅ 7-day adherence: {adherence:.0f}%")
                 elif adherence >= 70:
@@ -229,16 +662,16 @@ def render_medication_list():
                         "taken": True,
                         "time_taken": datetime.now().strftime("%H:%M"),
                         "notes": "",
-                        "side_effects": []
+                        "side_effects": [],
+                        "_date_ord": date.today().toordinal()
                     }
-                    st.session_state.medication_logs.append(log_entry)
+                    add_medication_log(log_entry)
                     
-                    # Update quantity
+                    # Update quantity; the medication file only changes if stock was left
                     if med.get('quantity_remaining', 0) > 0:
                         med['quantity_remaining'] -= 1
+                        mark_medications_dirty()
                     
-                    save_medication_logs(st.session_state.medication_logs)
-                    save_medications(st.session_state.medications)
                     st.success("Logged!")
                     st.rerun()
                 
@@ -251,9 +684,9 @@ def render_medication_list():
                 if st.button("🗑️ Delete", key=f"delete_{med.get('id')}", use_container_width=True):
                     if st.session_state.get(f"confirm_delete_{med.get('id')}", False):
                         st.session_state.medications = [
-                            m for m in st.session_state.medications if m.get('id') != med.get('id')
+                            m for m in meds if m.get('id') != med.get('id')
                         ]
-                        save_medications(st.session_state.medications)
+                        mark_medications_dirty()
                         st.success("Medication deleted!")
                         st.rerun()
                     else:
@@ -266,6 +699,7 @@ def render_medication_list():
                 st.caption(med.get('notes'))
 
 
+@st.fragment
 def render_add_medication():
     """Render form to add new medication."""
     st.markdown("### ➕ Add New Medication or Supplement")
@@ -325,13 +759,13 @@ def render_add_medication():
         st.markdown("**Schedule Times**")
         st.caption("Select what times you take this medication")
         
-        time_cols = st.columns(len(TIME_PRESETS))
+        time_cols = st.columns(len(TIME_PRESET_ITEMS))
         selected_times = []
         
-        for i, (preset_name, preset_time) in enumerate(TIME_PRESETS.items()):
-            with time_cols[i]:
+        for time_col, (preset_name, preset_time) in zip(time_cols, TIME_PRESET_ITEMS):
+            with time_col:
                 if st.checkbox(preset_name, key=f"time_{preset_name}"):
-                    selected_times.append(preset_time.strftime("%H:%M"))
+                    selected_times.append(preset_time)
         
         # Custom time
         custom_time = st.time_input("Add custom time (optional)", value=None, key="custom_time")
@@ -351,14 +785,15 @@ def render_add_medication():
                 st.error("Please fill in all required fields (marked with *)")
             else:
                 # Get icon based on type
-                icon = med_type.split()[0] if med_type else "💊"
+                icon = MED_TYPE_ICONS.get(med_type, "💊")
                 
                 new_med = {
-                    "id": f"med_{datetime.now().timestamp()}",
+                    "id": f"med_{uuid.uuid4().hex}",
                     "name": name,
                     "type": med_type,
                     "dosage": dosage,
                     "frequency": frequency,
+                    "doses_per_day": FREQUENCY_TO_DOSES.get(frequency, 1),
                     "schedule_times": selected_times,
                     "purpose": purpose,
                     "prescriber": prescriber,
@@ -378,11 +813,20 @@ def render_add_medication():
                     st.error("Failed to save medication.")
 
 
+@st.cache_data(show_spinner=False)
+def _med_display_options(signature: int, meds: tuple) -> Dict[str, str]:
+    """Map selectbox labels to medication ids; cached on the medication list contents."""
+    return {f"{icon} {name} - {dosage}": med_id for med_id, name, icon, dosage in meds}
+
+
+@st.fragment
 def render_log_dose():
     """Render form to log medication dose."""
     st.markdown("### 📝 Log Medication Dose")
     
-    if not st.session_state.medications:
+    meds = st.session_state.medications
+    
+    if not meds:
         st.info("Add medications first to start logging doses.")
         return
     
@@ -391,8 +835,10 @@ def render_log_dose():
         
         with col1:
             # Medication selector
-            med_options = {f"{m.get('icon', '💊')} {m.get('name')} - {m.get('dosage')}": m.get('id') 
-                          for m in st.session_state.medications}
+            med_options = _med_display_options(
+                len(meds),
+                tuple((m.get('id'), m.get('name'), m.get('icon', '💊'), m.get('dosage')) for m in meds)
+            )
             
             selected_med_display = st.selectbox(
                 "Select Medication *",
@@ -433,7 +879,7 @@ def render_log_dose():
         
         if submitted:
             # Find medication
-            medication = next((m for m in st.session_state.medications if m.get('id') == selected_med_id), None)
+            medication = get_medications_by_id().get(selected_med_id)
             
             log_entry = {
                 "medication_id": selected_med_id,
@@ -444,29 +890,34 @@ def render_log_dose():
                 "status": taken,
                 "side_effects": side_effects,
                 "notes": notes,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now().isoformat(),
+                "_date_ord": log_date.toordinal()
             }
             
-            st.session_state.medication_logs.append(log_entry)
+            saved = add_medication_log(log_entry)
             
-            # Update quantity if taken
+            # Update quantity if taken; skip the save when nothing changed
             if "Taken" in taken and medication:
                 if medication.get('quantity_remaining', 0) > 0:
                     medication['quantity_remaining'] -= 1
+                    mark_medications_dirty()
             
-            if save_medication_logs(st.session_state.medication_logs):
-                save_medications(st.session_state.medications)
+            if saved:
                 st.success("✅ Dose logged successfully!")
                 st.rerun()
             else:
                 st.error("Failed to save log entry.")
 
 
+@st.fragment
 def render_adherence_tracking():
     """Render adherence tracking and statistics."""
     st.markdown("### 📊 Adherence Tracking")
     
-    if not st.session_state.medications:
+    meds = st.session_state.medications
+    logs = st.session_state.medication_logs
+    
+    if not meds:
         st.info("Add medications to track adherence.")
         return
     
@@ -481,9 +932,12 @@ def render_adherence_tracking():
     
     st.markdown("---")
     
+    # Adherence for every medication in one vectorized pass
+    rates = get_adherence_rates(meds, days)
+    
     # Adherence for each medication
-    for med in st.session_state.medications:
-        adherence = calculate_adherence_rate(med.get('id'), days)
+    for med in meds:
+        adherence = rates[med.get('id')]
         
         col1, col2, col3 = st.columns([0.5, 0.3, 0.2])
         
@@ -502,23 +956,19 @@ def render_adherence_tracking():
                 st.warning(f"{adherence:.0f}%")
     
     # Overall statistics
-    if st.session_state.medication_logs:
+    if logs:
         st.markdown("---")
         st.markdown("### 📈 Overall Statistics")
         
         # Calculate overall adherence
-        all_adherence = [calculate_adherence_rate(m.get('id'), days) for m in st.session_state.medications]
+        all_adherence = [rates[m.get('id')] for m in meds]
         avg_adherence = sum(all_adherence) / len(all_adherence) if all_adherence else 0
         
         # Count logs
-        cutoff_date = (datetime.now() - timedelta(days=days)).date()
-        recent_logs = [
-            log for log in st.session_state.medication_logs
-            if datetime.fromisoformat(log.get('date', '')).date() >= cutoff_date
-        ]
-        
-        taken_count = sum(1 for log in recent_logs if log.get('taken', False))
-        missed_count = sum(1 for log in recent_logs if not log.get('taken', False))
+        index = get_log_index()
+        cutoff_ordinal = date.today().toordinal() - days
+        taken_count = index.count_since(cutoff_ordinal, taken_only=True)
+        missed_count = index.count_since(cutoff_ordinal) - taken_count
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -529,14 +979,22 @@ def render_adherence_tracking():
         with col3:
             st.metric("Doses Missed", missed_count)
         with col4:
-            st.metric("Total Medications", len(st.session_state.medications))
+            st.metric("Total Medications", len(meds))
+
+
+def _log_sort_key(log: Dict) -> tuple:
+    """Sort key for logs: date, then time taken."""
+    return (log.get('date', ''), log.get('time_taken', ''))
 
 
+@st.fragment
 def render_medication_history():
     """Render medication log history."""
     st.markdown("### 📅 Medication History")
     
-    if not st.session_state.medication_logs:
+    logs = st.session_state.medication_logs
+    
+    if not logs:
         st.info("No medication logs yet. Start logging your doses!")
         return
     
@@ -545,10 +1003,13 @@ def render_medication_history():
     
     with col1:
         # Medication filter
-        med_filter_options = ["All Medications"] + [
-            f"{m.get('icon', '💊')} {m.get('name')}" for m in st.session_state.medications
-        ]
-        selected_filter = st.selectbox("Filter by medication:", med_filter_options)
+        meds_by_id = get_medications_by_id()
+        selected_filter = st.selectbox(
+            "Filter by medication:",
+            options=["All Medications"] + list(meds_by_id),
+            format_func=lambda med_id: med_id if med_id == "All Medications" else
+                f"{meds_by_id[med_id].get('icon', '💊')} {meds_by_id[med_id].get('name')}"
+        )
     
     with col2:
         # Show only
@@ -557,29 +1018,30 @@ def render_medication_history():
             options=["All entries", "Taken only", "Missed only"]
         )
     
-    # Sort logs by date (most recent first)
-    sorted_logs = sorted(
-        st.session_state.medication_logs,
-        key=lambda x: x.get('date', '') + x.get('time_taken', ''),
-        reverse=True
-    )
-    
-    # Apply filters
-    filtered_logs = sorted_logs
+    # Older entries live in archive files and are only read on request
+    history_logs = logs
+    if "archived_medication_logs" in st.session_state:
+        history_logs = st.session_state.archived_medication_logs + history_logs
+    elif glob.glob(MEDICATION_LOGS_ARCHIVE_PATTERN.format(year="*")):
+        if st.button("📂 Load archived entries", key="load_medication_archive"):
+            st.session_state.archived_medication_logs = load_archived_logs()
+            st.rerun()
     
-    if selected_filter != "All Medications":
-        med_name = selected_filter.split(" ", 1)[1] if " " in selected_filter else selected_filter
-        filtered_logs = [log for log in filtered_logs if log.get('medication_name') == med_name]
-    
-    if show_filter == "Taken only":
-        filtered_logs = [log for log in filtered_logs if log.get('taken', False)]
-    elif show_filter == "Missed only":
-        filtered_logs = [log for log in filtered_logs if not log.get('taken', False)]
+    # Apply filters in a single pass
+    filtered_logs = [
+        log for log in history_logs
+        if (selected_filter == "All Medications" or log.get('medication_id') == selected_filter)
+        and (show_filter != "Taken only" or log.get('taken', False))
+        and (show_filter != "Missed only" or not log.get('taken', False))
+    ]
     
     # Display logs
     st.markdown(f"**Showing {len(filtered_logs)} entries**")
     
-    for log in filtered_logs[:50]:  # Show last 50 entries
+    # Only the 50 most recent entries are shown, so avoid sorting the full history
+    recent_logs = heapq.nlargest(50, filtered_logs, key=_log_sort_key)
+    
+    for log in recent_logs:
         taken = log.get('taken', False)
         icon = "✅" if taken else "❌"
         status_color = "green" if taken else "red"
@@ -604,83 +1066,73 @@ def render_medication_history():
                 st.write(f"**Notes:** {log.get('notes')}")
 
 
+# Static content of the Info & Privacy tab, sent as a single markdown element
+_PRIVACY_INFO_MARKDOWN = """
+### 🔒 Privacy & Data Security
+
+> **Your health data is private and secure:**
+>
+> ✅ **Local Storage Only** - All medication data is stored locally on your device  
+> ✅ **No Cloud Sync** - Your information never leaves your device  
+> ✅ **No Third Parties** - We don't share data with anyone  
+> ✅ **You Control It** - Delete your data anytime by removing the data files  
+> ✅ **Encrypted Storage** - Files are stored securely on your system  
+
+---
+### 📖 Using This Tool
+
+> **This tool helps you:**
+> - Track medication and supplement schedules
+> - Log doses and monitor adherence
+> - Note side effects and patterns
+> - Get refill reminders
+> - Share adherence data with healthcare providers
+>
+> **This tool is NOT:**
+> - A replacement for medical advice
+> - A substitute for talking to your doctor
+> - Able to provide medical recommendations
+> - Connected to pharmacy systems
+
+---
+### ⚠️ Important Reminders
+
+> - Always consult your healthcare provider before starting, stopping, or changing medications
+> - Never share prescription medications with others
+> - Store medications safely and as directed
+> - Check expiration dates regularly
+> - Report severe side effects to your doctor immediately
+> - Keep a backup list of your medications in case of emergencies
+
+---
+### 💡 Tips for Better Adherence
+
+**Build Habits:**
+- Take meds at the same time daily
+- Link to daily routine (e.g., breakfast)
+- Use visual reminders (pill organizer)
+- Set phone alarms
+
+**Stay Organized:**
+- Keep meds in one place
+- Use a pill organizer
+- Keep a backup supply
+- Track refills in advance
+
+---
+### 📱 Recommended Apps & Resources
+
+- **Medisafe**: Medication reminder and tracker
+- **MyTherapy**: Pill reminder with health journal
+- **CareZone**: Medication management for families
+- **Drugs.com**: Drug information and interactions
+- **FDA MedWatch**: Report side effects
+"""
+
+
 def render_privacy_info():
     """Render privacy and security information."""
-    st.markdown("### 🔒 Privacy & Data Security")
-    
-    st.success("""
-    **Your health data is private and secure:**
-    
-    ✅ **Local Storage Only** - All medication data is stored locally on your device  
-    ✅ **No Cloud Sync** - Your information never leaves your device  
-    ✅ **No Third Parties** - We don't share data with anyone  
-    ✅ **You Control It** - Delete your data anytime by removing the data files  
-    ✅ **Encrypted Storage** - Files are stored securely on your system  
-    """)
-    
-    st.markdown("---")
-    st.markdown("### 📖 Using This Tool")
-    
-    st.info("""
-    **This tool helps you:**
-    - Track medication and supplement schedules
-    - Log doses and monitor adherence
-    - Note side effects and patterns
-    - Get refill reminders
-    - Share adherence data with healthcare providers
-    
-    **This tool is NOT:**
-    - A replacement for medical advice
-    - A substitute for talking to your doctor
-    - Able to provide medical recommendations
-    - Connected to pharmacy systems
-    """)
-    
-    st.markdown("---")
-    st.markdown("### ⚠️ Important Reminders")
-    
-    st.warning("""
-    - Always consult your healthcare provider before starting, stopping, or changing medications
-    - Never share prescription medications with others
-    - Store medications safely and as directed
-    - Check expiration dates regularly
-    - Report severe side effects to your doctor immediately
-    - Keep a backup list of your medications in case of emergencies
-    """)
-    
-    st.markdown("---")
-    st.markdown("### 💡 Tips for Better Adherence")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        **Build Habits:**
-        - Take meds at the same time daily
-        - Link to daily routine (e.g., breakfast)
-        - Use visual reminders (pill organizer)
-        - Set phone alarms
-        """)
-    
-    with col2:
-        st.markdown("""
-        **Stay Organized:**
-        - Keep meds in one place
-        - Use a pill organizer
-        - Keep a backup supply
-        - Track refills in advance
-        """)
-    
-    st.markdown("---")
-    st.markdown("### 📱 Recommended Apps & Resources")
-    
-    st.markdown("""
-    - **Medisafe**: Medication reminder and tracker
-    - **MyTherapy**: Pill reminder with health journal
-    - **CareZone**: Medication management for families
-    - **Drugs.com**: Drug information and interactions
-    - **FDA MedWatch**: Report side effects
-    """)
+    st.markdown(_PRIVACY_INFO_MARKDOWN)
 
 
 def render_medication_reminder():
@@ -689,10 +1141,17 @@ def render_medication_reminder():
     
     # Initialize state
     initialize_medication_state()
+    get_medications_by_id()  # warm the id lookup once for this rerun
     
     # Privacy notice at top
     st.info("🔒 **Privacy Note:** All medication data is stored locally on your device and never shared.")
     
+    with grouped_writes():
+        _render_tabs()
+
+
+def _render_tabs():
+    """Render the tab layout; saves triggered inside are flushed by the caller."""
     # Tab navigation
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
         "💊 My Medications",
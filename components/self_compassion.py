@@ -6,10 +6,23 @@ and journaling with educational content about the three components of self-compa
 """
 
 import streamlit as st
+from collections import Counter
 from datetime import datetime, date
+from concurrent.futures import Future
+import heapq
 import json
 import os
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List
+
+from core.async_writer import AsyncWriter, pop_failed_writes
+
+# Optional fast JSON codec; falls back to the standard library
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Self-compassion framework components
 SELF_COMPASSION_COMPONENTS = {
@@ -87,6 +100,22 @@ COMPASSION_BREAK_PHRASES = {
     ]
 }
 
+# Radio options for each step of the break, including the free-text choice
+MINDFULNESS_OPTIONS = tuple(COMPASSION_BREAK_PHRASES["Mindfulness"]) + ("Custom...",)
+HUMANITY_OPTIONS = tuple(COMPASSION_BREAK_PHRASES["Common Humanity"]) + ("Custom...",)
+KINDNESS_OPTIONS = tuple(COMPASSION_BREAK_PHRASES["Self-Kindness"]) + ("Custom...",)
+
+# Feelings offered in the journal
+JOURNAL_FEELINGS = (
+    "Peaceful", "Calm", "Hopeful", "Grateful", "Sad",
+    "Anxious", "Frustrated", "Tired", "Confused", "Overwhelmed"
+)
+
+# Storage locations (append-only JSONL)
+JOURNAL_PATH = "data/compassion_journal.jsonl"
+LETTERS_PATH = "data/compassion_letters.jsonl"
+PRACTICES_PATH = "data/compassion_practices.jsonl"
+
 # Self-criticism vs self-compassion comparison prompts
 COMPARISON_PROMPTS = [
     {
@@ -115,84 +144,219 @@ COMPARISON_PROMPTS = [
 def initialize_compassion_state():
     """Initialize session state for self-compassion tool."""
     if "compassion_journal" not in st.session_state:
-        st.session_state.compassion_journal = load_compassion_journal()
+        st.session_state.compassion_journal = _load(JOURNAL_PATH)
     if "compassion_letters" not in st.session_state:
-        st.session_state.compassion_letters = load_compassion_letters()
+        st.session_state.compassion_letters = _load(LETTERS_PATH)
     if "compassion_practices" not in st.session_state:
-        st.session_state.compassion_practices = load_compassion_practices()
-    if "daily_prompt_index" not in st.session_state:
-        st.session_state.daily_prompt_index = datetime.now().day % len(DAILY_PROMPTS)
+        st.session_state.compassion_practices = _load(PRACTICES_PATH)
+    # Pick the prompt once per calendar day; "next prompt" clicks persist until the day changes
+    today = date.today().toordinal()
+    if st.session_state.get("_prompt_day") != today:
+        st.session_state.daily_prompt_index = today % len(DAILY_PROMPTS)
+        st.session_state._prompt_day = today
+
+
+def _dumps(obj) -> bytes:
+    """Serialize obj to compact JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
 
+def _loads(raw: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
-def load_compassion_journal() -> List[Dict]:
-    """Load self-compassion journal entries."""
+
+def _read_jsonl(path: str) -> List[Dict]:
+    """Read one record per non-empty line of a JSONL file ([] if it is missing)."""
     try:
-        if os.path.exists("data/compassion_journal.json"):
-            with open("data/compassion_journal.json", "r") as f:
-                return json.load(f)
-    except Exception as e:
-        st.warning(f"Could not load journal: {e}")
-    return []
+        with open(path, "rb") as f:
+            return [_loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
 
 
-def save_compassion_journal(journal: List[Dict]) -> bool:
-    """Save self-compassion journal entries."""
+def _migrate_legacy_json(path: str) -> None:
+    """Convert an older ``.json`` array next to ``path`` into JSONL, once; the old file is left in place."""
+    if os.path.exists(path):
+        return
+    legacy_path = path[:-1]  # "foo.jsonl" -> "foo.json"
     try:
-        os.makedirs("data", exist_ok=True)
-        with open("data/compassion_journal.json", "w") as f:
-            json.dump(journal, f, indent=2)
-        return True
-    except Exception as e:
-        st.error(f"Could not save journal: {e}")
-        return False
+        with open(legacy_path, "rb") as f:
+            records = _loads(f.read())
+    except FileNotFoundError:
+        return
+    try:
+        # "x" mode fails if the JSONL file already exists, so it is never overwritten
+        with open(path, "xb") as f:
+            f.writelines(_dumps(record) + b"\n" for record in records)
+    except FileExistsError:
+        return
 
 
-def load_compassion_letters() -> List[Dict]:
-    """Load compassionate letters."""
+def _file_mtime(path: str) -> float:
+    """Return the file's modification time, or 0.0 if it does not exist."""
     try:
-        if os.path.exists("data/compassion_letters.json"):
-            with open("data/compassion_letters.json", "r") as f:
-                return json.load(f)
-    except Exception as e:
-        st.warning(f"Could not load letters: {e}")
-    return []
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+
+@st.cache_data(show_spinner=False, max_entries=3)
+def _cached_read_jsonl(path: str, mtime: float, size: int) -> List[Dict]:
+    """Parse a JSONL file once per (mtime, size); appends change both and invalidate."""
+    if not size:
+        return []
+    return _read_jsonl(path)
+
+
+_writer = AsyncWriter("compassion-writer")
 
+# Number of most recent entries kept in each "*_tail.json" summary file
+TAIL_SIZE = 20
 
-def save_compassion_letters(letters: List[Dict]) -> bool:
-    """Save compassionate letters."""
+# Per-file tail summaries shared by all sessions in this process
+_tails: Dict[str, Dict] = {}
+_tails_lock = threading.RLock()
+
+
+def _tail_path(path: str) -> str:
+    """"data/foo.jsonl" -> "data/foo_tail.json"."""
+    return path[:-len(".jsonl")] + "_tail.json"
+
+
+def _file_size(path: str) -> int:
+    """Return the file size in bytes, or 0 if it does not exist."""
     try:
-        os.makedirs("data", exist_ok=True)
-        with open("data/compassion_letters.json", "w") as f:
-            json.dump(letters, f, indent=2)
-        return True
-    except Exception as e:
-        st.error(f"Could not save letters: {e}")
-        return False
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _build_tail(records: List[Dict], size: int) -> Dict:
+    """Summarize a full history: counts plus the newest TAIL_SIZE records."""
+    return {
+        "size": size,
+        "total": len(records),
+        "type_counts": dict(Counter(r.get("type", "") for r in records)),
+        "entries": records[-TAIL_SIZE:]
+    }
 
 
-def load_compassion_practices() -> List[Dict]:
-    """Load practice records."""
+def _get_tail(path: str) -> Dict:
+    """Return the tail summary for a JSONL file.
+
+    The summary is read from its tail file; it is rebuilt from the full
+    history only when missing or when the JSONL size no longer matches.
+    """
+    with _tails_lock:
+        tail = _tails.get(path)
+        if tail is None:
+            _migrate_legacy_json(path)
+            size = _file_size(path)
+            try:
+                with open(_tail_path(path), "rb") as f:
+                    tail = _loads(f.read())
+            except (OSError, ValueError):
+                tail = None
+            if tail is None or tail.get("size") != size:
+                tail = _build_tail(_read_jsonl(path) if size else [], size)
+                _writer.submit(_tail_path(path), _dumps(tail), append=False)
+            _tails[path] = tail
+        return tail
+
+
+def _append_jsonl(path: str, entry: Dict) -> Future:
+    """Queue a record for appending and refresh the file's tail summary.
+
+    Returns the Future of the record's write.
+    """
+    payload = _dumps(entry) + b"\n"
+    with _tails_lock:
+        tail = _get_tail(path)
+        tail["entries"] = (tail["entries"] + [dict(entry)])[-TAIL_SIZE:]
+        tail["total"] += 1
+        entry_type = entry.get("type", "")
+        tail["type_counts"][entry_type] = tail["type_counts"].get(entry_type, 0) + 1
+        tail["size"] += len(payload)
+        future = _writer.submit(path, payload)
+        _writer.submit(_tail_path(path), _dumps(tail), append=False)
+    return future
+
+
+def get_entry_counts(path: str) -> tuple:
+    """Return (total entries, Counter of entry types) for a JSONL file without reading it."""
+    tail = _get_tail(path)
+    return tail["total"], Counter(tail["type_counts"])
+
+
+def _load(path: str) -> List[Dict]:
+    """Load the most recent entries of a history file."""
     try:
-        if os.path.exists("data/compassion_practices.json"):
-            with open("data/compassion_practices.json", "r") as f:
-                return json.load(f)
+        return [dict(entry) for entry in _get_tail(path)["entries"]]
     except Exception as e:
-        st.warning(f"Could not load practices: {e}")
+        st.warning(f"Could not load {os.path.basename(path)}: {e}")
     return []
 
 
-def save_compassion_practices(practices: List[Dict]) -> bool:
-    """Save practice records."""
+def load_full_compassion_journal() -> List[Dict]:
+    """Load every self-compassion journal entry (full scan, use sparingly)."""
+    _migrate_legacy_json(JOURNAL_PATH)
+    _writer.flush()
+    return _cached_read_jsonl(JOURNAL_PATH, _file_mtime(JOURNAL_PATH), _file_size(JOURNAL_PATH))
+
+
+def _save_append(path: str, entry: Dict) -> bool:
+    """Append one entry to a history file."""
     try:
-        os.makedirs("data", exist_ok=True)
-        with open("data/compassion_practices.json", "w") as f:
-            json.dump(practices, f, indent=2)
+        future = _append_jsonl(path, entry)
+        st.session_state.setdefault("_compassion_pending_writes", []).append((path, future))
         return True
     except Exception as e:
-        st.error(f"Could not save practices: {e}")
+        st.error(f"Could not save {os.path.basename(path)}: {e}")
         return False
 
 
+def _report_failed_writes() -> None:
+    """Show an error for every queued save of this session that failed to reach disk."""
+    pending = st.session_state.get("_compassion_pending_writes")
+    if pending:
+        for path, e in pop_failed_writes(pending):
+            st.error(f"Could not save {os.path.basename(path)}: {e}")
+
+
+def _display_date(entry: Dict) -> str:
+    """"Month DD, YYYY" for an entry.
+
+    Uses the date_str stored at save time; older entries are parsed once and
+    the result is cached on the in-memory entry as _date_str.
+    """
+    date_str = entry.get('date_str') or entry.get('_date_str')
+    if not date_str:
+        date_str = datetime.fromisoformat(entry['date']).strftime("%B %d, %Y")
+        entry['_date_str'] = date_str
+    return date_str
+
+
+def _display_datetime(entry: Dict) -> str:
+    """"Month DD, YYYY at HH:MM AM" for a practice, cached like _display_date."""
+    if entry.get('date_str') and entry.get('time_str'):
+        return f"{entry['date_str']} at {entry['time_str']}"
+    if not entry.get('_datetime_str'):
+        entry['_datetime_str'] = datetime.fromisoformat(entry['timestamp']).strftime("%B %d, %Y at %I:%M %p")
+    return entry['_datetime_str']
+
+
+def _phrase_picker(options: tuple, key: str, custom_label: str, placeholder: str) -> str:
+    """Radio of preset phrases; "Custom..." reveals a text input whose value wins if filled."""
+    selected = st.radio("Choose a phrase or write your own:", options=options, key=f"{key}_phrase")
+    if selected == "Custom...":
+        custom = st.text_input(custom_label, placeholder=placeholder, key=f"custom_{key}")
+        return custom or selected
+    return selected
+
+
 def render_compassion_break():
     """Render self-compassion break exercise."""
     st.markdown("### 🫂 Self-Compassion Break")
@@ -209,59 +373,29 @@ def render_compassion_break():
     
     col1, col2 = st.columns([0.7, 0.3])
     with col1:
-        selected_mindfulness = st.radio(
-            "Choose a phrase or write your own:",
-            options=COMPASSION_BREAK_PHRASES["Mindfulness"] + ["Custom..."],
-            key="mindfulness_phrase"
-        )
-    
-    if selected_mindfulness == "Custom...":
-        custom_mindfulness = st.text_input(
-            "Your mindfulness statement:",
-            placeholder="Describe what you're experiencing...",
-            key="custom_mindfulness"
+        selected_mindfulness = _phrase_picker(
+            MINDFULNESS_OPTIONS, "mindfulness",
+            "Your mindfulness statement:", "Describe what you're experiencing..."
         )
-        if custom_mindfulness:
-            selected_mindfulness = custom_mindfulness
     
     # Step 2: Common Humanity
     st.markdown("**Step 2: Common Humanity** 🌍")
     st.caption("Remember that you're not alone in this struggle")
     
-    selected_humanity = st.radio(
-        "Choose a phrase or write your own:",
-        options=COMPASSION_BREAK_PHRASES["Common Humanity"] + ["Custom..."],
-        key="humanity_phrase"
+    selected_humanity = _phrase_picker(
+        HUMANITY_OPTIONS, "humanity",
+        "Your common humanity statement:", "Connect your experience to others..."
     )
     
-    if selected_humanity == "Custom...":
-        custom_humanity = st.text_input(
-            "Your common humanity statement:",
-            placeholder="Connect your experience to others...",
-            key="custom_humanity"
-        )
-        if custom_humanity:
-            selected_humanity = custom_humanity
-    
     # Step 3: Self-Kindness
     st.markdown("**Step 3: Self-Kindness** 💝")
     st.caption("Offer yourself kindness and care")
     
-    selected_kindness = st.radio(
-        "Choose a phrase or write your own:",
-        options=COMPASSION_BREAK_PHRASES["Self-Kindness"] + ["Custom..."],
-        key="kindness_phrase"
+    selected_kindness = _phrase_picker(
+        KINDNESS_OPTIONS, "kindness",
+        "Your self-kindness statement:", "What kindness do you need right now?"
     )
     
-    if selected_kindness == "Custom...":
-        custom_kindness = st.text_input(
-            "Your self-kindness statement:",
-            placeholder="What kindness do you need right now?",
-            key="custom_kindness"
-        )
-        if custom_kindness:
-            selected_kindness = custom_kindness
-    
     # Practice together
     st.markdown("---")
     st.markdown("### 🎯 Your Self-Compassion Break")
@@ -288,16 +422,20 @@ def render_compassion_break():
         
         # Optional: Save practice
         if st.button("💾 Save This Practice"):
+            now = datetime.now()
+            now_iso = now.isoformat()
             practice_entry = {
                 "type": "Self-Compassion Break",
-                "date": datetime.now().isoformat(),
+                "date": now_iso,
                 "mindfulness": selected_mindfulness,
                 "common_humanity": selected_humanity,
                 "self_kindness": selected_kindness,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso,
+                "date_str": now.strftime("%B %d, %Y"),
+                "time_str": now.strftime("%I:%M %p")
             }
             st.session_state.compassion_practices.append(practice_entry)
-            if save_compassion_practices(st.session_state.compassion_practices):
+            if _save_append(PRACTICES_PATH, practice_entry):
                 st.success("✅ Practice saved!")
                 st.balloons()
 
@@ -362,14 +500,17 @@ def render_compassionate_letter():
             preview_letter = st.form_submit_button("👁️ Preview Letter", use_container_width=True)
         
         if save_letter and letter_content:
+            now = datetime.now()
+            now_iso = now.isoformat()
             letter_entry = {
                 "struggle": struggle,
                 "letter": letter_content,
-                "date": datetime.now().isoformat(),
-                "timestamp": datetime.now().isoformat()
+                "date": now_iso,
+                "timestamp": now_iso,
+                "date_str": now.strftime("%B %d, %Y")
             }
             st.session_state.compassion_letters.append(letter_entry)
-            if save_compassion_letters(st.session_state.compassion_letters):
+            if _save_append(LETTERS_PATH, letter_entry):
                 st.success("✅ Your compassionate letter has been saved!")
                 st.balloons()
         
@@ -391,7 +532,7 @@ def render_compassionate_letter():
         st.markdown("### 📚 Your Compassionate Letters")
         
         for i, letter in enumerate(reversed(st.session_state.compassion_letters[-5:])):
-            date_str = datetime.fromisoformat(letter['date']).strftime("%B %d, %Y")
+            date_str = _display_date(letter)
             with st.expander(f"💌 Letter from {date_str}"):
                 if letter.get('struggle'):
                     st.markdown(f"**Struggling with:** {letter['struggle']}")
@@ -457,16 +598,20 @@ def render_criticism_comparison():
         submitted = st.form_submit_button("💾 Save Comparison", use_container_width=True)
         
         if submitted and situation and self_critical and self_compassionate:
+            now = datetime.now()
+            now_iso = now.isoformat()
             comparison_entry = {
                 "type": "Criticism Comparison",
                 "situation": situation,
                 "self_critical": self_critical,
                 "self_compassionate": self_compassionate,
-                "date": datetime.now().isoformat(),
-                "timestamp": datetime.now().isoformat()
+                "date": now_iso,
+                "timestamp": now_iso,
+                "date_str": now.strftime("%B %d, %Y"),
+                "time_str": now.strftime("%I:%M %p")
             }
             st.session_state.compassion_practices.append(comparison_entry)
-            if save_compassion_practices(st.session_state.compassion_practices):
+            if _save_append(PRACTICES_PATH, comparison_entry):
                 st.success("✅ Comparison saved! Notice how different these responses feel.")
                 st.balloons()
 
@@ -504,10 +649,7 @@ def render_compassion_journal():
         # Mood/feeling selector
         feelings = st.multiselect(
             "How are you feeling?",
-            options=[
-                "Peaceful", "Calm", "Hopeful", "Grateful", "Sad",
-                "Anxious", "Frustrated", "Tired", "Confused", "Overwhelmed"
-            ],
+            options=JOURNAL_FEELINGS,
             key="journal_feelings"
         )
         
@@ -519,10 +661,11 @@ def render_compassion_journal():
                 "prompt": prompt,
                 "entry": journal_entry,
                 "feelings": feelings,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now().isoformat(),
+                "date_str": entry_date.strftime("%B %d, %Y")
             }
             st.session_state.compassion_journal.append(journal_item)
-            if save_compassion_journal(st.session_state.compassion_journal):
+            if _save_append(JOURNAL_PATH, journal_item):
                 st.success("✅ Journal entry saved!")
                 st.balloons()
     
@@ -531,14 +674,15 @@ def render_compassion_journal():
         st.markdown("---")
         st.markdown("### 📖 Recent Journal Entries")
         
-        recent_entries = sorted(
-            st.session_state.compassion_journal,
-            key=lambda x: x.get('date', ''),
-            reverse=True
-        )[:10]
+        # Entries can be back-dated, so the newest by date may predate the tail
+        recent_entries = heapq.nlargest(
+            10,
+            load_full_compassion_journal(),
+            key=lambda x: x.get('date', '')
+        )
         
         for entry in recent_entries:
-            date_str = datetime.fromisoformat(entry['date']).strftime("%B %d, %Y")
+            date_str = _display_date(entry)
             with st.expander(f"📝 {date_str} - {entry.get('prompt', 'No prompt')[:50]}..."):
                 st.markdown(f"**Prompt:** {entry.get('prompt')}")
                 if entry.get('feelings'):
@@ -547,108 +691,112 @@ def render_compassion_journal():
                 st.markdown(entry.get('entry', 'No entry'))
 
 
+@st.cache_data(show_spinner=False)
+def _education_html() -> str:
+    """Build the static Learn tab once; expanders become <details> blocks."""
+    components_html = "".join(
+        f"""
+<details>
+<summary>{data['icon']} {component}</summary>
+
+**Definition:**
+
+> {data['description']}
+
+**Practices:**
+
+{"".join(f"- {practice}{chr(10)}" for practice in data['practices'])}
+</details>
+"""
+        for component, data in SELF_COMPASSION_COMPONENTS.items()
+    )
+    
+    return f"""
+### 📚 Understanding Self-Compassion
+
+> **Self-compassion** is treating yourself with the same kindness, care, and understanding 
+> you would offer to a good friend who is struggling. It's been shown to reduce anxiety and 
+> depression while increasing resilience and well-being.
+
+---
+### 🧩 The Three Components of Self-Compassion
+<small>Based on Dr. Kristin Neff's research</small>
+{components_html}
+---
+### 🔬 The Science of Self-Compassion
+
+**Benefits of Self-Compassion:**
+
+> • Reduced anxiety and depression  
+> • Increased emotional resilience  
+> • Greater life satisfaction  
+> • Better stress management  
+> • Improved relationships  
+> • Enhanced motivation  
+> • Reduced rumination  
+> • Better coping with failure
+
+**Common Myths:**
+
+> **Myth:** Self-compassion is self-pity  
+> **Reality:** It's acknowledging struggle without exaggeration
+>
+> **Myth:** It makes you weak or lazy  
+> **Reality:** It increases motivation and resilience
+>
+> **Myth:** It's selfish  
+> **Reality:** It helps you care for others better
+>
+> **Myth:** Self-criticism motivates change  
+> **Reality:** Self-compassion is more effective
+
+---
+### 💡 Tips for Cultivating Self-Compassion
+
+**Daily Practices:**
+1. **Notice self-criticism** - Become aware of your inner critic
+2. **Pause and acknowledge** - "This is a moment of suffering"
+3. **Remember common humanity** - "Others feel this way too"
+4. **Offer kindness** - Speak to yourself as you would a friend
+5. **Practice regularly** - Use the exercises in this tool daily
+
+**When You're Struggling:**
+- Place hand over heart (physical gesture of kindness)
+- Take three deep breaths
+- Use the Self-Compassion Break
+- Write in your compassion journal
+- Read a compassionate letter you wrote yourself
+
+**Building the Habit:**
+- Start with small moments
+- Practice when things are going well
+- Be patient with yourself (yes, even here!)
+- Track your progress
+- Celebrate small wins
+
+---
+### 📱 Additional Resources
+
+**Books:**
+- "Self-Compassion" by Dr. Kristin Neff
+- "The Mindful Self-Compassion Workbook" by Neff & Germer
+- "Radical Compassion" by Tara Brach
+
+**Websites:**
+- [self-compassion.org](https://self-compassion.org) - Dr. Kristin Neff's website
+- Free guided meditations and exercises
+- Self-compassion tests and resources
+
+**Research:**
+- Over 1000 scientific studies support self-compassion
+- Shown to be more sustainable than self-esteem
+- Effective across cultures and populations
+"""
+
+
 def render_education():
     """Render educational content about self-compassion."""
-    st.markdown("### 📚 Understanding Self-Compassion")
-    
-    st.info("""
-    **Self-compassion** is treating yourself with the same kindness, care, and understanding 
-    you would offer to a good friend who is struggling. It's been shown to reduce anxiety and 
-    depression while increasing resilience and well-being.
-    """)
-    
-    st.markdown("---")
-    st.markdown("### 🧩 The Three Components of Self-Compassion")
-    st.caption("Based on Dr. Kristin Neff's research")
-    
-    for component, data in SELF_COMPASSION_COMPONENTS.items():
-        with st.expander(f"{data['icon']} {component}", expanded=False):
-            st.markdown(f"**Definition:**")
-            st.info(data['description'])
-            
-            st.markdown(f"**Practices:**")
-            for practice in data['practices']:
-                st.markdown(f"• {practice}")
-    
-    st.markdown("---")
-    st.markdown("### 🔬 The Science of Self-Compassion")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("**Benefits of Self-Compassion:**")
-        st.success("""
-        • Reduced anxiety and depression
-        • Increased emotional resilience
-        • Greater life satisfaction
-        • Better stress management
-        • Improved relationships
-        • Enhanced motivation
-        • Reduced rumination
-        • Better coping with failure
-        """)
-    
-    with col2:
-        st.markdown("**Common Myths:**")
-        st.warning("""
-        **Myth:** Self-compassion is self-pity
-        **Reality:** It's acknowledging struggle without exaggeration
-        
-        **Myth:** It makes you weak or lazy
-        **Reality:** It increases motivation and resilience
-        
-        **Myth:** It's selfish
-        **Reality:** It helps you care for others better
-        
-        **Myth:** Self-criticism motivates change
-        **Reality:** Self-compassion is more effective
-        """)
-    
-    st.markdown("---")
-    st.markdown("### 💡 Tips for Cultivating Self-Compassion")
-    
-    st.markdown("""
-    **Daily Practices:**
-    1. **Notice self-criticism** - Become aware of your inner critic
-    2. **Pause and acknowledge** - "This is a moment of suffering"
-    3. **Remember common humanity** - "Others feel this way too"
-    4. **Offer kindness** - Speak to yourself as you would a friend
-    5. **Practice regularly** - Use the exercises in this tool daily
-    
-    **When You're Struggling:**
-    - Place hand over heart (physical gesture of kindness)
-    - Take three deep breaths
-    - Use the Self-Compassion Break
-    - Write in your compassion journal
-    - Read a compassionate letter you wrote yourself
-    
-    **Building the Habit:**
-    - Start with small moments
-    - Practice when things are going well
-    - Be patient with yourself (yes, even here!)
-    - Track your progress
-    - Celebrate small wins
-    """)
-    
-    st.markdown("---")
-    st.markdown("### 📱 Additional Resources")
-    
-    st.markdown("""
-    **Books:**
-    - "Self-Compassion" by Dr. Kristin Neff
-    - "The Mindful Self-Compassion Workbook" by Neff & Germer
-    - "Radical Compassion" by Tara Brach
-    
-    **Websites:**
-    - [self-compassion.org](https://self-compassion.org) - Dr. Kristin Neff's website
-    - Free guided meditations and exercises
-    - Self-compassion tests and resources
-    
-    **Research:**
-    - Over 1000 scientific studies support self-compassion
-    - Shown to be more sustainable than self-esteem
-    - Effective across cultures and populations
-    """)
+    st.markdown(_education_html(), unsafe_allow_html=True)
 
 
 def render_progress_tracker():
@@ -660,9 +808,11 @@ def render_progress_tracker():
         return
     
     # Statistics
-    total_practices = len(st.session_state.compassion_practices)
-    breaks = sum(1 for p in st.session_state.compassion_practices if p.get('type') == 'Self-Compassion Break')
-    comparisons = sum(1 for p in st.session_state.compassion_practices if p.get('type') == 'Criticism Comparison')
+    # Totals come from the tail summaries, so the full history is never read here
+    total_practices, type_counts = get_entry_counts(PRACTICES_PATH)
+    total_journal, _ = get_entry_counts(JOURNAL_PATH)
+    breaks = type_counts.get('Self-Compassion Break', 0)
+    comparisons = type_counts.get('Criticism Comparison', 0)
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -673,20 +823,20 @@ def render_progress_tracker():
     with col3:
         st.metric("Comparisons", comparisons)
     with col4:
-        st.metric("Journal Entries", len(st.session_state.compassion_journal))
+        st.metric("Journal Entries", total_journal)
     
     # Recent activity
     st.markdown("---")
     st.markdown("### 🕐 Recent Practice Activity")
     
-    recent_practices = sorted(
+    recent_practices = heapq.nlargest(
+        10,
         st.session_state.compassion_practices,
-        key=lambda x: x.get('timestamp', ''),
-        reverse=True
-    )[:10]
+        key=lambda x: x.get('timestamp', '')
+    )
     
     for practice in recent_practices:
-        date_str = datetime.fromisoformat(practice['timestamp']).strftime("%B %d, %Y at %I:%M %p")
+        date_str = _display_datetime(practice)
         practice_type = practice.get('type', 'Unknown')
         
         with st.expander(f"✨ {practice_type} - {date_str}"):
@@ -700,12 +850,54 @@ def render_progress_tracker():
                 st.markdown(f"**✅ Self-Compassionate:** {practice.get('self_compassionate')}")
 
 
+# Views of the tool: label -> (intro text, render function)
+_VIEWS = {
+    "🫂 Compassion Break": (
+        """
+        A quick practice you can use anytime you're struggling. It takes just a few minutes 
+        and helps you respond to difficulty with kindness.
+        """,
+        render_compassion_break
+    ),
+    "💌 Write Letter": (
+        """
+        Write a compassionate letter to yourself as if you were writing to a dear friend. 
+        This powerful exercise can shift how you relate to yourself.
+        """,
+        render_compassionate_letter
+    ),
+    "⚖️ Criticism vs Compassion": (
+        """
+        Compare self-critical and self-compassionate responses to difficult situations. 
+        Learn to recognize and replace harsh self-talk with kindness.
+        """,
+        render_criticism_comparison
+    ),
+    "📓 Journal": (
+        """
+        Daily self-compassion journaling with prompts. Reflect on your experiences with 
+        kindness and track your emotional patterns.
+        """,
+        render_compassion_journal
+    ),
+    "📊 Progress": (
+        """
+        Track your self-compassion practice over time. See how consistent practice 
+        builds the habit of treating yourself with kindness.
+        """,
+        render_progress_tracker
+    ),
+    "📚 Learn": (None, render_education),
+}
+
+
 def render_self_compassion_tool():
     """Main render function for self-compassion practice tool."""
     st.header("🌱 Self-Compassion Practice Tool")
     
     # Initialize state
     initialize_compassion_state()
+    _report_failed_writes()
     
     # Introduction
     st.info("""
@@ -715,50 +907,15 @@ def render_self_compassion_tool():
     and increased resilience.
     """)
     
-    # Tab navigation
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-        "🫂 Compassion Break",
-        "💌 Write Letter",
-        "⚖️ Criticism vs Compassion",
-        "📓 Journal",
-        "📊 Progress",
-        "📚 Learn"
-    ])
-    
-    with tab1:
-        st.markdown("""
-        A quick practice you can use anytime you're struggling. It takes just a few minutes 
-        and helps you respond to difficulty with kindness.
-        """)
-        render_compassion_break()
-    
-    with tab2:
-        st.markdown("""
-        Write a compassionate letter to yourself as if you were writing to a dear friend. 
-        This powerful exercise can shift how you relate to yourself.
-        """)
-        render_compassionate_letter()
-    
-    with tab3:
-        st.markdown("""
-        Compare self-critical and self-compassionate responses to difficult situations. 
-        Learn to recognize and replace harsh self-talk with kindness.
-        """)
-        render_criticism_comparison()
-    
-    with tab4:
-        st.markdown("""
-        Daily self-compassion journaling with prompts. Reflect on your experiences with 
-        kindness and track your emotional patterns.
-        """)
-        render_compassion_journal()
-    
-    with tab5:
-        st.markdown("""
-        Track your self-compassion practice over time. See how consistent practice 
-        builds the habit of treating yourself with kindness.
-        """)
-        render_progress_tracker()
-    
-    with tab6:
-        render_education()
+    # View navigation: unlike st.tabs, only the selected view's body executes
+    view = st.radio(
+        "View",
+        options=list(_VIEWS),
+        horizontal=True,
+        label_visibility="collapsed",
+        key="compassion_active_view"
+    )
+    intro, render_view = _VIEWS[view]
+    if intro:
+        st.markdown(intro)
+    render_view()
@@ -370,9 +370,8 @@ def render_sidebar():
     with st.sidebar:
         # --- Water Intake Tracker Section ---
         with st.expander("💧 Water Intake Tracker", expanded=False):
-            from core.water_tracker import get_today_total, load_water_log
+            from core.water_tracker import get_today_total, get_last_n_days_totals
             import pandas as pd
-            import datetime
             total = get_today_total()
             st.markdown("""
                 <div style="display: flex; align-items: center; gap: 0.7em; margin-bottom: 0.5em;">
@@ -383,11 +382,7 @@ def render_sidebar():
             st.markdown(f"<div style='font-size:2.1em; font-weight:700; color:#0096c7; text-align:center; margin-bottom:0.2em;'>{total} <span style='font-size:0.5em;'>ml</span></div>", unsafe_allow_html=True)
             st.progress(min(total / 2000, 1.0), text=f"{total}/2000 ml (Goal)")
             # --- 7-day bar chart ---
-            data = load_water_log()
-            today = datetime.date.today()
-            days = [(today - datetime.timedelta(days=i)).isoformat() for i in range(6, -1, -1)]
-            chart_data = {d: sum(e['amount_ml'] for e in data.get(d, [])) for d in days}
-            df = pd.DataFrame({"Date": list(chart_data.keys()), "Water (ml)": list(chart_data.values())})
+            df = pd.DataFrame(get_last_n_days_totals(7), columns=["Date", "Water (ml)"])
             st.markdown("<div style='margin:0.5em 0 0.2em 0; font-size:0.98em; color:#555; text-align:center;'>Last 7 Days</div>", unsafe_allow_html=True)
             st.bar_chart(df.set_index("Date"), height=120, use_container_width=True)
             st.markdown("""
@@ -6,71 +6,91 @@ and educational content about sleep's impact on mental health.
 
 import streamlit as st
 from datetime import datetime, time, timedelta
+import heapq
 import json
+import numpy as np
 import os
-from typing import Dict, List, Optional
+import uuid
+from types import MappingProxyType
+from typing import Dict, List
 
-# Sleep hygiene best practices
-SLEEP_HYGIENE_TIPS = {
+from core.async_writer import AsyncWriter, pop_failed_writes
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Sleep hygiene best practices (frozen: read-only mappings and tuples shared by every session)
+SLEEP_HYGIENE_TIPS = MappingProxyType({category: MappingProxyType(data) for category, data in {
     "Environment": {
         "icon": "🛏️",
-        "tips": [
+        "tips": (
             "Keep bedroom temperature between 60-67°F (15-19°C)",
             "Use blackout curtains or eye mask for complete darkness",
             "Reduce noise or use white noise machine",
             "Invest in comfortable mattress and pillows",
             "Keep bedroom clean and clutter-free",
             "Use bedroom only for sleep and intimacy (not work/TV)"
-        ]
+        )
     },
     "Routine": {
         "icon": "📅",
-        "tips": [
+        "tips": (
             "Go to bed and wake up at the same time every day",
             "Allow 7-9 hours for sleep each night",
             "Create a relaxing pre-sleep routine (30-60 minutes)",
             "Avoid napping after 3 PM or limit to 20-30 minutes",
             "Get morning sunlight exposure within 30 minutes of waking",
             "Exercise regularly but not within 3 hours of bedtime"
-        ]
+        )
     },
     "Diet": {
         "icon": "☕",
-        "tips": [
+        "tips": (
             "Avoid caffeine 6-8 hours before bedtime",
             "Limit alcohol, especially close to bedtime",
             "Avoid large meals 2-3 hours before sleep",
             "Consider light snack if hungry (complex carbs + protein)",
             "Stay hydrated but reduce fluids 2 hours before bed",
             "Avoid nicotine, especially in the evening"
-        ]
+        )
     },
     "Technology": {
         "icon": "📱",
-        "tips": [
+        "tips": (
             "Avoid screens 1-2 hours before bedtime",
             "Use blue light filters on devices in evening",
             "Keep phone out of bedroom or in silent mode",
             "Charge devices outside the bedroom",
             "Use traditional alarm clock instead of phone",
             "Avoid stimulating content (news, work emails) before bed"
-        ]
+        )
     },
     "Mental": {
         "icon": "🧠",
-        "tips": [
+        "tips": (
             "Practice relaxation techniques (breathing, meditation)",
             "Write down worries/tasks before bed (worry journal)",
             "Use visualization or guided imagery",
             "Try progressive muscle relaxation",
             "If can't sleep after 20 minutes, get up and do relaxing activity",
             "Avoid clock-watching - remove visible clocks from bedroom"
-        ]
+        )
     }
-}
+}.items()})
+
+TOTAL_TIPS = sum(len(data["tips"]) for data in SLEEP_HYGIENE_TIPS.values())
+
+# (category, icon, [(checkbox key, tip), ...]) for the environment checklist
+CHECKLIST_ITEMS = tuple(
+    (category, data["icon"], tuple((f"check_{category}_{i}", tip) for i, tip in enumerate(data["tips"])))
+    for category, data in SLEEP_HYGIENE_TIPS.items()
+)
 
 # Wind-down activities
-WIND_DOWN_ACTIVITIES = [
+WIND_DOWN_ACTIVITIES = tuple(MappingProxyType(activity) for activity in (
     {"name": "Reading (physical book)", "duration": "20-30 min", "icon": "📚"},
     {"name": "Gentle stretching or yoga", "duration": "10-15 min", "icon": "🧘"},
     {"name": "Meditation or breathing exercises", "duration": "10-20 min", "icon": "🧘‍♀️"},
@@ -81,10 +101,13 @@ WIND_DOWN_ACTIVITIES = [
     {"name": "Herbal tea and relaxation", "duration": "15-20 min", "icon": "🍵"},
     {"name": "Gentle conversation with loved ones", "duration": "15-30 min", "icon": "💬"},
     {"name": "Aromatherapy (lavender, chamomile)", "duration": "Ongoing", "icon": "🌸"}
-]
+))
+
+ACTIVITY_LABELS = tuple(f"{a['icon']} {a['name']}" for a in WIND_DOWN_ACTIVITIES)
+ACTIVITY_BY_LABEL = dict(zip(ACTIVITY_LABELS, WIND_DOWN_ACTIVITIES))
 
 # Sleep quality factors
-SLEEP_QUALITY_FACTORS = [
+SLEEP_QUALITY_FACTORS = (
     "Difficulty falling asleep (>30 min)",
     "Woke up during night",
     "Woke up too early",
@@ -95,7 +118,7 @@ SLEEP_QUALITY_FACTORS = [
     "Physical discomfort or pain",
     "Noise disturbances",
     "Temperature issues (too hot/cold)"
-]
+)
 
 
 def initialize_sleep_state():
@@ -103,7 +126,11 @@ def initialize_sleep_state():
     if "sleep_tracker_data" not in st.session_state:
         st.session_state.sleep_tracker_data = load_sleep_data()
     if "bedtime_routine" not in st.session_state:
-        st.session_state.bedtime_routine = load_bedtime_routine()
+        # Keyed by a stable id so removing one activity never shifts the others
+        st.session_state.bedtime_routine = {
+            uuid.uuid4().hex: activity for activity in load_bedtime_routine()
+        }
+        st.session_state._routine_hash = hash(_dumps(list(st.session_state.bedtime_routine.values())))
     if "sleep_goals" not in st.session_state:
         st.session_state.sleep_goals = {
             "target_bedtime": time(22, 30),
@@ -112,46 +139,125 @@ def initialize_sleep_state():
         }
 
 
+SLEEP_DATA_FILE = "data/sleep_tracker.jsonl"
+LEGACY_SLEEP_DATA_FILE = "data/sleep_tracker.json"
+BEDTIME_ROUTINE_FILE = "data/bedtime_routine.json"
+
+# Saves are coalesced over a short tick and written off the request thread
+_writer = AsyncWriter("sleep-writer", tick_seconds=0.5)
+
+
+def _queue_write(path: str, payload: bytes, append: bool = False) -> None:
+    """Hand a serialized payload to the writer; its outcome is checked on a later rerun."""
+    future = _writer.submit(path, payload, append=append)
+    st.session_state.setdefault("_sleep_pending_writes", []).append((path, future))
+
+
+def _report_failed_writes() -> None:
+    """Show an error for every queued save of this session that failed to reach disk."""
+    pending = st.session_state.get("_sleep_pending_writes")
+    if pending:
+        for path, e in pop_failed_writes(pending):
+            st.error(f"Could not save {os.path.basename(path)}: {e}")
+            if path == BEDTIME_ROUTINE_FILE:
+                # Forget the saved-routine hash so the next save is not skipped as unchanged
+                st.session_state.pop("_routine_hash", None)
+
+
+def _file_mtime(path: str) -> float:
+    """Return the file's modification time, or 0.0 if it does not exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+
+def _dumps(obj) -> bytes:
+    """Serialize obj to compact JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+@st.cache_data(show_spinner=False)
+def _load_json(path: str, mtime: float) -> List[Dict]:
+    """Parse a JSON file once per modification time; saving bumps mtime and invalidates."""
+    if not mtime:
+        return []
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+@st.cache_data(show_spinner=False)
+def _load_jsonl(path: str, mtime: float) -> List[Dict]:
+    """Parse a JSONL file (one record per line) once per modification time."""
+    if not mtime:
+        return []
+    with open(path, "rb") as f:
+        return [_loads(line) for line in f if line.strip()]
+
+
+def _migrate_legacy_sleep_data() -> None:
+    """Convert the old sleep_tracker.json array into the JSONL log, once; the old file is left in place."""
+    if os.path.exists(SLEEP_DATA_FILE) or not os.path.exists(LEGACY_SLEEP_DATA_FILE):
+        return
+    with open(LEGACY_SLEEP_DATA_FILE, "rb") as f:
+        entries = _loads(f.read())
+    with open(SLEEP_DATA_FILE, "wb") as f:
+        f.writelines(_dumps(entry) + b"\n" for entry in entries)
+
+
 def load_sleep_data() -> List[Dict]:
     """Load sleep tracking data from file."""
     try:
-        if os.path.exists("data/sleep_tracker.json"):
-            with open("data/sleep_tracker.json", "r") as f:
-                return json.load(f)
+        _writer.flush()
+        _migrate_legacy_sleep_data()
+        return _load_jsonl(SLEEP_DATA_FILE, _file_mtime(SLEEP_DATA_FILE))
     except Exception as e:
         st.warning(f"Could not load sleep data: {e}")
     return []
 
 
-def save_sleep_data(data: List[Dict]) -> bool:
-    """Save sleep tracking data to file."""
+def append_sleep_entry(entry: Dict) -> bool:
+    """Append a single sleep entry to the log file."""
     try:
-        os.makedirs("data", exist_ok=True)
-        with open("data/sleep_tracker.json", "w") as f:
-            json.dump(data, f, indent=2)
+        _queue_write(SLEEP_DATA_FILE, _dumps(entry) + b"\n", append=True)
         return True
     except Exception as e:
         st.error(f"Could not save sleep data: {e}")
         return False
 
 
+def _same_entry(a: Dict, b: Dict) -> bool:
+    """True if two sleep entries differ only in their submission timestamp."""
+    return {k: v for k, v in a.items() if k != "timestamp"} == {k: v for k, v in b.items() if k != "timestamp"}
+
+
 def load_bedtime_routine() -> List[Dict]:
     """Load bedtime routine from file."""
     try:
-        if os.path.exists("data/bedtime_routine.json"):
-            with open("data/bedtime_routine.json", "r") as f:
-                return json.load(f)
+        _writer.flush()
+        return _load_json(BEDTIME_ROUTINE_FILE, _file_mtime(BEDTIME_ROUTINE_FILE))
     except Exception as e:
         st.warning(f"Could not load routine: {e}")
     return []
 
 
-def save_bedtime_routine(routine: List[Dict]) -> bool:
-    """Save bedtime routine to file."""
+def save_bedtime_routine(routine: Dict[str, Dict]) -> bool:
+    """Save bedtime routine (id -> activity, in order) to file as a list."""
     try:
-        os.makedirs("data", exist_ok=True)
-        with open("data/bedtime_routine.json", "w") as f:
-            json.dump(routine, f, indent=2)
+        payload = _dumps(list(routine.values()))
+        # Skip the write when the routine is unchanged since the last save/load
+        payload_hash = hash(payload)
+        if st.session_state.get("_routine_hash") == payload_hash:
+            return True
+        _queue_write(BEDTIME_ROUTINE_FILE, payload)
+        st.session_state._routine_hash = payload_hash
         return True
     except Exception as e:
         st.error(f"Could not save routine: {e}")
@@ -171,60 +277,111 @@ def calculate_sleep_duration(bedtime: time, wake_time: time) -> float:
     return duration_minutes / 60
 
 
+def subtract_minutes(t: time, minutes: int) -> time:
+    """Return the clock time ``minutes`` before ``t``, wrapping past midnight."""
+    total = (t.hour * 60 + t.minute - minutes) % (24 * 60)
+    return time(total // 60, total % 60)
+
+
 def calculate_caffeine_cutoff(bedtime: time, hours_before: int = 6) -> time:
     """Calculate when to stop caffeine intake."""
-    bed_datetime = datetime.combine(datetime.today(), bedtime)
-    cutoff_datetime = bed_datetime - timedelta(hours=hours_before)
-    return cutoff_datetime.time()
+    return subtract_minutes(bedtime, hours_before * 60)
+
+
+def _sleep_columns() -> Dict[str, np.ndarray]:
+    """Duration and quality columns of the session's sleep log.
+
+    Entries are only ever appended, so the arrays are extended with just
+    the entries added since the last call.
+    """
+    entries = st.session_state.sleep_tracker_data
+    columns = st.session_state.get("_sleep_columns")
+    if columns is None or len(columns["quality"]) > len(entries):
+        columns = {
+            "duration_hours": np.empty(0, dtype=np.float32),
+            "quality": np.empty(0, dtype=np.float32)
+        }
+    start = len(columns["quality"])
+    if start < len(entries):
+        new_entries = entries[start:]
+        for field in columns:
+            columns[field] = np.concatenate((
+                columns[field],
+                np.fromiter((e[field] for e in new_entries), dtype=np.float32, count=len(new_entries))
+            ))
+    st.session_state._sleep_columns = columns
+    return columns
+
+
+def get_sleep_stats() -> Dict:
+    """Average duration/quality and the mean quality of the last 7 entries."""
+    columns = _sleep_columns()
+    durations, qualities = columns["duration_hours"], columns["quality"]
+    count = len(qualities)
+    return {
+        "avg_duration": float(durations.mean()) if count else 0,
+        "avg_quality": float(qualities.mean()) if count else 0,
+        "recent_quality": float(qualities[-7:].mean()) if count else 0,
+        "count": count
+    }
+
+
+_EDU_INFO_MD = """
+**Sleep and mental health are deeply interconnected:**
+- Poor sleep increases risk of depression and anxiety
+- Mental health conditions often cause sleep problems
+- Quality sleep improves mood regulation and emotional resilience
+- Sleep deprivation impairs cognitive function and decision-making
+- Good sleep hygiene is a foundational pillar of mental wellness
+"""
+
+_EDU_DEPRIVATION_MD = """
+**😴 Sleep Deprivation Effects**
+- Increased irritability
+- Poor concentration
+- Memory problems
+- Weakened immune system
+- Higher stress levels
+- Impaired judgment
+"""
+
+_EDU_BENEFITS_MD = """
+**✨ Quality Sleep Benefits**
+- Better mood regulation
+- Enhanced memory
+- Improved focus
+- Stronger immunity
+- Reduced anxiety
+- Better physical health
+"""
+
+_EDU_RECOMMENDATIONS_MD = """
+**🎯 Sleep Recommendations**
+- Adults: 7-9 hours
+- Consistent schedule
+- Dark, cool, quiet room
+- Regular exercise
+- Stress management
+- Healthy diet
+"""
 
 
 def render_sleep_education():
     """Render educational content about sleep and mental health."""
     st.markdown("### 📚 Why Sleep Matters for Mental Health")
     
-    st.info("""
-    **Sleep and mental health are deeply interconnected:**
-    - Poor sleep increases risk of depression and anxiety
-    - Mental health conditions often cause sleep problems
-    - Quality sleep improves mood regulation and emotional resilience
-    - Sleep deprivation impairs cognitive function and decision-making
-    - Good sleep hygiene is a foundational pillar of mental wellness
-    """)
+    st.info(_EDU_INFO_MD)
     
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown("**😴 Sleep Deprivation Effects**")
-        st.markdown("""
-        - Increased irritability
-        - Poor concentration
-        - Memory problems
-        - Weakened immune system
-        - Higher stress levels
-        - Impaired judgment
-        """)
+        st.markdown(_EDU_DEPRIVATION_MD)
     
     with col2:
-        st.markdown("**✨ Quality Sleep Benefits**")
-        st.markdown("""
-        - Better mood regulation
-        - Enhanced memory
-        - Improved focus
-        - Stronger immunity
-        - Reduced anxiety
-        - Better physical health
-        """)
+        st.markdown(_EDU_BENEFITS_MD)
     
     with col3:
-        st.markdown("**🎯 Sleep Recommendations**")
-        st.markdown("""
-        - Adults: 7-9 hours
-        - Consistent schedule
-        - Dark, cool, quiet room
-        - Regular exercise
-        - Stress management
-        - Healthy diet
-        """)
+        st.markdown(_EDU_RECOMMENDATIONS_MD)
 
 
 def render_sleep_tracker():
@@ -232,14 +389,18 @@ def render_sleep_tracker():
     st.markdown("### 📊 Sleep Quality Tracker")
     st.caption("Log your sleep to identify patterns and track improvements.")
     
+    now = datetime.now()
+    today = now.date()
+    yesterday = today - timedelta(days=1)
+    
     with st.form("sleep_log_form"):
         col1, col2 = st.columns(2)
         
         with col1:
             log_date = st.date_input(
                 "Date:",
-                value=datetime.now().date() - timedelta(days=1),
-                max_value=datetime.now().date()
+                value=yesterday,
+                max_value=today
             )
             
             bedtime = st.time_input(
@@ -307,15 +468,19 @@ def render_sleep_tracker():
                 "times_woken": times_woken,
                 "factors": factors,
                 "notes": notes,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now.isoformat()
             }
             
-            st.session_state.sleep_tracker_data.append(entry)
-            if save_sleep_data(st.session_state.sleep_tracker_data):
-                st.success(f"✅ Sleep entry for {log_date} logged successfully!")
-                st.balloons()
+            data = st.session_state.sleep_tracker_data
+            if data and _same_entry(data[-1], entry):
+                st.info(f"Sleep entry for {log_date} is already logged.")
             else:
-                st.error("Failed to save sleep entry.")
+                data.append(entry)
+                if append_sleep_entry(entry):
+                    st.success(f"✅ Sleep entry for {log_date} logged successfully!")
+                    st.balloons()
+                else:
+                    st.error("Failed to save sleep entry.")
     
     # Display recent entries
     if st.session_state.sleep_tracker_data:
@@ -323,11 +488,11 @@ def render_sleep_tracker():
         st.markdown("### 📅 Recent Sleep Logs")
         
         # Show last 7 entries
-        recent_entries = sorted(
+        recent_entries = heapq.nlargest(
+            7,
             st.session_state.sleep_tracker_data,
-            key=lambda x: x.get('date', ''),
-            reverse=True
-        )[:7]
+            key=lambda x: x.get('date', '')
+        )
         
         for entry in recent_entries:
             with st.expander(
@@ -353,19 +518,40 @@ def render_sleep_tracker():
             st.markdown("---")
             st.markdown("### 📈 Sleep Statistics")
             
-            durations = [e['duration_hours'] for e in st.session_state.sleep_tracker_data]
-            qualities = [e['quality'] for e in st.session_state.sleep_tracker_data]
+            stats = get_sleep_stats()
             
             col1, col2, col3, col4 = st.columns(4)
             with col1:
-                st.metric("Average Duration", f"{sum(durations)/len(durations):.1f}h")
+                st.metric("Average Duration", f"{stats['avg_duration']:.1f}h")
             with col2:
-                st.metric("Average Quality", f"{sum(qualities)/len(qualities):.1f}/10")
+                st.metric("Average Quality", f"{stats['avg_quality']:.1f}/10")
             with col3:
-                st.metric("Total Entries", len(st.session_state.sleep_tracker_data))
+                st.metric("Total Entries", stats['count'])
             with col4:
-                recent_avg = sum(qualities[-7:])/min(7, len(qualities))
-                st.metric("Recent Quality (7d)", f"{recent_avg:.1f}/10")
+                st.metric("Recent Quality (7d)", f"{stats['recent_quality']:.1f}/10")
+
+
+# (heading, steps) for the "See Suggested Routines" expander
+_SUGGESTED_ROUTINES = (
+    ("**Relaxation-Focused Routine (60 min)**", (
+        "1. 🛁 Warm bath (20 min)",
+        "2. 🍵 Herbal tea (10 min)",
+        "3. 📚 Reading (20 min)",
+        "4. 🧘‍♀️ Meditation (10 min)",
+    )),
+    ("**Quick Wind-Down (30 min)**", (
+        "1. 🧹 Light tidying (10 min)",
+        "2. 🧘 Gentle stretching (10 min)",
+        "3. ✍️ Journaling (10 min)",
+    )),
+    ("**Sleep-Prep Routine (45 min)**", (
+        "1. 🎵 Calming music (15 min)",
+        "2. 🌸 Aromatherapy prep (5 min)",
+        "3. 📚 Reading (15 min)",
+        "4. 🧘‍♀️ Breathing exercises (10 min)",
+    )),
+)
+_SUGGESTED_ROUTINES_MD = tuple("\n".join((title,) + steps) for title, steps in _SUGGESTED_ROUTINES)
 
 
 def render_bedtime_routine_builder():
@@ -377,30 +563,37 @@ def render_bedtime_routine_builder():
     if st.session_state.bedtime_routine:
         st.markdown("#### Your Current Routine")
         total_duration = 0
-        for i, activity in enumerate(st.session_state.bedtime_routine):
+        for i, (activity_id, activity) in enumerate(st.session_state.bedtime_routine.items()):
             col1, col2, col3 = st.columns([0.6, 0.3, 0.1])
             with col1:
                 st.write(f"{i+1}. {activity['icon']} {activity['name']}")
             with col2:
                 st.write(f"⏱️ {activity['duration']}")
             with col3:
-                if st.button("❌", key=f"remove_{i}"):
-                    st.session_state.bedtime_routine.pop(i)
-                    save_bedtime_routine(st.session_state.bedtime_routine)
+                if st.button("❌", key=f"remove_{activity_id}"):
+                    del st.session_state.bedtime_routine[activity_id]
+                    st.session_state.routine_dirty = True
                     st.rerun()
         
         st.markdown("---")
     
+    # Edits stay in session state until the user saves them
+    if st.session_state.get("routine_dirty"):
+        st.caption("You have unsaved changes to your routine.")
+        if st.button("💾 Save Routine", use_container_width=True, type="primary"):
+            if save_bedtime_routine(st.session_state.bedtime_routine):
+                st.session_state.routine_dirty = False
+                st.success("✅ Routine saved!")
+    
     # Add new activity
     st.markdown("#### Add Activity to Routine")
     
     col1, col2 = st.columns([0.7, 0.3])
     
     with col1:
-        activity_options = [f"{a['icon']} {a['name']}" for a in WIND_DOWN_ACTIVITIES]
         selected_activity = st.selectbox(
             "Choose an activity:",
-            options=activity_options,
+            options=ACTIVITY_LABELS,
             key="activity_selector"
         )
     
@@ -412,38 +605,21 @@ def render_bedtime_routine_builder():
         )
     
     if st.button("➕ Add to Routine", use_container_width=True):
-        # Find the selected activity
-        for activity in WIND_DOWN_ACTIVITIES:
-            if f"{activity['icon']} {activity['name']}" == selected_activity:
-                new_activity = {
-                    "name": activity['name'],
-                    "icon": activity['icon'],
-                    "duration": custom_duration
-                }
-                st.session_state.bedtime_routine.append(new_activity)
-                if save_bedtime_routine(st.session_state.bedtime_routine):
-                    st.success(f"✅ Added {activity['name']} to your routine!")
-                    st.rerun()
-                break
+        activity = ACTIVITY_BY_LABEL[selected_activity]
+        new_activity = {
+            "name": activity['name'],
+            "icon": activity['icon'],
+            "duration": custom_duration
+        }
+        st.session_state.bedtime_routine[uuid.uuid4().hex] = new_activity
+        st.session_state.routine_dirty = True
+        st.success(f"✅ Added {activity['name']} to your routine!")
+        st.rerun()
     
     # Suggested routines
     with st.expander("💡 See Suggested Routines"):
-        st.markdown("**Relaxation-Focused Routine (60 min)**")
-        st.write("1. 🛁 Warm bath (20 min)")
-        st.write("2. 🍵 Herbal tea (10 min)")
-        st.write("3. 📚 Reading (20 min)")
-        st.write("4. 🧘‍♀️ Meditation (10 min)")
-        
-        st.markdown("**Quick Wind-Down (30 min)**")
-        st.write("1. 🧹 Light tidying (10 min)")
-        st.write("2. 🧘 Gentle stretching (10 min)")
-        st.write("3. ✍️ Journaling (10 min)")
-        
-        st.markdown("**Sleep-Prep Routine (45 min)**")
-        st.write("1. 🎵 Calming music (15 min)")
-        st.write("2. 🌸 Aromatherapy prep (5 min)")
-        st.write("3. 📚 Reading (15 min)")
-        st.write("4. 🧘‍♀️ Breathing exercises (10 min)")
+        for routine_md in _SUGGESTED_ROUTINES_MD:
+            st.markdown(routine_md)
 
 
 def render_sleep_environment_checklist():
@@ -451,23 +627,16 @@ def render_sleep_environment_checklist():
     st.markdown("### ✅ Sleep Environment Checklist")
     st.caption("Optimize your bedroom for better sleep quality.")
     
-    checklist_state_key = "sleep_environment_checklist"
-    if checklist_state_key not in st.session_state:
-        st.session_state[checklist_state_key] = {}
-    
-    for category, data in SLEEP_HYGIENE_TIPS.items():
-        with st.expander(f"{data['icon']} {category}", expanded=False):
-            for i, tip in enumerate(data['tips']):
-                key = f"{category}_{i}"
-                checked = st.session_state[checklist_state_key].get(key, False)
-                if st.checkbox(tip, value=checked, key=f"check_{key}"):
-                    st.session_state[checklist_state_key][key] = True
-                else:
-                    st.session_state[checklist_state_key][key] = False
+    # The checkbox widget state is the source of truth; count ticks as they render
+    checked_tips = 0
+    for category, icon, tips in CHECKLIST_ITEMS:
+        with st.expander(f"{icon} {category}", expanded=False):
+            for key, tip in tips:
+                if st.checkbox(tip, key=key):
+                    checked_tips += 1
     
     # Show progress
-    total_tips = sum(len(data['tips']) for data in SLEEP_HYGIENE_TIPS.values())
-    checked_tips = sum(1 for v in st.session_state[checklist_state_key].values() if v)
+    total_tips = TOTAL_TIPS
     progress = checked_tips / total_tips if total_tips > 0 else 0
     
     st.markdown("---")
@@ -485,6 +654,23 @@ def render_sleep_environment_checklist():
         st.error("🎯 There's room for improvement. Start with a few key changes!")
 
 
+_SCHEDULE_HABIT_MD = """
+**Building the Habit:**
+- Start gradually (15-30 min adjustments)
+- Be consistent, even on weekends
+- Use alarms for bedtime reminders
+- Prepare the night before
+"""
+
+_SCHEDULE_CANT_SLEEP_MD = """
+**If You Can't Sleep:**
+- Don't force it - get up after 20 min
+- Do a calm activity in dim light
+- Return to bed when sleepy
+- Avoid checking the time
+"""
+
+
 def render_sleep_schedule_planner():
     """Render sleep schedule planner."""
     st.markdown("### ⏰ Sleep Schedule Planner")
@@ -510,10 +696,7 @@ def render_sleep_schedule_planner():
     
     with col2:
         # Calculate recommended bedtime
-        wake_datetime = datetime.combine(datetime.today(), target_wake_time)
-        sleep_duration = timedelta(hours=target_hours)
-        bedtime_datetime = wake_datetime - sleep_duration
-        recommended_bedtime = bedtime_datetime.time()
+        recommended_bedtime = subtract_minutes(target_wake_time, round(target_hours * 60))
         
         st.markdown("#### 💤 Recommended Schedule")
         st.info(f"""
@@ -523,7 +706,7 @@ def render_sleep_schedule_planner():
         """)
         
         # Calculate wind-down and caffeine cutoff
-        wind_down_time = (bedtime_datetime - timedelta(minutes=30)).time()
+        wind_down_time = subtract_minutes(recommended_bedtime, 30)
         caffeine_cutoff = calculate_caffeine_cutoff(recommended_bedtime, 6)
         
         st.markdown("#### 🎯 Important Times")
@@ -545,22 +728,53 @@ def render_sleep_schedule_planner():
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        **Building the Habit:**
-        - Start gradually (15-30 min adjustments)
-        - Be consistent, even on weekends
-        - Use alarms for bedtime reminders
-        - Prepare the night before
-        """)
+        st.markdown(_SCHEDULE_HABIT_MD)
     
     with col2:
-        st.markdown("""
-        **If You Can't Sleep:**
-        - Don't force it - get up after 20 min
-        - Do a calm activity in dim light
-        - Return to bed when sleepy
-        - Avoid checking the time
-        """)
+        st.markdown(_SCHEDULE_CANT_SLEEP_MD)
+
+
+_TIPS_MORNING_MD = """
+- Wake up at the same time daily (even weekends)
+- Get sunlight exposure within 30 minutes
+- Eat a healthy breakfast
+- Exercise if possible (but not too close to bedtime)
+"""
+
+_TIPS_EVENING_MD = """
+- Dim lights 2-3 hours before bed
+- Avoid large meals 2-3 hours before sleep
+- Stop caffeine 6-8 hours before bedtime
+- Begin wind-down routine 30-60 minutes before bed
+- Keep bedroom cool (60-67°F / 15-19°C)
+"""
+
+_TIPS_AVOID_MD = """
+- Screens (blue light) before bed
+- Stimulating activities close to bedtime
+- Clock-watching if you can't sleep
+- Alcohol as a sleep aid (disrupts sleep quality)
+- Napping late in the day
+- Using bedroom for work or watching TV
+"""
+
+_TIPS_SEEK_HELP_MD = """
+Consider consulting a healthcare provider if you experience:
+- Persistent insomnia (>3 nights/week for >3 months)
+- Excessive daytime sleepiness despite adequate sleep
+- Loud snoring or breathing pauses during sleep
+- Unusual movements or behaviors during sleep
+- Extreme difficulty waking up or staying awake
+- Sleep problems significantly affecting daily life
+"""
+
+_TIPS_RESOURCES_MD = """
+- **Sleep Cycle**: Sleep tracking and smart alarm
+- **Calm**: Meditation and sleep stories
+- **Headspace**: Guided meditation for sleep
+- **Rain Rain**: Ambient sounds for sleep
+- **National Sleep Foundation**: sleepfoundation.org
+"""
 
 
 def render_sleep_hygiene_toolkit():
@@ -569,6 +783,7 @@ def render_sleep_hygiene_toolkit():
     
     # Initialize state
     initialize_sleep_state()
+    _report_failed_writes()
     
     # Tab navigation
     tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
@@ -615,49 +830,17 @@ def render_sleep_hygiene_toolkit():
         st.markdown("### 💡 Quick Sleep Hygiene Tips")
         
         st.markdown("#### 🌅 Morning Routine")
-        st.info("""
-        - Wake up at the same time daily (even weekends)
-        - Get sunlight exposure within 30 minutes
-        - Eat a healthy breakfast
-        - Exercise if possible (but not too close to bedtime)
-        """)
+        st.info(_TIPS_MORNING_MD)
         
         st.markdown("#### 🌆 Evening Routine")
-        st.info("""
-        - Dim lights 2-3 hours before bed
-        - Avoid large meals 2-3 hours before sleep
-        - Stop caffeine 6-8 hours before bedtime
-        - Begin wind-down routine 30-60 minutes before bed
-        - Keep bedroom cool (60-67°F / 15-19°C)
-        """)
+        st.info(_TIPS_EVENING_MD)
         
         st.markdown("#### 🚫 Things to Avoid")
-        st.warning("""
-        - Screens (blue light) before bed
-        - Stimulating activities close to bedtime
-        - Clock-watching if you can't sleep
-        - Alcohol as a sleep aid (disrupts sleep quality)
-        - Napping late in the day
-        - Using bedroom for work or watching TV
-        """)
+        st.warning(_TIPS_AVOID_MD)
         
         st.markdown("#### 🆘 When to Seek Help")
-        st.error("""
-        Consider consulting a healthcare provider if you experience:
-        - Persistent insomnia (>3 nights/week for >3 months)
-        - Excessive daytime sleepiness despite adequate sleep
-        - Loud snoring or breathing pauses during sleep
-        - Unusual movements or behaviors during sleep
-        - Extreme difficulty waking up or staying awake
-        - Sleep problems significantly affecting daily life
-        """)
+        st.error(_TIPS_SEEK_HELP_MD)
         
         st.markdown("---")
         st.markdown("#### 📱 Sleep Apps & Resources")
-        st.markdown("""
-        - **Sleep Cycle**: Sleep tracking and smart alarm
-        - **Calm**: Meditation and sleep stories
-        - **Headspace**: Guided meditation for sleep
-        - **Rain Rain**: Ambient sounds for sleep
-        - **National Sleep Foundation**: sleepfoundation.org
-        """)
+        st.markdown(_TIPS_RESOURCES_MD)
@@ -5,8 +5,18 @@ Helps users identify negative thought patterns and reframe them into more balanc
 
 import streamlit as st
 from datetime import datetime
+from dataclasses import dataclass, field, fields
+import functools
 import json
+import numpy as np
 import os
+from typing import Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Cognitive distortions with descriptions and examples
 COGNITIVE_DISTORTIONS = {
@@ -92,8 +102,28 @@ COGNITIVE_DISTORTIONS = {
     }
 }
 
+
+@functools.cache
+def _distortion_tables():
+    """Step 2 lookup tables, built the first time step 2 renders.
+
+    Returns ((name, info, expander label), ...), the option names and a
+    name -> label mapping.
+    """
+    items = tuple(
+        (name, info, f"{info['icon']} {name}") for name, info in COGNITIVE_DISTORTIONS.items()
+    )
+    return items, tuple(COGNITIVE_DISTORTIONS), {name: label for name, _, label in items}
+
+
+# Emotions offered in step 1
+_EMOTION_OPTIONS = (
+    "Anxious", "Sad", "Angry", "Frustrated", "Ashamed",
+    "Guilty", "Hopeless", "Overwhelmed", "Fearful", "Disappointed"
+)
+
 # Reframing questions to guide users
-REFRAMING_QUESTIONS = [
+REFRAMING_QUESTIONS = (
     "What evidence do I have that this thought is true?",
     "What evidence contradicts this thought?",
     "Am I confusing a thought with a fact?",
@@ -107,68 +137,245 @@ REFRAMING_QUESTIONS = [
     "Will this matter in a year? In five years?",
     "Am I being too hard on myself?",
     "What would be a more balanced way to think about this?"
-]
+)
+# Steps 3 and 4 each show half of the questions
+_REFRAMING_Q_FIRST = REFRAMING_QUESTIONS[:7]
+_REFRAMING_Q_REST = REFRAMING_QUESTIONS[7:]
+
+
+# Blank exercise; list fields are tuples so shallow copies never share mutable state
+_DEFAULT_REFRAMING_DATA = {
+    "negative_thought": "",
+    "situation": "",
+    "emotions": (),
+    "intensity": 5,
+    "distortions": (),
+    "evidence_for": "",
+    "evidence_against": "",
+    "alternative_thoughts": (),
+    "reframed_thought": "",
+    "new_intensity": 5,
+    "timestamp": None
+}
+
+
+def _reset_reframing():
+    """Return to step 1 with a blank exercise."""
+    st.session_state.reframing_step = 0
+    st.session_state.reframing_data = dict(_DEFAULT_REFRAMING_DATA)
+
+
+def _go_to_step(step, updates=None):
+    """Store changed step inputs, move to ``step`` and rerun.
+
+    Only values that differ from what is already stored are written.
+    """
+    if updates:
+        data = st.session_state.reframing_data
+        changed = {k: v for k, v in updates.items() if data.get(k) != v}
+        if changed:
+            data.update(changed)
+    st.session_state.reframing_step = step
+    st.rerun()
 
 
 def initialize_reframing_state():
     """Initialize session state for thought reframing tool."""
-    if "reframing_step" not in st.session_state:
-        st.session_state.reframing_step = 0
-    if "reframing_data" not in st.session_state:
-        st.session_state.reframing_data = {
-            "negative_thought": "",
-            "situation": "",
-            "emotions": [],
-            "intensity": 5,
-            "distortions": [],
-            "evidence_for": "",
-            "evidence_against": "",
-            "alternative_thoughts": [],
-            "reframed_thought": "",
-            "new_intensity": 5,
-            "timestamp": None
-        }
+    st.session_state.setdefault("reframing_step", 0)
+    st.session_state.setdefault("reframing_data", dict(_DEFAULT_REFRAMING_DATA))
     if "saved_reframings" not in st.session_state:
         st.session_state.saved_reframings = load_saved_reframings()
 
 
+REFRAMINGS_FILE = "data/thought_reframings.ndjson"
+LEGACY_REFRAMINGS_FILE = "data/thought_reframings.json"
+
+
+def _file_mtime(path):
+    """Return the file's modification time, or 0 if it does not exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0
+
+
+def _dumps(obj):
+    """Serialize obj to compact JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw):
+    """Parse a whole JSON buffer, using orjson when available."""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+@st.cache_data(show_spinner=False)
+def _load_saved_reframings_impl(path, mtime):
+    """Parse the NDJSON reframings file once per modification time; saving bumps mtime and invalidates."""
+    if not mtime:
+        return []
+    with open(path, "rb") as f:
+        return [_loads(line) for line in f if line.strip()]
+
+
+def _migrate_legacy_reframings():
+    """Rewrite the old JSON-array file as NDJSON, once; the old file is left in place."""
+    if os.path.exists(REFRAMINGS_FILE) or not os.path.exists(LEGACY_REFRAMINGS_FILE):
+        return
+    with open(LEGACY_REFRAMINGS_FILE, "rb") as f:
+        reframings = _loads(f.read())
+    with open(REFRAMINGS_FILE, "wb") as f:
+        f.writelines(_dumps(reframing) + b"\n" for reframing in reframings)
+
+
+@dataclass(slots=True)
+class Reframing:
+    """A saved thought reframing, plus display strings derived once on creation."""
+    negative_thought: str = ""
+    situation: str = ""
+    emotions: list = field(default_factory=list)
+    intensity: int = 5
+    distortions: list = field(default_factory=list)
+    evidence_for: str = ""
+    evidence_against: str = ""
+    alternative_thoughts: list = field(default_factory=list)
+    reframed_thought: str = ""
+    new_intensity: int = 5
+    timestamp: Optional[str] = None
+    display_ts: str = field(init=False, repr=False, compare=False)
+    emotions_str: str = field(init=False, repr=False, compare=False)
+    distortions_str: str = field(init=False, repr=False, compare=False)
+    improvement: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not self.timestamp:
+            self.display_ts = 'Unknown date'
+        else:
+            try:
+                self.display_ts = datetime.fromisoformat(self.timestamp).strftime("%B %d, %Y at %I:%M %p")
+            except (TypeError, ValueError):
+                self.display_ts = self.timestamp
+        self.emotions_str = ', '.join(self.emotions or [])
+        self.distortions_str = ', '.join(self.distortions or [])
+        self.improvement = self.intensity - self.new_intensity
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build from a stored/session dict, ignoring unknown keys."""
+        return cls(**{name: data[name] for name in _STORED_FIELDS if name in data})
+
+    def to_dict(self):
+        """The stored fields as a plain dict for JSON."""
+        return {name: getattr(self, name) for name in _STORED_FIELDS}
+
+
+_STORED_FIELDS = tuple(f.name for f in fields(Reframing) if f.init)
+
+
 def load_saved_reframings():
     """Load saved thought reframings from file."""
     try:
-        if os.path.exists("data/thought_reframings.json"):
-            with open("data/thought_reframings.json", "r") as f:
-                return json.load(f)
+        _migrate_legacy_reframings()
+        return [
+            Reframing.from_dict(r)
+            for r in _load_saved_reframings_impl(REFRAMINGS_FILE, _file_mtime(REFRAMINGS_FILE))
+        ]
     except Exception as e:
         st.warning(f"Could not load saved reframings: {e}")
     return []
 
 
 def save_reframing_to_file(reframing_data):
-    """Save a thought reframing to file."""
+    """Append a thought reframing to the NDJSON file and the session list."""
+    reframing_data = Reframing.from_dict(reframing_data)
     try:
         os.makedirs("data", exist_ok=True)
-        saved_reframings = load_saved_reframings()
-        saved_reframings.append(reframing_data)
-        with open("data/thought_reframings.json", "w") as f:
-            json.dump(saved_reframings, f, indent=2)
-        st.session_state.saved_reframings = saved_reframings
-        return True
+        with open(REFRAMINGS_FILE, "ab") as f:
+            f.write(_dumps(reframing_data.to_dict()) + b"\n")
     except Exception as e:
         st.error(f"Could not save reframing: {e}")
         return False
+    # The session copy is authoritative, so append to it rather than re-reading the file
+    saved_reframings = st.session_state.get("saved_reframings", [])
+    saved_reframings.append(reframing_data)
+    st.session_state.saved_reframings = saved_reframings
+    # A new entry is the most recent one, so keep the sorted view current by prepending
+    if st.session_state.get("saved_reframings_len") == len(saved_reframings) - 1:
+        st.session_state.saved_reframings_sorted = [reframing_data] + st.session_state.saved_reframings_sorted
+        st.session_state.saved_reframings_len = len(saved_reframings)
+    return True
 
 
-def render_step_indicator(current_step, total_steps):
-    """Render a visual step indicator."""
-    cols = st.columns(total_steps)
-    for i in range(total_steps):
-        with cols[i]:
-            if i < current_step:
-                st.markdown(f"✅ Step {i+1}")
-            elif i == current_step:
-                st.markdown(f"**▶️ Step {i+1}**")
-            else:
-                st.markdown(f"⚪ Step {i+1}")
+def get_sorted_reframings():
+    """Saved reframings, most recent first; re-sorted only when the count changes."""
+    saved = st.session_state.saved_reframings
+    if st.session_state.get("saved_reframings_len") != len(saved):
+        st.session_state.saved_reframings_sorted = sorted(
+            saved,
+            key=lambda x: x.timestamp or '',
+            reverse=True
+        )
+        st.session_state.saved_reframings_len = len(saved)
+    return st.session_state.saved_reframings_sorted
+
+
+TOTAL_STEPS = 5
+
+# (done, current, upcoming) badge HTML for each step of the indicator
+_STEP_BADGES = tuple(
+    (
+        f"<span style='flex:1'>✅ Step {i+1}</span>",
+        f"<span style='flex:1'><b>▶️ Step {i+1}</b></span>",
+        f"<span style='flex:1'>⚪ Step {i+1}</span>"
+    )
+    for i in range(TOTAL_STEPS)
+)
+
+
+def _intensity_columns():
+    """Before/after intensities of the saved reframings as NumPy arrays.
+
+    Saved reframings are only ever appended, so the arrays are extended
+    with just the entries added since the last call.
+    """
+    saved = st.session_state.saved_reframings
+    columns = st.session_state.get("reframing_intensities")
+    if columns is None or len(columns["before"]) > len(saved):
+        columns = {"before": np.empty(0, dtype=np.int8), "after": np.empty(0, dtype=np.int8)}
+    start = len(columns["before"])
+    if start < len(saved):
+        new = saved[start:]
+        columns["before"] = np.concatenate((
+            columns["before"], np.fromiter((r.intensity for r in new), dtype=np.int8, count=len(new))
+        ))
+        columns["after"] = np.concatenate((
+            columns["after"], np.fromiter((r.new_intensity for r in new), dtype=np.int8, count=len(new))
+        ))
+    st.session_state.reframing_intensities = columns
+    return columns
+
+
+def get_improvement_stats():
+    """Average intensity drop and share of reframings that lowered intensity."""
+    columns = _intensity_columns()
+    deltas = columns["before"].astype(np.int16) - columns["after"]
+    if not len(deltas):
+        return {"avg_improvement": 0.0, "improved_share": 0.0}
+    return {
+        "avg_improvement": float(deltas.mean()),
+        "improved_share": float(np.count_nonzero(deltas > 0) / len(deltas))
+    }
+
+
+def render_step_indicator(current_step, total_steps=TOTAL_STEPS):
+    """Render a visual step indicator as a single markdown element."""
+    badges = "".join(
+        done if i < current_step else current if i == current_step else todo
+        for i, (done, current, todo) in enumerate(_STEP_BADGES[:total_steps])
+    )
+    st.markdown(f"<div style='display:flex'>{badges}</div>", unsafe_allow_html=True)
 
 
 def render_step_1():
@@ -176,60 +383,57 @@ def render_step_1():
     st.subheader("Step 1: Identify Your Thought")
     st.info("👋 Let's start by capturing the negative thought that's bothering you.")
     
-    st.markdown("**What's the situation?**")
-    st.caption("Briefly describe what happened or what's happening.")
-    situation = st.text_area(
-        "Situation:",
-        value=st.session_state.reframing_data["situation"],
-        placeholder="Example: I got critical feedback at work today...",
-        height=80,
-        key="situation_input"
-    )
-    
-    st.markdown("**What's the automatic negative thought?**")
-    st.caption("What went through your mind? Write it exactly as you thought it.")
-    negative_thought = st.text_area(
-        "Negative Thought:",
-        value=st.session_state.reframing_data["negative_thought"],
-        placeholder="Example: I'm terrible at my job and everyone thinks I'm incompetent...",
-        height=100,
-        key="negative_thought_input"
-    )
-    
-    st.markdown("**What emotions are you feeling?**")
-    st.caption("Select all that apply.")
-    emotion_options = [
-        "Anxious", "Sad", "Angry", "Frustrated", "Ashamed", 
-        "Guilty", "Hopeless", "Overwhelmed", "Fearful", "Disappointed"
-    ]
-    emotions = st.multiselect(
-        "Emotions:",
-        options=emotion_options,
-        default=st.session_state.reframing_data["emotions"],
-        key="emotions_input"
-    )
-    
-    st.markdown("**How intense is this feeling? (1 = mild, 10 = extreme)**")
-    intensity = st.slider(
-        "Intensity:",
-        min_value=1,
-        max_value=10,
-        value=st.session_state.reframing_data["intensity"],
-        key="intensity_input"
-    )
-    
-    col1, col2 = st.columns([1, 1])
-    with col2:
-        if st.button("Next Step →", use_container_width=True, type="primary"):
-            if not negative_thought.strip():
-                st.warning("Please enter your negative thought before continuing.")
-            else:
-                st.session_state.reframing_data["situation"] = situation
-                st.session_state.reframing_data["negative_thought"] = negative_thought
-                st.session_state.reframing_data["emotions"] = emotions
-                st.session_state.reframing_data["intensity"] = intensity
-                st.session_state.reframing_step = 1
-                st.rerun()
+    with st.form("reframing_step1_form", clear_on_submit=False):
+        st.markdown("**What's the situation?**")
+        st.caption("Briefly describe what happened or what's happening.")
+        situation = st.text_area(
+            "Situation:",
+            value=st.session_state.reframing_data["situation"],
+            placeholder="Example: I got critical feedback at work today...",
+            height=80,
+            key="situation_input"
+        )
+        
+        st.markdown("**What's the automatic negative thought?**")
+        st.caption("What went through your mind? Write it exactly as you thought it.")
+        negative_thought = st.text_area(
+            "Negative Thought:",
+            value=st.session_state.reframing_data["negative_thought"],
+            placeholder="Example: I'm terrible at my job and everyone thinks I'm incompetent...",
+            height=100,
+            key="negative_thought_input"
+        )
+        
+        st.markdown("**What emotions are you feeling?**")
+        st.caption("Select all that apply.")
+        emotions = st.multiselect(
+            "Emotions:",
+            options=_EMOTION_OPTIONS,
+            default=st.session_state.reframing_data["emotions"],
+            key="emotions_input"
+        )
+        
+        st.markdown("**How intense is this feeling? (1 = mild, 10 = extreme)**")
+        intensity = st.slider(
+            "Intensity:",
+            min_value=1,
+            max_value=10,
+            value=st.session_state.reframing_data["intensity"],
+            key="intensity_input"
+        )
+        
+        col1, col2 = st.columns(2)
+        with col2:
+            if st.form_submit_button("Next Step →", use_container_width=True, type="primary"):
+                if not negative_thought.strip():
+                    st.warning("Please enter your negative thought before continuing.")
+                else:
+                    _go_to_step(1, {
+                        "situation": situation,
+                        "negative_thought": negative_thought,
+                        "emotions": emotions,
+                        "intensity": intensity
+                    })
 
 
 def render_step_2():
@@ -246,34 +450,33 @@ def render_step_2():
     st.markdown("**Common Cognitive Distortions**")
     st.caption("Select any thinking patterns you recognize in your thought. Click on each to see examples.")
     
-    selected_distortions = []
+    distortion_items, distortion_names, distortion_labels = _distortion_tables()
     
     # Display distortions with expandable details
-    for distortion_name, distortion_info in COGNITIVE_DISTORTIONS.items():
-        with st.expander(f"{distortion_info['icon']} {distortion_name}"):
+    for distortion_name, distortion_info, expander_label in distortion_items:
+        with st.expander(expander_label):
             st.markdown(f"**Description:** {distortion_info['description']}")
             st.markdown("**Examples:**")
             for example in distortion_info['examples']:
                 st.markdown(f"- *{example}*")
-        
-        if st.checkbox(
-            f"My thought shows {distortion_name}",
-            key=f"distortion_{distortion_name}",
-            value=distortion_name in st.session_state.reframing_data["distortions"]
-        ):
-            selected_distortions.append(distortion_name)
-    
-    col1, col2 = st.columns([1, 1])
-    with col1:
-        if st.button("← Previous Step", use_container_width=True):
-            st.session_state.reframing_step = 0
-            st.rerun()
     
-    with col2:
-        if st.button("Next Step →", use_container_width=True, type="primary"):
-            st.session_state.reframing_data["distortions"] = selected_distortions
-            st.session_state.reframing_step = 2
-            st.rerun()
+    with st.form("reframing_step2_form", clear_on_submit=False):
+        selected_distortions = st.multiselect(
+            "Which patterns does your thought show?",
+            options=distortion_names,
+            default=st.session_state.reframing_data["distortions"],
+            format_func=distortion_labels.__getitem__,
+            key="distortions_multi"
+        )
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.form_submit_button("← Previous Step", use_container_width=True):
+                _go_to_step(0)
+        
+        with col2:
+            if st.form_submit_button("Next Step →", use_container_width=True, type="primary"):
+                _go_to_step(2, {"distortions": selected_distortions})
 
 
 def render_step_3():
@@ -287,45 +490,46 @@ def render_step_3():
         if st.session_state.reframing_data['distortions']:
             st.write(f"**Thinking patterns:** {', '.join(st.session_state.reframing_data['distortions'])}")
     
-    st.markdown("**What evidence SUPPORTS this thought?**")
-    st.caption("What facts or observations make this thought seem true? Be specific and objective.")
-    evidence_for = st.text_area(
-        "Evidence For:",
-        value=st.session_state.reframing_data["evidence_for"],
-        placeholder="List concrete facts that support this thought...",
-        height=100,
-        key="evidence_for_input"
-    )
-    
-    st.markdown("**What evidence CONTRADICTS this thought?**")
-    st.caption("What facts or observations suggest this thought might not be completely true?")
-    evidence_against = st.text_area(
-        "Evidence Against:",
-        value=st.session_state.reframing_data["evidence_against"],
-        placeholder="List facts that contradict or weaken this thought...",
-        height=100,
-        key="evidence_against_input"
-    )
-    
-    st.markdown("**Reflection Questions:**")
-    with st.expander("Click to see helpful questions"):
-        for question in REFRAMING_QUESTIONS[:7]:
-            st.markdown(f"- {question}")
-    
-    col1, col2 = st.columns([1, 1])
-    with col1:
-        if st.button("← Previous Step", use_container_width=True):
-            st.session_state.reframing_data["evidence_for"] = evidence_for
-            st.session_state.reframing_data["evidence_against"] = evidence_against
-            st.session_state.reframing_step = 1
-            st.rerun()
-    
-    with col2:
-        if st.button("Next Step →", use_container_width=True, type="primary"):
-            st.session_state.reframing_data["evidence_for"] = evidence_for
-            st.session_state.reframing_data["evidence_against"] = evidence_against
-            st.session_state.reframing_step = 3
-            st.rerun()
+    with st.form("reframing_step3_form", clear_on_submit=False):
+        st.markdown("**What evidence SUPPORTS this thought?**")
+        st.caption("What facts or observations make this thought seem true? Be specific and objective.")
+        evidence_for = st.text_area(
+            "Evidence For:",
+            value=st.session_state.reframing_data["evidence_for"],
+            placeholder="List concrete facts that support this thought...",
+            height=100,
+            key="evidence_for_input"
+        )
+        
+        st.markdown("**What evidence CONTRADICTS this thought?**")
+        st.caption("What facts or observations suggest this thought might not be completely true?")
+        evidence_against = st.text_area(
+            "Evidence Against:",
+            value=st.session_state.reframing_data["evidence_against"],
+            placeholder="List facts that contradict or weaken this thought...",
+            height=100,
+            key="evidence_against_input"
+        )
+        
+        st.markdown("**Reflection Questions:**")
+        with st.expander("Click to see helpful questions"):
+            for question in _REFRAMING_Q_FIRST:
+                st.markdown(f"- {question}")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.form_submit_button("← Previous Step", use_container_width=True):
+                _go_to_step(1, {
+                    "evidence_for": evidence_for,
+                    "evidence_against": evidence_against
+                })
+        
+        with col2:
+            if st.form_submit_button("Next Step →", use_container_width=True, type="primary"):
+                _go_to_step(3, {
+                    "evidence_for": evidence_for,
+                    "evidence_against": evidence_against
+                })
 
 
 def render_step_4():
@@ -353,42 +557,39 @@ def render_step_4():
         key="num_alternatives"
     )
     
-    alternative_thoughts = []
-    for i in range(int(num_alternatives)):
-        default_value = ""
-        if i < len(st.session_state.reframing_data.get("alternative_thoughts", [])):
-            default_value = st.session_state.reframing_data["alternative_thoughts"][i]
+    with st.form("reframing_step4_form", clear_on_submit=False):
+        alternative_thoughts = []
+        for i in range(int(num_alternatives)):
+            default_value = ""
+            if i < len(st.session_state.reframing_data.get("alternative_thoughts", [])):
+                default_value = st.session_state.reframing_data["alternative_thoughts"][i]
         
-        alt_thought = st.text_area(
-            f"Alternative Thought #{i+1}:",
-            value=default_value,
-            placeholder=f"Example: While I made a mistake, I've also done many things well. One error doesn't define my entire performance...",
-            height=80,
-            key=f"alt_thought_{i}"
-        )
-        if alt_thought.strip():
-            alternative_thoughts.append(alt_thought)
-    
-    st.markdown("**More Reframing Questions:**")
-    with st.expander("Click to see more helpful questions"):
-        for question in REFRAMING_QUESTIONS[7:]:
-            st.markdown(f"- {question}")
-    
-    col1, col2 = st.columns([1, 1])
-    with col1:
-        if st.button("← Previous Step", use_container_width=True):
-            st.session_state.reframing_data["alternative_thoughts"] = alternative_thoughts
-            st.session_state.reframing_step = 2
-            st.rerun()
-    
-    with col2:
-        if st.button("Next Step →", use_container_width=True, type="primary"):
-            if not alternative_thoughts:
-                st.warning("Please create at least one alternative thought before continuing.")
-            else:
-                st.session_state.reframing_data["alternative_thoughts"] = alternative_thoughts
-                st.session_state.reframing_step = 4
-                st.rerun()
+            alt_thought = st.text_area(
+                f"Alternative Thought #{i+1}:",
+                value=default_value,
+                placeholder=f"Example: While I made a mistake, I've also done many things well. One error doesn't define my entire performance...",
+                height=80,
+                key=f"alt_thought_{i}"
+            )
+            if alt_thought.strip():
+                alternative_thoughts.append(alt_thought)
+        
+        st.markdown("**More Reframing Questions:**")
+        with st.expander("Click to see more helpful questions"):
+            for question in _REFRAMING_Q_REST:
+                st.markdown(f"- {question}")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.form_submit_button("← Previous Step", use_container_width=True):
+                _go_to_step(2, {"alternative_thoughts": alternative_thoughts})
+        
+        with col2:
+            if st.form_submit_button("Next Step →", use_container_width=True, type="primary"):
+                if not alternative_thoughts:
+                    st.warning("Please create at least one alternative thought before continuing.")
+                else:
+                    _go_to_step(4, {"alternative_thoughts": alternative_thoughts})
 
 
 def render_step_5():
@@ -430,41 +631,28 @@ def render_step_5():
     else:
         st.info(f"Your intensity is now {new_intensity}. This process takes practice - be patient with yourself.")
     
-    col1, col2, col3 = st.columns([1, 1, 1])
+    col1, col2, col3 = st.columns(3)
     with col1:
         if st.button("← Previous Step", use_container_width=True):
-            st.session_state.reframing_data["reframed_thought"] = reframed_thought
-            st.session_state.reframing_data["new_intensity"] = new_intensity
-            st.session_state.reframing_step = 3
-            st.rerun()
+            _go_to_step(3, {
+                "reframed_thought": reframed_thought,
+                "new_intensity": new_intensity
+            })
     
     with col2:
         if st.button("Save & Finish", use_container_width=True, type="primary"):
             if not reframed_thought.strip():
                 st.warning("Please create your reframed thought before finishing.")
             else:
-                st.session_state.reframing_data["reframed_thought"] = reframed_thought
-                st.session_state.reframing_data["new_intensity"] = new_intensity
-                st.session_state.reframing_data["timestamp"] = datetime.now().isoformat()
-                st.session_state.reframing_step = 5
-                st.rerun()
+                _go_to_step(5, {
+                    "reframed_thought": reframed_thought,
+                    "new_intensity": new_intensity,
+                    "timestamp": datetime.now().isoformat()
+                })
     
     with col3:
         if st.button("Start Over", use_container_width=True):
-            st.session_state.reframing_step = 0
-            st.session_state.reframing_data = {
-                "negative_thought": "",
-                "situation": "",
-                "emotions": [],
-                "intensity": 5,
-                "distortions": [],
-                "evidence_for": "",
-                "evidence_against": "",
-                "alternative_thoughts": [],
-                "reframed_thought": "",
-                "new_intensity": 5,
-                "timestamp": None
-            }
+            _reset_reframing()
             st.rerun()
 
 
@@ -472,7 +660,12 @@ def render_completion_summary():
     """Display the completion summary."""
     st.success("🎉 Congratulations! You've completed the thought reframing exercise!")
     
-    data = st.session_state.reframing_data
+    # Build the summary entry once per finished exercise (timestamps are unique per finish)
+    summary = st.session_state.get("reframing_summary")
+    if summary is None or summary.timestamp != st.session_state.reframing_data["timestamp"]:
+        summary = Reframing.from_dict(st.session_state.reframing_data)
+        st.session_state.reframing_summary = summary
+    data = summary
     
     st.markdown("### Your Thought Reframing Summary")
     
@@ -480,46 +673,32 @@ def render_completion_summary():
     
     with col1:
         st.markdown("#### 📉 Before")
-        st.markdown(f"**Thought:** {data['negative_thought']}")
-        if data['emotions']:
-            st.markdown(f"**Emotions:** {', '.join(data['emotions'])}")
-        st.markdown(f"**Intensity:** {data['intensity']}/10")
-        if data['distortions']:
-            st.markdown(f"**Thinking Patterns:** {', '.join(data['distortions'])}")
+        st.markdown(f"**Thought:** {data.negative_thought}")
+        if data.emotions_str:
+            st.markdown(f"**Emotions:** {data.emotions_str}")
+        st.markdown(f"**Intensity:** {data.intensity}/10")
+        if data.distortions_str:
+            st.markdown(f"**Thinking Patterns:** {data.distortions_str}")
     
     with col2:
         st.markdown("#### 📈 After")
-        st.markdown(f"**Reframed Thought:** {data['reframed_thought']}")
-        st.markdown(f"**New Intensity:** {data['new_intensity']}/10")
-        improvement = data['intensity'] - data['new_intensity']
-        if improvement > 0:
-            st.markdown(f"**Improvement:** ↓ {improvement} points")
+        st.markdown(f"**Reframed Thought:** {data.reframed_thought}")
+        st.markdown(f"**New Intensity:** {data.new_intensity}/10")
+        if data.improvement > 0:
+            st.markdown(f"**Improvement:** ↓ {data.improvement} points")
     
     # Save option
-    col_save, col_new = st.columns([1, 1])
+    col_save, col_new = st.columns(2)
     with col_save:
         if st.button("💾 Save This Reframing", use_container_width=True, type="primary"):
-            if save_reframing_to_file(data):
+            if save_reframing_to_file(st.session_state.reframing_data):
                 st.success("✅ Saved successfully!")
             else:
                 st.error("Could not save. Please try again.")
     
     with col_new:
         if st.button("🔄 Start New Exercise", use_container_width=True):
-            st.session_state.reframing_step = 0
-            st.session_state.reframing_data = {
-                "negative_thought": "",
-                "situation": "",
-                "emotions": [],
-                "intensity": 5,
-                "distortions": [],
-                "evidence_for": "",
-                "evidence_against": "",
-                "alternative_thoughts": [],
-                "reframed_thought": "",
-                "new_intensity": 5,
-                "timestamp": None
-            }
+            _reset_reframing()
             st.rerun()
     
     # Tips for continuing
@@ -542,35 +721,82 @@ def render_saved_reframings():
     
     st.markdown(f"### 📚 Your Saved Reframings ({len(st.session_state.saved_reframings)})")
     
-    # Sort by most recent first
-    sorted_reframings = sorted(
-        st.session_state.saved_reframings,
-        key=lambda x: x.get('timestamp', ''),
-        reverse=True
-    )
+    stats = get_improvement_stats()
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Average Intensity Change", f"{-stats['avg_improvement']:+.1f} points")
+    with col2:
+        st.metric("Reframings That Helped", f"{stats['improved_share'] * 100:.0f}%")
+    
+    sorted_reframings = get_sorted_reframings()
     
     for i, reframing in enumerate(sorted_reframings):
-        timestamp = reframing.get('timestamp', 'Unknown date')
-        if timestamp != 'Unknown date':
-            try:
-                dt = datetime.fromisoformat(timestamp)
-                timestamp = dt.strftime("%B %d, %Y at %I:%M %p")
-            except:
-                pass
-        
-        with st.expander(f"🗓️ {timestamp} - Intensity: {reframing.get('intensity', 'N/A')} → {reframing.get('new_intensity', 'N/A')}"):
-            st.markdown(f"**Original Thought:** {reframing.get('negative_thought', 'N/A')}")
-            st.markdown(f"**Reframed Thought:** {reframing.get('reframed_thought', 'N/A')}")
+        with st.expander(f"🗓️ {reframing.display_ts} - Intensity: {reframing.intensity} → {reframing.new_intensity}"):
+            st.markdown(f"**Original Thought:** {reframing.negative_thought or 'N/A'}")
+            st.markdown(f"**Reframed Thought:** {reframing.reframed_thought or 'N/A'}")
             
-            if reframing.get('emotions'):
-                st.markdown(f"**Emotions:** {', '.join(reframing['emotions'])}")
+            if reframing.emotions_str:
+                st.markdown(f"**Emotions:** {reframing.emotions_str}")
             
-            if reframing.get('distortions'):
-                st.markdown(f"**Thinking Patterns:** {', '.join(reframing['distortions'])}")
+            if reframing.distortions_str:
+                st.markdown(f"**Thinking Patterns:** {reframing.distortions_str}")
             
-            improvement = reframing.get('intensity', 0) - reframing.get('new_intensity', 0)
-            if improvement > 0:
-                st.success(f"📉 Emotional intensity reduced by {improvement} points")
+            if reframing.improvement > 0:
+                st.success(f"📉 Emotional intensity reduced by {reframing.improvement} points")
+
+
+_ABOUT_CBT_MD = """
+### What is Cognitive Behavioral Therapy (CBT)?
+
+**CBT** is one of the most researched and effective forms of psychotherapy. It's based on the idea 
+that our thoughts, feelings, and behaviors are interconnected. By changing negative thought patterns, 
+we can improve our emotions and behaviors.
+
+### The CBT Triangle
+
+```
+   THOUGHTS
+      ↗ ↘
+FEELINGS ←→ BEHAVIORS
+```
+
+When we change our thoughts, we can influence both our feelings and actions.
+
+### What are Cognitive Distortions?
+
+Cognitive distortions are irrational thought patterns that can negatively affect how we perceive 
+reality. Everyone experiences them, but they become problematic when they're frequent or intense.
+
+### How This Tool Helps
+
+This tool guides you through a structured process to:
+1. **Identify** negative automatic thoughts
+2. **Recognize** cognitive distortions (thinking traps)
+3. **Examine** the evidence objectively
+4. **Generate** alternative, balanced perspectives
+5. **Create** a reframed thought that's more realistic and compassionate
+
+### When to Use This Tool
+
+- When you notice persistent negative thoughts
+- Before or after stressful situations
+- When emotions feel overwhelming
+- As regular practice to build mental resilience
+- In conjunction with therapy (share your reframings with your therapist!)
+
+### Important Notes
+
+- This tool is for **self-help and learning**, not a replacement for professional therapy
+- If you're experiencing severe distress, please reach out to a mental health professional
+- Practice makes progress - be patient with yourself as you learn these skills
+- Some thoughts are harder to reframe than others, and that's okay
+
+### Resources
+
+- **Feeling Good: The New Mood Therapy** by David Burns, MD
+- **Mind Over Mood** by Dennis Greenberger and Christine Padesky
+- **The Anxiety and Worry Workbook** by David Clark and Aaron Beck
+"""
 
 
 def render_thought_reframing():
@@ -590,7 +816,7 @@ def render_thought_reframing():
         """)
         
         # Step indicator
-        total_steps = 5
+        total_steps = TOTAL_STEPS
         current_step = st.session_state.reframing_step
         
         if current_step < 5:
@@ -615,55 +841,4 @@ def render_thought_reframing():
         render_saved_reframings()
     
     with tab3:
-        st.markdown("""
-        ### What is Cognitive Behavioral Therapy (CBT)?
-        
-        **CBT** is one of the most researched and effective forms of psychotherapy. It's based on the idea 
-        that our thoughts, feelings, and behaviors are interconnected. By changing negative thought patterns, 
-        we can improve our emotions and behaviors.
-        
-        ### The CBT Triangle
-        
-        ```
-           THOUGHTS
-              ↗ ↘
-        FEELINGS ←→ BEHAVIORS
-        ```
-        
-        When we change our thoughts, we can influence both our feelings and actions.
-        
-        ### What are Cognitive Distortions?
-        
-        Cognitive distortions are irrational thought patterns that can negatively affect how we perceive 
-        reality. Everyone experiences them, but they become problematic when they're frequent or intense.
-        
-        ### How This Tool Helps
-        
-        This tool guides you through a structured process to:
-        1. **Identify** negative automatic thoughts
-        2. **Recognize** cognitive distortions (thinking traps)
-        3. **Examine** the evidence objectively
-        4. **Generate** alternative, balanced perspectives
-        5. **Create** a reframed thought that's more realistic and compassionate
-        
-        ### When to Use This Tool
-        
-        - When you notice persistent negative thoughts
-        - Before or after stressful situations
-        - When emotions feel overwhelming
-        - As regular practice to build mental resilience
-        - In conjunction with therapy (share your reframings with your therapist!)
-        
-        ### Important Notes
-        
-        - This tool is for **self-help and learning**, not a replacement for professional therapy
-        - If you're experiencing severe distress, please reach out to a mental health professional
-        - Practice makes progress - be patient with yourself as you learn these skills
-        - Some thoughts are harder to reframe than others, and that's okay
-        
-        ### Resources
-        
-        - **Feeling Good: The New Mood Therapy** by David Burns, MD
-        - **Mind Over Mood** by Dennis Greenberger and Christine Padesky
-        - **The Anxiety and Worry Workbook** by David Clark and Aaron Beck
-        """)
+        st.markdown(_ABOUT_CBT_MD)
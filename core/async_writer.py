@@ -0,0 +1,121 @@
+"""Background file writer shared by the components that persist user data.
+
+Saves are queued as (path, payload, append) and written on a daemon thread,
+so a request never waits on disk. Each submit returns a Future; callers
+keep it and check it on a later rerun so a failed write is reported to the
+user instead of being lost.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWriter:
+    """Daemon thread that writes queued payloads off the request thread.
+
+    Everything queued within one tick is grouped per file and mode, so a
+    burst of saves costs one open/write per file. Appends are concatenated;
+    for whole-file replacements only the newest payload is written,
+    atomically. Groups for one file are written in the order they were queued.
+    """
+
+    def __init__(self, name: str, tick_seconds: float = 0.0):
+        self.name = name
+        self.tick_seconds = tick_seconds
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def submit(self, path: str, payload: bytes, append: bool = True) -> Future:
+        """Queue an already-serialized payload to append to (or replace) path."""
+        future: Future = Future()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+        self._queue.put((path, payload, append, future))
+        return future
+
+    def flush(self) -> None:
+        """Block until every queued payload has been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            if self.tick_seconds:
+                time.sleep(self.tick_seconds)
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for path, append, payloads, futures in _group(batch):
+                try:
+                    _write(path, payloads, append)
+                except Exception as e:
+                    logger.exception("Could not write %s", path)
+                    for future in futures:
+                        future.set_exception(e)
+                else:
+                    for future in futures:
+                        future.set_result(None)
+            for _ in batch:
+                self._queue.task_done()
+
+
+def _group(batch: List[tuple]) -> List[Tuple[str, bool, List[bytes], List[Future]]]:
+    """Split a batch into per-file runs of the same mode, in queue order.
+
+    Consecutive saves to one file share a group; a switch between append and
+    replace starts a new group, so e.g. an append queued after a replace is
+    written after it instead of being folded into the replacement.
+    """
+    groups: List[Tuple[str, bool, List[bytes], List[Future]]] = []
+    last: Dict[str, int] = {}
+    for path, payload, append, future in batch:
+        index = last.get(path)
+        if index is None or groups[index][1] != append:
+            last[path] = index = len(groups)
+            groups.append((path, append, [], []))
+        groups[index][2].append(payload)
+        groups[index][3].append(future)
+    return groups
+
+
+def _write(path: str, payloads: List[bytes], append: bool) -> None:
+    """Append every payload to path, or atomically replace it with the newest one."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if append:
+        with open(path, "ab") as f:
+            f.writelines(payloads)
+    else:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payloads[-1])
+        os.replace(tmp_path, path)
+
+
+def pop_failed_writes(pending: List[Tuple[str, Future]]) -> List[Tuple[str, BaseException]]:
+    """Drop finished writes from ``pending`` in place; return (path, error) for the failed ones."""
+    failed = []
+    still_pending = []
+    for path, future in pending:
+        if not future.done():
+            still_pending.append((path, future))
+        elif future.exception() is not None:
+            failed.append((path, future.exception()))
+    pending[:] = still_pending
+    return failed
@@ -1,10 +1,32 @@
+import atexit
 import datetime
 import json
 import os
 import calendar
+import threading
+import numpy as np
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Optional
 
-WATER_LOG_FILE = 'water_intake_log.json'
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# One entry per line, each tagged with its date, so single-day reads only
+# parse matching lines. The pre-JSONL dict file is converted on first load.
+WATER_LOG_FILE = 'water_intake_log.jsonl'
+LEGACY_WATER_LOG_FILE = 'water_intake_log.json'
+
+# Appends are written immediately; whole-file rewrites (edits, deletes,
+# imports) are coalesced and reach disk after this many (and at exit)
+WATER_LOG_FLUSH_EVERY = 5
+
+# (date, isoformat) of the last today_str() call; the string is rebuilt only
+# when the date rolls over
+_TODAY_CACHE = [None, None]
+
 
 # Helper to get today's date as string
 def today_str():
@@ -13,7 +35,20 @@ def today_str():
     Returns:
         str: Today's date in YYYY-MM-DD format.
     """
-    return datetime.date.today().isoformat()
+    today = datetime.date.today()
+    if today != _TODAY_CACHE[0]:
+        _TODAY_CACHE[:] = [today, today.isoformat()]
+    return _TODAY_CACHE[1]
+
+
+def _sum_entries(entries):
+    return sum(entry['amount_ml'] for entry in entries)
+
+
+def _totals_array(amounts):
+    # np.array infers int64 for whole-ml logs and float64 once CSV imports mix
+    # in floats, so .item() hands back the same Python type the log holds.
+    return np.array(list(amounts))
 
 
 # Log water intake (in ml)
@@ -23,15 +58,10 @@ def log_water_intake(amount_ml):
     Args:
         amount_ml (int/float): Amount of water in milliliters.
     """
-    data = load_water_log()
-    today = today_str()
-    if today not in data:
-        data[today] = []
-    data[today].append({
+    _append_entry(today_str(), {
         'amount_ml': amount_ml, 
         'timestamp': datetime.datetime.now().isoformat()
     })
-    save_water_log(data)
 
 
 def log_water_intake_with_note(amount_ml, note=""):
@@ -41,25 +71,22 @@ def log_water_intake_with_note(amount_ml, note=""):
         amount_ml (int/float): Amount of water in milliliters.
         note (str): Optional note about the intake (e.g., "After workout", "Morning").
     """
-    data = load_water_log()
-    today = today_str()
-    if today not in data:
-        data[today] = []
-    data[today].append({
+    _append_entry(today_str(), {
         'amount_ml': amount_ml,
         'timestamp': datetime.datetime.now().isoformat(),
         'note': note
     })
-    save_water_log(data)
 
 
-def log_water_intake_for_date(amount_ml, date_str, note=""):
+def log_water_intake_for_date(amount_ml, date_str, note="", now_iso=None):
     """
     Log water intake for a specific date (useful for backdating entries).
     Args:
         amount_ml (int/float): Amount of water in milliliters.
         date_str (str): Date in YYYY-MM-DD format.
         note (str): Optional note about the intake.
+        now_iso (str, optional): Timestamp to record; bulk callers pass one
+            value for the whole batch instead of reading the clock per entry.
     Returns:
         bool: True if successful, False otherwise.
     """
@@ -67,15 +94,11 @@ def log_water_intake_for_date(amount_ml, date_str, note=""):
         # Validate date format
         datetime.date.fromisoformat(date_str)
         
-        data = load_water_log()
-        if date_str not in data:
-            data[date_str] = []
-        data[date_str].append({
+        _append_entry(date_str, {
             'amount_ml': amount_ml,
-            'timestamp': datetime.datetime.now().isoformat(),
+            'timestamp': now_iso or datetime.datetime.now().isoformat(),
             'note': note
         })
-        save_water_log(data)
         return True
     except ValueError:
         return False
@@ -88,11 +111,7 @@ def get_today_total():
     Returns:
         int: Total water intake in ml.
     """
-    data = load_water_log()
-    today = today_str()
-    if today in data:
-        return sum(entry['amount_ml'] for entry in data[today])
-    return 0
+    return get_total_for_date(today_str())
 
 
 def get_total_for_date(date_str):
@@ -103,25 +122,24 @@ def get_total_for_date(date_str):
     Returns:
         int: Total water intake in ml for that date.
     """
-    data = load_water_log()
-    if date_str in data:
-        return sum(entry['amount_ml'] for entry in data[date_str])
-    return 0
+    return _STORE.total_for(date_str)
 
 
-def get_average_daily_intake(days=7):
+def get_average_daily_intake(days=7, totals=None):
     """
     Calculate average daily water intake over the last N days.
     Args:
         days (int): Number of days to calculate average for.
+        totals (dict, optional): Daily totals from get_daily_totals(); loaded
+            when omitted so a caller can share one snapshot across queries.
     Returns:
         float: Average daily intake in ml.
     """
-    totals = get_last_n_days_totals(days)
-    if not totals:
+    last_n = get_last_n_days_totals(days, totals=totals)
+    if not last_n:
         return 0.0
-    total_intake = sum(total for _, total in totals)
-    return round(total_intake / len(totals), 2)
+    total_intake = sum(total for _, total in last_n)
+    return round(total_intake / len(last_n), 2)
 
 
 def get_hydration_percentage(daily_goal_ml=2000):
@@ -147,28 +165,277 @@ def is_goal_achieved(daily_goal_ml=2000):
     return get_today_total() >= daily_goal_ml
 
 
+def _dumps(obj):
+    """Serialize obj to compact JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw):
+    """Parse a JSON buffer, using orjson when available."""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def _entry_line(date_str, entry):
+    # "date" goes first so WaterStore.read_date() can match lines on a prefix
+    return _dumps({'date': date_str, **entry}) + b'\n'
+
+
+class WaterStore:
+    """
+    In-memory owner of the water log file.
+    The parsed log and its per-day totals stay pinned for the life of the
+    process. Each append is written to disk as one line straight away.
+    Whole-file rewrites are buffered and synced every `flush_every` of them,
+    on the next append, on flush(force=True), or at interpreter exit.
+    While nothing is buffered, a change to the file's mtime triggers a reload.
+    Every change happens under the lock, and adding or removing a date swaps
+    in a new dict, so a dict handed out by load()/totals() is never resized
+    while a reader (or another session's flush) iterates it.
+    """
+
+    def __init__(self, path, legacy_path, flush_every=WATER_LOG_FLUSH_EVERY):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+        self._data = None
+        self._totals = None
+        self._mtime = None
+        self._dirty_count = 0  # buffered whole-file rewrites
+        self._legacy_checked = False
+        self.version = 0  # bumped whenever the pinned data changes
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def _write_all(self, data):
+        # Write beside the log and rename over it, so a crash mid-write leaves
+        # the previous file intact rather than a truncated one
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.writelines(
+                _entry_line(date_str, entry)
+                for date_str, entries in data.items()
+                for entry in entries
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _migrate_legacy(self):
+        """
+        Convert the older {date: [entries]} JSON file to JSONL, once.
+        The legacy file is left untouched; once the JSONL file exists it is
+        the only one read.
+        """
+        self._legacy_checked = True
+        if os.path.exists(self.path):
+            return
+        try:
+            with open(self.legacy_path, 'rb') as f:
+                data = _loads(f.read())
+        except FileNotFoundError:
+            return
+        self._write_all(data)
+
+    def _is_fresh(self):
+        """Whether the pinned copy is authoritative; caller holds the lock."""
+        if not self._legacy_checked:
+            self._migrate_legacy()
+        if self._data is None:
+            return False
+        return bool(self._dirty_count) or self._mtime == self._file_mtime()
+
+    def _ensure_loaded(self):
+        """Parse the file into memory unless the pinned copy is current; caller holds the lock."""
+        if self._is_fresh():
+            return
+        mtime = self._file_mtime()
+        data = {}
+        if mtime:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        entry = _loads(line)
+                        data.setdefault(entry.pop('date'), []).append(entry)
+        self._data = data
+        self._totals = {d: _sum_entries(entries) for d, entries in data.items()}
+        self._mtime = mtime
+        self.version += 1
+
+    def read_date(self, date_str):
+        """Parse only the lines logged for one date, without loading the whole log."""
+        prefix = f'{{"date":"{date_str}"'.encode()
+        entries = []
+        try:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    if line.startswith(prefix):
+                        entry = _loads(line)
+                        del entry['date']
+                        entries.append(entry)
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def version_of(self, totals):
+        """Return the current version if `totals` is the pinned rollup, else None."""
+        with self._lock:
+            return self.version if totals is self._totals else None
+
+    def load(self):
+        with self._lock:
+            self._ensure_loaded()
+            return self._data
+
+    def totals(self):
+        with self._lock:
+            self._ensure_loaded()
+            return self._totals
+
+    def entries_for(self, date_str):
+        with self._lock:
+            if self._is_fresh():
+                return self._data.get(date_str, [])
+        return self.read_date(date_str)
+
+    def total_for(self, date_str):
+        with self._lock:
+            if self._is_fresh():
+                return self._totals.get(date_str, 0)
+        return _sum_entries(self.read_date(date_str))
+
+    def append(self, date_str, entry):
+        """Add one entry and write it through as a single appended line."""
+        with self._lock:
+            self._ensure_loaded()
+            entries = self._data.get(date_str)
+            if entries is None:
+                self._data = {**self._data, date_str: [entry]}
+                self._totals = {**self._totals, date_str: entry['amount_ml']}
+            else:
+                entries.append(entry)
+                self._totals[date_str] += entry['amount_ml']
+            self.version += 1
+            if self._dirty_count:
+                # A buffered rewrite already includes this entry; write it now
+                self._flush_locked(force=True)
+                return
+            with open(self.path, 'ab') as f:
+                f.write(_entry_line(date_str, entry))
+            self._mtime = self._file_mtime()
+
+    def replace(self, data):
+        """Swap in a whole new log; the next flush rewrites the file."""
+        with self._lock:
+            self._data = data
+            self._totals = {d: _sum_entries(entries) for d, entries in data.items()}
+            self._mark_rewritten_locked()
+
+    def update(self, mutate):
+        """
+        Apply an edit to the pinned log under the lock.
+        `mutate` receives a shallow copy of the log, assigns new lists for
+        the dates it changes (never editing the old ones in place) and
+        returns those dates. Only their totals are recomputed.
+        Returns:
+            bool: True if any date changed.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            data = dict(self._data)
+            changed_dates = tuple(mutate(data) or ())
+            if not changed_dates:
+                return False
+            totals = dict(self._totals)
+            for date_str in changed_dates:
+                if date_str in data:
+                    totals[date_str] = _sum_entries(data[date_str])
+                else:
+                    totals.pop(date_str, None)
+            self._data, self._totals = data, totals
+            self._mark_rewritten_locked()
+            return True
+
+    def _mark_rewritten_locked(self):
+        self._dirty_count += 1
+        self.version += 1
+        self._flush_locked(force=False)
+
+    def flush(self, force=True):
+        with self._lock:
+            self._flush_locked(force)
+
+    def _flush_locked(self, force):
+        if not self._dirty_count or (not force and self._dirty_count < self.flush_every):
+            return
+        self._write_all(self._data)
+        self._dirty_count = 0
+        self._mtime = self._file_mtime()
+
+
+_STORE = WaterStore(WATER_LOG_FILE, LEGACY_WATER_LOG_FILE)
+atexit.register(_STORE.flush)
+
+
 # Load water log from file
 def load_water_log():
     """
-    Load water log data from JSON file.
+    Load water log data from the JSONL file.
+    The parsed dict is pinned in memory and shared between callers; treat
+    it as read-only and change the log through the helpers below.
     Returns:
         dict: Water log data with dates as keys.
     """
-    if not os.path.exists(WATER_LOG_FILE):
-        return {}
-    with open(WATER_LOG_FILE, 'r') as f:
-        return json.load(f)
+    return _STORE.load()
+
+
+def get_daily_totals():
+    """
+    Get the total intake for every logged date.
+    The rollup is built once per load and kept up to date on every write,
+    so aggregate queries cost O(days) rather than O(entries).
+    Returns:
+        dict: Date strings mapped to total ml; treat as read-only.
+    """
+    return _STORE.totals()
 
 
 # Save water log to file
 def save_water_log(data):
     """
-    Save water log data to JSON file.
+    Replace the whole water log; the file is rewritten on the next flush.
     Args:
-        data (dict): Water log data to save.
+        data (dict): Water log data to save; the store takes ownership of it.
+    """
+    _STORE.replace(data)
+
+
+def flush_water_log():
+    """
+    Write any buffered water log changes to disk now.
     """
-    with open(WATER_LOG_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    _STORE.flush()
+
+
+def _append_entry(date_str, entry):
+    _STORE.append(date_str, entry)
+
+
+def compact_log():
+    """
+    Rewrite the log with entries grouped by date in date order.
+    Appends land in logging order, so backdated entries end up away from the
+    rest of their day; edits and deletes already rewrite the file in place.
+    """
+    data = load_water_log()
+    save_water_log({date_str: data[date_str] for date_str in sorted(data)})
+    flush_water_log()
 
 
 def backup_water_log():
@@ -178,6 +445,7 @@ def backup_water_log():
         str: Path to backup file, or None if backup failed.
     """
     try:
+        flush_water_log()
         if not os.path.exists(WATER_LOG_FILE):
             return None
         
@@ -204,9 +472,7 @@ def get_today_entries():
     Returns:
         list: List of entry dictionaries for today.
     """
-    data = load_water_log()
-    today = today_str()
-    return data.get(today, [])
+    return get_entries_for_date(today_str())
 
 
 def get_entries_for_date(date_str):
@@ -217,8 +483,7 @@ def get_entries_for_date(date_str):
     Returns:
         list: List of entry dictionaries for that date.
     """
-    data = load_water_log()
-    return data.get(date_str, [])
+    return _STORE.entries_for(date_str)
 
 
 # Delete a specific water intake entry by its timestamp
@@ -230,16 +495,7 @@ def delete_water_intake_entry(timestamp):
     Returns:
         bool: True if deleted successfully, False otherwise.
     """
-    data = load_water_log()
-    today = today_str()
-    if today in data:
-        original_count = len(data[today])
-        data[today] = [entry for entry in data[today] if entry['timestamp'] != timestamp]
-        
-        if len(data[today]) < original_count:
-            save_water_log(data)
-            return True
-    return False
+    return delete_entry_for_date(today_str(), timestamp)
 
 
 def delete_entry_for_date(date_str, timestamp):
@@ -251,15 +507,20 @@ def delete_entry_for_date(date_str, timestamp):
     Returns:
         bool: True if deleted successfully, False otherwise.
     """
-    data = load_water_log()
-    if date_str in data:
-        original_count = len(data[date_str])
-        data[date_str] = [entry for entry in data[date_str] if entry['timestamp'] != timestamp]
-        
-        if len(data[date_str]) < original_count:
-            save_water_log(data)
-            return True
-    return False
+    def mutate(data):
+        entries = data.get(date_str)
+        if entries is None:
+            return ()
+        kept = [entry for entry in entries if entry['timestamp'] != timestamp]
+        if len(kept) == len(entries):
+            return ()
+        if kept:
+            data[date_str] = kept
+        else:
+            # JSONL has no lines for an emptied day, so drop it in memory too
+            del data[date_str]
+        return (date_str,)
+    return _STORE.update(mutate)
 
 
 def delete_all_entries_for_date(date_str):
@@ -270,47 +531,50 @@ def delete_all_entries_for_date(date_str):
     Returns:
         bool: True if deleted successfully, False if date not found.
     """
-    data = load_water_log()
-    if date_str in data:
-        del data[date_str]
-        save_water_log(data)
-        return True
-    return False
+    def mutate(data):
+        return (date_str,) if data.pop(date_str, None) is not None else ()
+    return _STORE.update(mutate)
 
 
 # Get water intake data for a specific month
-def get_monthly_data(year, month):
+def get_monthly_data(year, month, totals=None):
     """
     Get water intake totals for each day in a specific month.
     Args:
         year (int): Year (e.g., 2025).
         month (int): Month (1-12).
+        totals (dict, optional): Daily totals from get_daily_totals(); loaded
+            when omitted so a caller can share one snapshot across queries.
     Returns:
         dict: Dictionary with date strings as keys and totals (ml) as values.
     """
-    data = load_water_log()
-    month_data = {}
+    if totals is None:
+        totals = get_daily_totals()
     num_days = calendar.monthrange(year, month)[1]
+    month_data = {}
     for day in range(1, num_days + 1):
         date_str = f"{year}-{month:02d}-{day:02d}"
-        total = sum(entry['amount_ml'] for entry in data.get(date_str, []))
-        month_data[date_str] = total
+        month_data[date_str] = totals.get(date_str, 0)
     return month_data
 
 
-def get_monthly_statistics(year, month):
+def get_monthly_statistics(year, month, totals=None):
     """
     Get comprehensive statistics for a specific month.
     Args:
         year (int): Year (e.g., 2025).
         month (int): Month (1-12).
+        totals (dict, optional): Daily totals from get_daily_totals(); loaded
+            when omitted so a caller can share one snapshot across queries.
     Returns:
         dict: Statistics including total, average, best/worst days.
     """
-    month_data = get_monthly_data(year, month)
-    totals = [amount for amount in month_data.values() if amount > 0]
+    month_data = get_monthly_data(year, month, totals=totals)
+    dates = list(month_data)
+    amounts = _totals_array(month_data.values())
+    logged = np.flatnonzero(amounts > 0)
     
-    if not totals:
+    if not logged.size:
         return {
             'total': 0,
             'average': 0,
@@ -319,15 +583,16 @@ def get_monthly_statistics(year, month):
             'days_logged': 0
         }
     
-    best_date = max(month_data.items(), key=lambda x: x[1])
-    worst_date = min((item for item in month_data.items() if item[1] > 0), key=lambda x: x[1])
+    best = int(amounts.argmax())
+    worst = int(logged[amounts[logged].argmin()])
+    total = amounts[logged].sum().item()
     
     return {
-        'total': sum(totals),
-        'average': round(sum(totals) / len(totals), 2),
-        'best_day': {'date': best_date[0], 'amount': best_date[1]},
-        'worst_day': {'date': worst_date[0], 'amount': worst_date[1]},
-        'days_logged': len(totals),
+        'total': total,
+        'average': round(total / logged.size, 2),
+        'best_day': {'date': dates[best], 'amount': amounts[best].item()},
+        'worst_day': {'date': dates[worst], 'amount': amounts[worst].item()},
+        'days_logged': int(logged.size),
         'days_in_month': len(month_data)
     }
 
@@ -342,15 +607,7 @@ def edit_water_intake_entry(timestamp, new_amount_ml):
     Returns:
         bool: True if edited successfully, False otherwise.
     """
-    data = load_water_log()
-    today = today_str()
-    if today in data:
-        for entry in data[today]:
-            if entry['timestamp'] == timestamp:
-                entry['amount_ml'] = new_amount_ml
-                save_water_log(data)
-                return True
-    return False
+    return edit_entry_for_date(today_str(), timestamp, new_amount_ml)
 
 
 def edit_entry_for_date(date_str, timestamp, new_amount_ml, new_note=None):
@@ -364,108 +621,145 @@ def edit_entry_for_date(date_str, timestamp, new_amount_ml, new_note=None):
     Returns:
         bool: True if edited successfully, False otherwise.
     """
-    data = load_water_log()
-    if date_str in data:
-        for entry in data[date_str]:
+    def mutate(data):
+        entries = data.get(date_str, ())
+        for i, entry in enumerate(entries):
             if entry['timestamp'] == timestamp:
-                entry['amount_ml'] = new_amount_ml
+                edited = {**entry, 'amount_ml': new_amount_ml}
                 if new_note is not None:
-                    entry['note'] = new_note
-                save_water_log(data)
-                return True
-    return False
+                    edited['note'] = new_note
+                data[date_str] = [*entries[:i], edited, *entries[i + 1:]]
+                return (date_str,)
+        return ()
+    return _STORE.update(mutate)
 
 
 # Get water intake totals for the last N days (returns list of (date, total_ml))
-def get_last_n_days_totals(n=7):
+def get_last_n_days_totals(n=7, totals=None):
     """
     Get water intake totals for the last N days.
     Args:
         n (int): Number of days to retrieve.
+        totals (dict, optional): Daily totals from get_daily_totals(); loaded
+            when omitted so a caller can share one snapshot across queries.
     Returns:
         list: List of tuples (date_str, total_ml) for the last N days.
     """
-    data = load_water_log()
-    today = datetime.date.today()
-    days = [(today - datetime.timedelta(days=i)).isoformat() for i in range(n-1, -1, -1)]
-    return [(d, sum(e['amount_ml'] for e in data.get(d, []))) for d in days]
+    if totals is None:
+        totals = get_daily_totals()
+    # Oldest first: today minus n-1 ... 0 days, formatted as YYYY-MM-DD in one go
+    days = (np.datetime64(datetime.date.today(), 'D') - np.arange(n - 1, -1, -1)).astype(str).tolist()
+    return [(d, totals.get(d, 0)) for d in days]
+
+
+# Streak results for the pinned log; dropped whenever the store's version moves
+_STREAK_MEMO = {'version': None, 'results': {}}
+
+
+def _streak_memo_key(totals, *parts):
+    """Memo key for a streak query, or None if `totals` is not the pinned rollup."""
+    version = _STORE.version_of(totals)
+    if version is None:
+        return None
+    if _STREAK_MEMO['version'] != version:
+        _STREAK_MEMO['version'] = version
+        _STREAK_MEMO['results'] = {}
+    return parts
 
 
-def get_streak_count(daily_goal_ml=2000):
+def get_streak_count(daily_goal_ml=2000, totals=None):
     """
     Get current streak of consecutive days meeting the daily goal.
     Args:
         daily_goal_ml (int): Daily water intake goal in ml.
+        totals (dict, optional): Daily totals from get_daily_totals(); loaded
+            when omitted so a caller can share one snapshot across queries.
     Returns:
         int: Number of consecutive days meeting goal (including today).
     """
-    data = load_water_log()
+    if totals is None:
+        totals = get_daily_totals()
     today = datetime.date.today()
+    memo_key = _streak_memo_key(totals, 'current', daily_goal_ml, today)
+    if memo_key in _STREAK_MEMO['results']:
+        return _STREAK_MEMO['results'][memo_key]
     streak = 0
     
-    for i in range(365):  # Check up to 1 year back
-        date_str = (today - datetime.timedelta(days=i)).isoformat()
-        daily_total = sum(entry['amount_ml'] for entry in data.get(date_str, []))
-        
-        if daily_total >= daily_goal_ml:
-            streak += 1
-        else:
+    # Walk the logged days backwards from today; the first gap or short day ends
+    # the streak, so only the streak's own days are visited
+    expected = today
+    for date_str in sorted(totals, reverse=True):
+        if date_str > today.isoformat():
+            continue
+        if streak == 365 or date_str != expected.isoformat():  # Check up to 1 year back
             break
+        if totals[date_str] < daily_goal_ml:
+            break
+        streak += 1
+        expected -= datetime.timedelta(days=1)
     
+    if memo_key is not None:
+        _STREAK_MEMO['results'][memo_key] = streak
     return streak
 
 
-def get_longest_streak(daily_goal_ml=2000):
+def get_longest_streak(daily_goal_ml=2000, totals=None):
     """
     Get the longest streak of consecutive days meeting the daily goal.
     Args:
         daily_goal_ml (int): Daily water intake goal in ml.
+        totals (dict, optional): Daily totals from get_daily_totals(); loaded
+            when omitted so a caller can share one snapshot across queries.
     Returns:
         dict: Dictionary with 'length', 'start_date', and 'end_date'.
     """
-    data = load_water_log()
-    if not data:
+    if totals is None:
+        totals = get_daily_totals()
+    memo_key = _streak_memo_key(totals, 'longest', daily_goal_ml)
+    if memo_key in _STREAK_MEMO['results']:
+        return dict(_STREAK_MEMO['results'][memo_key])
+    result = _longest_streak(totals, daily_goal_ml)
+    if memo_key is not None:
+        _STREAK_MEMO['results'][memo_key] = result
+    return dict(result)
+
+
+def _longest_streak(totals, daily_goal_ml):
+    if not totals:
         return {'length': 0, 'start_date': None, 'end_date': None}
     
     # Get all dates sorted
-    sorted_dates = sorted(data.keys())
+    sorted_dates = sorted(totals)
+    met = _totals_array(totals[d] for d in sorted_dates) >= daily_goal_ml
     
-    max_streak = 0
-    current_streak = 0
-    streak_start = None
-    max_streak_start = None
-    max_streak_end = None
-    
-    for date_str in sorted_dates:
-        daily_total = sum(entry['amount_ml'] for entry in data.get(date_str, []))
-        
-        if daily_total >= daily_goal_ml:
-            if current_streak == 0:
-                streak_start = date_str
-            current_streak += 1
-            
-            if current_streak > max_streak:
-                max_streak = current_streak
-                max_streak_start = streak_start
-                max_streak_end = date_str
-        else:
-            current_streak = 0
-            streak_start = None
+    # Pad with False so every run of met days has a +1 edge at its start and
+    # a -1 edge just past its end.
+    edges = np.diff(np.concatenate(([0], met.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    if not starts.size:
+        return {'length': 0, 'start_date': None, 'end_date': None}
+    lengths = np.flatnonzero(edges == -1) - starts
+    longest = int(lengths.argmax())
+    start = int(starts[longest])
+    length = int(lengths[longest])
     
     return {
-        'length': max_streak,
-        'start_date': max_streak_start,
-        'end_date': max_streak_end
+        'length': length,
+        'start_date': sorted_dates[start],
+        'end_date': sorted_dates[start + length - 1]
     }
 
 
-def get_weekly_summary():
+def get_weekly_summary(totals=None):
     """
     Get a summary of the current week's water intake.
+    Args:
+        totals (dict, optional): Daily totals from get_daily_totals(); loaded
+            when omitted so a caller can share one snapshot across queries.
     Returns:
         dict: Weekly statistics including total, average, and daily breakdown.
     """
-    data = get_last_n_days_totals(7)
+    data = get_last_n_days_totals(7, totals=totals)
     totals = [amount for _, amount in data]
     
     return {
@@ -478,13 +772,22 @@ def get_weekly_summary():
     }
 
 
-def get_all_time_statistics():
+def get_all_time_statistics(data=None, totals=None):
     """
     Get all-time statistics for water intake.
+    Args:
+        data (dict, optional): Water log from load_water_log(); loaded when omitted.
+        totals (dict, optional): Daily totals from get_daily_totals(); loaded
+            when omitted so a caller can share one snapshot across queries.
     Returns:
         dict: Comprehensive statistics including total days, total intake, etc.
     """
-    data = load_water_log()
+    if data is None:
+        data = load_water_log()
+        if totals is None:
+            totals = get_daily_totals()
+    elif totals is None:
+        totals = {d: _sum_entries(entries) for d, entries in data.items()}
     
     if not data:
         return {
@@ -495,16 +798,26 @@ def get_all_time_statistics():
             'total_entries': 0
         }
     
-    all_totals = []
+    # One pass folds every aggregate; the daily sums come from the rollup
+    total_intake = 0
+    days_logged = 0
+    best_date, best_amount = None, 0
     total_entries = 0
-    
+    first_date = last_date = None
     for date_str, entries in data.items():
-        daily_total = sum(entry['amount_ml'] for entry in entries)
-        if daily_total > 0:
-            all_totals.append((date_str, daily_total))
         total_entries += len(entries)
+        if first_date is None or date_str < first_date:
+            first_date = date_str
+        if last_date is None or date_str > last_date:
+            last_date = date_str
+        daily_total = totals[date_str]
+        if daily_total > 0:
+            total_intake += daily_total
+            days_logged += 1
+            if daily_total > best_amount:
+                best_date, best_amount = date_str, daily_total
     
-    if not all_totals:
+    if not days_logged:
         return {
             'total_days_logged': 0,
             'total_intake': 0,
@@ -513,16 +826,33 @@ def get_all_time_statistics():
             'total_entries': 0
         }
     
-    best_day = max(all_totals, key=lambda x: x[1])
-    
     return {
-        'total_days_logged': len(all_totals),
-        'total_intake': sum(amount for _, amount in all_totals),
-        'average_per_day': round(sum(amount for _, amount in all_totals) / len(all_totals), 2),
-        'best_day': {'date': best_day[0], 'amount': best_day[1]},
+        'total_days_logged': days_logged,
+        'total_intake': total_intake,
+        'average_per_day': round(total_intake / days_logged, 2),
+        'best_day': {'date': best_date, 'amount': best_amount},
         'total_entries': total_entries,
-        'first_logged_date': min(data.keys()),
-        'last_logged_date': max(data.keys())
+        'first_logged_date': first_date,
+        'last_logged_date': last_date
+    }
+
+
+def dashboard_summary(days=30):
+    """
+    Gather what the water tracker dashboard shows from one snapshot.
+    The log and its daily totals are fetched once and passed to each query.
+    Args:
+        days (int): Number of trailing days to include in 'last_n_days'.
+    Returns:
+        dict: Today's total and entries, and trailing daily totals.
+    """
+    data = load_water_log()
+    totals = get_daily_totals()
+    today = today_str()
+    return {
+        'today_total': totals.get(today, 0),
+        'today_entries': data.get(today, []),
+        'last_n_days': get_last_n_days_totals(days, totals=totals),
     }
 
 
@@ -573,17 +903,12 @@ def get_hydration_reminder_times(wake_time="07:00", sleep_time="23:00", interval
     wake_hour, wake_min = map(int, wake_time.split(':'))
     sleep_hour, sleep_min = map(int, sleep_time.split(':'))
     
-    wake_dt = datetime.datetime.combine(datetime.date.today(), datetime.time(wake_hour, wake_min))
-    sleep_dt = datetime.datetime.combine(datetime.date.today(), datetime.time(sleep_hour, sleep_min))
+    # Work in minutes since midnight; no datetime objects needed to format HH:MM
+    start = wake_hour * 60 + wake_min
+    end = sleep_hour * 60 + sleep_min
+    step = round(interval_hours * 60)
     
-    reminders = []
-    current_time = wake_dt
-    
-    while current_time < sleep_dt:
-        reminders.append(current_time.strftime("%H:%M"))
-        current_time += datetime.timedelta(hours=interval_hours)
-    
-    return reminders
+    return [f"{t // 60:02d}:{t % 60:02d}" for t in range(start, end, step)]
 
 
 def export_data_to_csv(output_file='water_intake_export.csv'):
@@ -596,20 +921,21 @@ def export_data_to_csv(output_file='water_intake_export.csv'):
     """
     try:
         import csv
+        import io
         data = load_water_log()
+        rows = [
+            (date_str, entry.get('timestamp', ''), entry.get('amount_ml', 0), entry.get('note', ''))
+            for date_str, entries in sorted(data.items())
+            for entry in entries
+        ]
         
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
+        # A 1 MiB buffer turns a multi-year export into a handful of write syscalls
+        with open(output_file, 'wb', buffering=0) as raw, \
+                io.BufferedWriter(raw, buffer_size=1 << 20) as buffered, \
+                io.TextIOWrapper(buffered, encoding='utf-8', newline='') as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(['Date', 'Timestamp', 'Amount (ml)', 'Note'])
-            
-            for date_str in sorted(data.keys()):
-                for entry in data[date_str]:
-                    writer.writerow([
-                        date_str,
-                        entry.get('timestamp', ''),
-                        entry.get('amount_ml', 0),
-                        entry.get('note', '')
-                    ])
+            writer.writerows(rows)
         
         return True
     except Exception as e:
@@ -617,39 +943,62 @@ def export_data_to_csv(output_file='water_intake_export.csv'):
         return False
 
 
-def import_data_from_csv(input_file='water_intake_export.csv'):
+def import_data_from_csv(input_file='water_intake_export.csv', mode='append'):
     """
     Import water intake data from a CSV file.
     Args:
         input_file (str): Path to the input CSV file.
+        mode (str): 'append' adds the rows to the existing log; 'replace'
+            discards the existing log without loading it.
     Returns:
         bool: True if import successful, False otherwise.
     """
     try:
         import csv
-        data = load_water_log()
+        if mode not in ('append', 'replace'):
+            raise ValueError(f"unknown import mode: {mode!r}")
         
+        # Rows are collected separately so a bad row leaves the log untouched
+        imported = {}
+        # Rows without a timestamp all get the import time, read once
+        now_iso = datetime.datetime.now().isoformat()
         with open(input_file, 'r', encoding='utf-8') as csvfile:
             reader = csv.DictReader(csvfile)
             
             for row in reader:
-                date_str = row['Date']
-                if date_str not in data:
-                    data[date_str] = []
-                
-                data[date_str].append({
+                imported.setdefault(row['Date'], []).append({
                     'amount_ml': float(row['Amount (ml)']),
-                    'timestamp': row['Timestamp'],
+                    'timestamp': row.get('Timestamp') or now_iso,
                     'note': row.get('Note', '')
                 })
         
-        save_water_log(data)
+        if mode == 'replace':
+            save_water_log(imported)
+        else:
+            def mutate(data):
+                for date_str, entries in imported.items():
+                    data[date_str] = data.get(date_str, []) + entries
+                return imported.keys()
+            _STORE.update(mutate)
         return True
     except Exception as e:
         print(f"Import failed: {e}")
         return False
 
 
+# Intake adjustments used by calculate_recommended_intake()
+ACTIVITY_MULTIPLIERS = MappingProxyType({
+    'sedentary': 1.0,
+    'moderate': 1.15,
+    'active': 1.3
+})
+CLIMATE_ADDITIONS_ML = MappingProxyType({
+    'cold': 0,
+    'temperate': 200,
+    'hot': 500
+})
+
+
 def calculate_recommended_intake(weight_kg=70, activity_level='moderate', climate='temperate'):
     """
     Calculate recommended daily water intake based on personal factors.
@@ -664,24 +1013,24 @@ def calculate_recommended_intake(weight_kg=70, activity_level='moderate', climat
     base_intake = weight_kg * 33
     
     # Adjust for activity level
-    activity_multipliers = {
-        'sedentary': 1.0,
-        'moderate': 1.15,
-        'active': 1.3
-    }
-    base_intake *= activity_multipliers.get(activity_level, 1.0)
+    base_intake *= ACTIVITY_MULTIPLIERS.get(activity_level, 1.0)
     
     # Adjust for climate
-    climate_additions = {
-        'cold': 0,
-        'temperate': 200,
-        'hot': 500
-    }
-    base_intake += climate_additions.get(climate, 200)
+    base_intake += CLIMATE_ADDITIONS_ML.get(climate, 200)
     
     return int(base_intake)
 
 
+# Time-of-day bucket for each hour 0-23
+_HOUR_PERIODS = tuple(
+    'morning' if 5 <= hour < 12 else
+    'afternoon' if 12 <= hour < 17 else
+    'evening' if 17 <= hour < 21 else
+    'night'
+    for hour in range(24)
+)
+
+
 def get_intake_by_time_of_day():
     """
     Get water intake breakdown by time of day (morning, afternoon, evening, night).
@@ -699,18 +1048,10 @@ def get_intake_by_time_of_day():
     
     for entry in entries:
         try:
-            timestamp = datetime.datetime.fromisoformat(entry['timestamp'])
-            hour = timestamp.hour
-            
-            if 5 <= hour < 12:
-                periods['morning'] += entry['amount_ml']
-            elif 12 <= hour < 17:
-                periods['afternoon'] += entry['amount_ml']
-            elif 17 <= hour < 21:
-                periods['evening'] += entry['amount_ml']
-            else:
-                periods['night'] += entry['amount_ml']
-        except:
+            # ISO timestamps carry the hour at [11:13]; no datetime object needed
+            period = _HOUR_PERIODS[int(entry['timestamp'][11:13])]
+            periods[period] += entry['amount_ml']
+        except (KeyError, TypeError, ValueError, IndexError):
             continue
     
     return periods
@@ -724,15 +1065,14 @@ def clear_old_data(days_to_keep=90):
     Returns:
         int: Number of days deleted.
     """
-    data = load_water_log()
     cutoff_date = (datetime.date.today() - datetime.timedelta(days=days_to_keep)).isoformat()
+    dates_to_delete = []
     
-    dates_to_delete = [date for date in data.keys() if date < cutoff_date]
-    
-    for date in dates_to_delete:
-        del data[date]
-    
-    if dates_to_delete:
-        save_water_log(data)
+    def mutate(data):
+        dates_to_delete.extend(date for date in data if date < cutoff_date)
+        for date in dates_to_delete:
+            del data[date]
+        return dates_to_delete
     
+    _STORE.update(mutate)
     return len(dates_to_delete)
\ No newline at end of file
@@ -28,11 +28,11 @@ def set_page_theme_and_style():
     selected_palette = st.session_state.get("palette_name", "Pink")
 
     palette_map = {
-        "light": "static_files/pink.png", "calm blue": "static_files/blue.png",
-        "mint": "static_files/mint.png", "lavender": "static_files/lavender.png",
-        "pink": "static_files/pink.png"
+        "light": "static/pink.png", "calm blue": "static/blue.png",
+        "mint": "static/mint.png", "lavender": "static/lavender.png",
+        "pink": "static/pink.png"
     }
-    background_image_path = "static_files/dark.png" if is_dark else palette_map.get(selected_palette.lower(), "static_files/pink.png")
+    background_image_path = "static/dark.png" if is_dark else palette_map.get(selected_palette.lower(), "static/pink.png")
     encoded_string = get_base64_of_bin_file(background_image_path)
 
     st.markdown(f'''
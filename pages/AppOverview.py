@@ -11,7 +11,7 @@ def set_page_theme_and_style():
     selected_palette = st.session_state.get("palette_name", "Pink")
 
     try:
-        with open(f"static_files/{'dark.png' if is_dark else selected_palette.lower() + '.png'}", "rb") as f:
+        with open(f"static/{'dark.png' if is_dark else selected_palette.lower() + '.png'}", "rb") as f:
             encoded_string = base64.b64encode(f.read()).decode()
     except FileNotFoundError:
         encoded_string = ""
@@ -21,18 +21,18 @@ def set_background_for_theme(selected_palette="pink"):
 
     # --- Map light themes to background images ---
     palette_color = {
-        "light": "static_files/pink.png",
-        "calm blue": "static_files/blue.png",
-        "mint": "static_files/mint.png",
-        "lavender": "static_files/lavender.png",
-        "pink": "static_files/pink.png"
+        "light": "static/pink.png",
+        "calm blue": "static/blue.png",
+        "mint": "static/mint.png",
+        "lavender": "static/lavender.png",
+        "pink": "static/pink.png"
     }
 
     # --- Select background based on theme ---
     if is_dark:
-        background_image_path = "static_files/dark.png"
+        background_image_path = "static/dark.png"
     else:
-        background_image_path = palette_color.get(selected_palette.lower(), "static_files/pink.png")
+        background_image_path = palette_color.get(selected_palette.lower(), "static/pink.png")
 
     encoded_string = get_base64_of_bin_file(background_image_path)
     st.markdown(
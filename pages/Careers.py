@@ -1,40 +1,32 @@
 import streamlit as st
 import os
+import json
+import shutil
 from datetime import datetime
 import base64
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _dumps(obj):
+    """Serialize obj to JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+@st.cache_data(show_spinner=False)
 def get_base64_of_bin_file(image_path):
     with open(image_path, "rb") as f:
         return base64.b64encode(f.read()).decode()
 
-def set_background_for_theme(selected_palette="pink"):
-    from core.theme import get_current_theme
-
-    # --- Get current theme info ---
-    current_theme = st.session_state.get("current_theme", None)
-    if not current_theme:
-        current_theme = get_current_theme()
-    
-    is_dark = current_theme["name"] == "Dark"
-
-    # --- Map light themes to background images ---
-    palette_color = {
-        "light": "static_files/pink.png",
-        "calm blue": "static_files/blue.png",
-        "mint": "static_files/mint.png",
-        "lavender": "static_files/lavender.png",
-        "pink": "static_files/pink.png"
-    }
-
-    # --- Select background based on theme ---
-    if is_dark:
-        background_image_path = "static_files/dark.png"
-    else:
-        background_image_path = palette_color.get(selected_palette.lower(), "static_files/pink.png")
-
-    encoded_string = get_base64_of_bin_file(background_image_path)
-    st.markdown(
-        f"""
+@st.cache_data(show_spinner=False)
+def _build_background_css(image_path, is_dark):
+    """Build the background <style> block once per (image, theme) pair."""
+    encoded_string = get_base64_of_bin_file(image_path)
+    return f"""
         <style>
         /* Entire app background */
         html, body, [data-testid="stApp"] {{
@@ -72,9 +64,46 @@ def set_background_for_theme(selected_palette="pink"):
             display: none !important;
         }}
         </style>
-        """,
-        unsafe_allow_html=True
-    )
+        """
+
+def set_background_for_theme(selected_palette="pink"):
+    from core.theme import get_current_theme
+
+    # --- Get current theme info ---
+    current_theme = st.session_state.get("current_theme", None)
+    if not current_theme:
+        current_theme = get_current_theme()
+    
+    is_dark = current_theme["name"] == "Dark"
+
+    # --- Map light themes to background images ---
+    palette_color = {
+        "light": "static/pink.png",
+        "calm blue": "static/blue.png",
+        "mint": "static/mint.png",
+        "lavender": "static/lavender.png",
+        "pink": "static/pink.png"
+    }
+
+    # --- Select background based on theme ---
+    if is_dark:
+        background_image_path = "static/dark.png"
+    else:
+        background_image_path = palette_color.get(selected_palette.lower(), "static/pink.png")
+
+    st.markdown(_build_background_css(background_image_path, is_dark), unsafe_allow_html=True)
+
+# --- Job openings (role -> icon), rendered once into a single HTML block ---
+OPENINGS = {
+    "Community Manager": "🤝",
+    "Content Writer (Mental Health)": "✍️",
+    "Full Stack Developer": "💻",
+    "UI/UX Designer": "🎨"
+}
+OPENING_ROLES = tuple(OPENINGS)
+OPENINGS_HTML = "".join(
+    f"<div class='opening-item'><span>{icon}</span>{role}</div>" for role, icon in OPENINGS.items()
+)
 
 # ✅ Set your background image
 selected_palette = st.session_state.get("palette_name", "Pink")
@@ -143,15 +172,7 @@ def show():
     # --- Job Listings ---
     st.subheader("📌 Current Openings")
 
-    openings = {
-        "Community Manager": "🤝",
-        "Content Writer (Mental Health)": "✍️",
-        "Full Stack Developer": "💻",
-        "UI/UX Designer": "🎨"
-    }
-
-    for role, icon in openings.items():
-        st.markdown(f"<div class='opening-item'><span>{icon}</span>{role}</div>", unsafe_allow_html=True)
+    st.markdown(OPENINGS_HTML, unsafe_allow_html=True)
 
     st.divider()
 
@@ -161,7 +182,7 @@ def show():
     with st.form("application_form", clear_on_submit=True):
         name = st.text_input("Full Name")
         email = st.text_input("Email Address")
-        position = st.selectbox("Position", options=list(openings.keys()))
+        position = st.selectbox("Position", options=OPENING_ROLES)
         resume = st.file_uploader("Upload Your Resume", type=["pdf", "docx"])
         cover_letter = st.text_area("Cover Letter (Optional)")
 
@@ -170,24 +191,26 @@ def show():
         if submitted:
             if name and email and position and resume:
                 # Save application data
-                if not os.path.exists("data/applications"):
-                    os.makedirs("data/applications")
-
                 timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
                 folder_name = f"{name.replace(' ', '_')}_{timestamp}"
                 application_dir = f"data/applications/{folder_name}"
-                os.makedirs(application_dir)
-
-                # Save resume
-                with open(os.path.join(application_dir, resume.name), "wb") as f:
-                    f.write(resume.getbuffer())
-
-                # Save other details
-                with open(os.path.join(application_dir, "application.txt"), "w") as f:
-                    f.write(f"Name: {name}\n")
-                    f.write(f"Email: {email}\n")
-                    f.write(f"Position: {position}\n")
-                    f.write(f"Cover Letter:\n{cover_letter}")
+                os.makedirs(application_dir, exist_ok=True)
+
+                # Save resume, copied in 1 MiB chunks
+                resume.seek(0)
+                with open(os.path.join(application_dir, os.path.basename(resume.name)), "wb") as f:
+                    shutil.copyfileobj(resume, f, length=1 << 20)
+
+                # Save other details as one JSON document
+                with open(os.path.join(application_dir, "application.json"), "wb") as f:
+                    f.write(_dumps({
+                        "name": name,
+                        "email": email,
+                        "position": position,
+                        "cover_letter": cover_letter,
+                        "resume": os.path.basename(resume.name),
+                        "submitted_at": timestamp,
+                    }))
 
                 st.success("🎉 Your application has been submitted successfully!")
             else:
@@ -1,92 +1,68 @@
 import streamlit as st
 import re
-import base64
+import os
+import mmap
+import binascii
+from types import MappingProxyType
+from core.theme import get_current_theme
 
-def get_base64_of_bin_file(image_path):
-    with open(image_path, "rb") as f:
-        return base64.b64encode(f.read()).decode()
-
-def set_background_for_theme(selected_palette="pink"):
-    from core.theme import get_current_theme
+# Compiled once at import; only consulted by _valid_email(strict=True)
+EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
-    # --- Get current theme info ---
-    current_theme = st.session_state.get("current_theme", None)
-    if not current_theme:
-        current_theme = get_current_theme()
-    
-    is_dark = current_theme["name"] == "Dark"
+_ASCII_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_ALLOWED_DOMAIN = _ASCII_LETTERS | frozenset("0123456789.-")
+_ALLOWED_LOCAL = _ALLOWED_DOMAIN | frozenset("_%+")
 
-    # --- Map light themes to background images ---
-    palette_color = {
-        "light": "static_files/pink.png",
-        "calm blue": "static_files/blue.png",
-        "mint": "static_files/mint.png",
-        "lavender": "static_files/lavender.png",
-        "pink": "static_files/pink.png"
-    }
+def _valid_email(email: str, strict: bool = False) -> bool:
+    """Validate an address with string splits and charset checks instead of a regex.
 
-    # --- Select background based on theme ---
-    if is_dark:
-        background_image_path = "static_files/dark.png"
-    else:
-        background_image_path = palette_color.get(selected_palette.lower(), "static_files/pink.png")
+    Accepts what EMAIL_RE does (minus a trailing newline, which its "$" lets through);
+    pass strict=True to run the regex itself.
+    """
+    if strict:
+        return EMAIL_RE.match(email) is not None
+    local, _, domain = email.partition("@")
+    host, _, tld = domain.rpartition(".")
+    return (
+        bool(local) and bool(host) and len(tld) >= 2
+        and set(local) <= _ALLOWED_LOCAL
+        and set(host) <= _ALLOWED_DOMAIN
+        and set(tld) <= _ASCII_LETTERS
+    )
 
-    encoded_string = get_base64_of_bin_file(background_image_path)
-    st.markdown(
-        f"""
-        <style>
-        /* Entire app background */
-        html, body, [data-testid="stApp"] {{
-            background-image: url("data:image/png;base64,{encoded_string}");
-            background-size: cover;
-            background-position: center;
-            background-repeat: no-repeat;
-            background-attachment: fixed;
-        }}
+@st.cache_data(show_spinner=False)
+def get_base64_of_bin_file(image_path):
+    with open(image_path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return ""  # mmap cannot map an empty file
+        # Encode straight from the page cache instead of copying into a bytes object first
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return binascii.b2a_base64(mm, newline=False).decode("ascii")
 
+# Theme-independent rules for the whole page, newsletter cards included; only
+# the background image and text colours below vary with the theme
+_STATIC_CSS = """
         /* Main content transparency */
-        .block-container {{
+        .block-container {
             background-color: rgba(255, 255, 255, 0);
-        }}
+        }
 
         /* Sidebar: brighter translucent background */
-        [data-testid="stSidebar"] {{
+        [data-testid="stSidebar"] {
             background-color: rgba(255, 255, 255, 0.6);  /* Brighter and translucent */
-            color: {'black' if is_dark else 'rgba(49, 51, 63, 0.8)'} ;  /* Adjusted for light background */
-        }}
-
-        span {{
-            color: {'#f0f0f0' if is_dark else 'rgba(49, 51, 63, 0.8)'} !important;
-            transition: color 0.3s ease;
-        }}
+        }
 
         /* Header bar: fully transparent */
-        [data-testid="stHeader"] {{
+        [data-testid="stHeader"] {
             background-color: rgba(0, 0, 0, 0);
-        }}
+        }
 
         /* Hide left/right arrow at sidebar bottom */
         button[title="Close sidebar"],
-        button[title="Open sidebar"] {{
+        button[title="Open sidebar"] {
             display: none !important;
-        }}
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
-
-# ✅ Set your background image
-selected_palette = st.session_state.get("palette_name", "Pink")
-set_background_for_theme(selected_palette)
-
-def newsletter_signup_form():
-    """Displays the newsletter signup form and handles submission."""
-
-    EMAIL_REGEX = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+        }
 
-    # Custom CSS styling
-    st.markdown("""
-        <style>
         .newsletter-container {
             text-align: center;
             padding: 2rem 1rem;
@@ -124,8 +100,129 @@ def newsletter_signup_form():
             transform: translateY(-4px);
             box-shadow: 0 4px 12px rgba(0,0,0,0.1);
         }
+"""
+
+@st.cache_resource(show_spinner=False)
+def _build_bg_css(image_path, is_dark, use_static_url):
+    """Assemble the page's single <style> block once per (image, theme) pair.
+
+    Cached as a resource so every rerun gets the same string object back
+    instead of an unpickled copy of the (possibly base64-laden) payload.
+    """
+    gradient = BACKGROUND_GRADIENTS.get(image_path)
+    if use_static_url:
+        # Served from ./static, so the browser caches it across reruns and pages;
+        # the gradient underneath paints while the image loads
+        layers = f'url("./app/static/{os.path.basename(image_path)}")'
+        if gradient:
+            layers += f", {gradient}"
+    elif gradient and not is_dark:
+        # Light palettes are near-flat colour; skip the base64 payload entirely
+        layers = gradient
+    else:
+        layers = f'url("data:image/png;base64,{get_base64_of_bin_file(image_path)}")'
+    return "<style>" + _STATIC_CSS + f"""
+        /* Entire app background */
+        html, body, [data-testid="stApp"] {{
+            background-image: {layers};
+            background-size: cover;
+            background-position: center;
+            background-repeat: no-repeat;
+            background-attachment: fixed;
+        }}
+
+        [data-testid="stSidebar"] {{
+            color: {'black' if is_dark else 'rgba(49, 51, 63, 0.8)'} ;  /* Adjusted for light background */
+        }}
+
+        span {{
+            color: {'#f0f0f0' if is_dark else 'rgba(49, 51, 63, 0.8)'} !important;
+            transition: color 0.3s ease;
+        }}
         </style>
-    """, unsafe_allow_html=True)
+        """
+
+# --- Map light themes to background images (resolved once at import) ---
+DEFAULT_BACKGROUND = "static/pink.png"
+DARK_BACKGROUND = "static/dark.png"
+PALETTE_BACKGROUNDS = MappingProxyType({
+    "light": "static/pink.png",
+    "calm blue": "static/blue.png",
+    "mint": "static/mint.png",
+    "lavender": "static/lavender.png",
+    "pink": "static/pink.png"
+})
+
+# CSS stand-ins sampled from each background image
+BACKGROUND_GRADIENTS = MappingProxyType({
+    "static/pink.png": "linear-gradient(135deg, #faa9c3 0%, #ffc4da 50%, #f19bb7 100%)",
+    "static/blue.png": "linear-gradient(135deg, #3596de 0%, #63bef7 50%, #2485d1 100%)",
+    "static/mint.png": "linear-gradient(135deg, #9ad9b8 0%, #ade2c6 50%, #89d1ad 100%)",
+    "static/lavender.png": "linear-gradient(135deg, #af8ff1 0%, #c8a9ff 50%, #a386ea 100%)",
+    "static/dark.png": "linear-gradient(135deg, #111a27 0%, #2e3646 50%, #0a151f 100%)",
+})
+
+def set_background_for_theme(selected_palette="pink"):
+    # --- Get current theme info ---
+    current_theme = st.session_state.get("current_theme", None)
+    if not current_theme:
+        current_theme = get_current_theme()
+    
+    is_dark = current_theme["name"] == "Dark"
+
+    # --- Select background based on theme ---
+    if is_dark:
+        background_image_path = DARK_BACKGROUND
+    else:
+        background_image_path = PALETTE_BACKGROUNDS.get(selected_palette.lower(), DEFAULT_BACKGROUND)
+
+    # _build_bg_css is cached, so the style block is only assembled once per
+    # theme/palette. It is still emitted every run: Streamlit drops any element
+    # a rerun does not redraw.
+    use_static_url = st.get_option("server.enableStaticServing")
+    st.markdown(_build_bg_css(background_image_path, is_dark, use_static_url), unsafe_allow_html=True)
+
+# ✅ Set your background image
+selected_palette = st.session_state.get("palette_name", "Pink")
+set_background_for_theme(selected_palette)
+
+PAST_NEWSLETTERS = (
+    {
+        "title": "Mindful Mondays: The Power of Breath",
+        "date": "October 6, 2025",
+        "summary": "This week, we explore the power of mindful breathing and how it can help you stay calm and centered throughout the day. We also share a simple breathing exercise that you can do anywhere, anytime."
+    },
+    {
+        "title": "Wellness Wednesdays: The Importance of Sleep",
+        "date": "September 29, 2025",
+        "summary": "In this issue, we dive into the science of sleep and why it's so crucial for your mental and physical health. We also provide some tips for getting a better night's sleep."
+    },
+    {
+        "title": "Feel-Good Fridays: The Benefits of Gratitude",
+        "date": "September 22, 2025",
+        "summary": "This week, we focus on the power of gratitude and how it can improve your mood and overall well-being. We also share a simple gratitude journaling exercise."
+    },
+)
+
+@st.cache_resource(show_spinner=False)
+def _render_past_newsletters_html():
+    """Render every past-newsletter card into one responsive grid, shared by all sessions."""
+    # No blank or indented lines, so markdown keeps the whole block as raw HTML
+    parts = ['<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(18rem, 1fr)); gap: 1rem;">']
+    append = parts.append
+    for newsletter in PAST_NEWSLETTERS:
+        append('<div class="newsletter-card"><h4>')
+        append(newsletter["title"])
+        append('</h4><p><em>')
+        append(newsletter["date"])
+        append('</em></p><p>')
+        append(newsletter["summary"])
+        append('</p></div>')
+    append('</div>')
+    return "".join(parts)
+
+def newsletter_signup_form():
+    """Displays the newsletter signup form and handles submission."""
 
     # Container for the header and form
     with st.container():
@@ -141,7 +238,7 @@ def newsletter_signup_form():
             submit = st.form_submit_button("Subscribe")
 
             if submit:
-                if email and re.match(EMAIL_REGEX, email):
+                if email and _valid_email(email):
                     st.success("✅ Thank you for subscribing! You'll receive our next newsletter soon.")
                     st.balloons()
                     st.session_state.subscribed = True
@@ -169,34 +266,7 @@ def show():
     st.divider()
     st.subheader("📖 Past Newsletters")
 
-    past_newsletters = [
-        {
-            "title": "Mindful Mondays: The Power of Breath",
-            "date": "October 6, 2025",
-            "summary": "This week, we explore the power of mindful breathing and how it can help you stay calm and centered throughout the day. We also share a simple breathing exercise that you can do anywhere, anytime."
-        },
-        {
-            "title": "Wellness Wednesdays: The Importance of Sleep",
-            "date": "September 29, 2025",
-            "summary": "In this issue, we dive into the science of sleep and why it's so crucial for your mental and physical health. We also provide some tips for getting a better night's sleep."
-        },
-        {
-            "title": "Feel-Good Fridays: The Benefits of Gratitude",
-            "date": "September 22, 2025",
-            "summary": "This week, we focus on the power of gratitude and how it can improve your mood and overall well-being. We also share a simple gratitude journaling exercise."
-        }
-    ]
-
-    cols = st.columns(2)
-    for i, newsletter in enumerate(past_newsletters):
-        with cols[i % 2]:
-            st.markdown(f"""
-                <div class="newsletter-card">
-                    <h4>{newsletter['title']}</h4>
-                    <p><em>{newsletter['date']}</em></p>
-                    <p>{newsletter['summary']}</p>
-                </div>
-            """, unsafe_allow_html=True)
+    st.markdown(_render_past_newsletters_html(), unsafe_allow_html=True)
 
 # To run the page
 if __name__ == "__main__":
@@ -1,9 +1,21 @@
 import streamlit as st
-from core.water_tracker import log_water_intake, get_today_total, get_last_n_days_totals, get_today_entries, load_water_log, edit_water_intake_entry, delete_water_intake_entry
+from core.water_tracker import log_water_intake, get_today_total, dashboard_summary, load_water_log, edit_water_intake_entry, delete_water_intake_entry
 import pandas as pd
 import datetime
 
 st.set_page_config(page_title="Water Intake Tracker", page_icon="💧", layout="centered")
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_dashboard_summary(days, today):
+    """Dashboard stats for `today`; reused for up to a minute or until a write clears it."""
+    return dashboard_summary(days=days)
+
+
+def log_and_refresh(amount_ml):
+    log_water_intake(amount_ml)
+    cached_dashboard_summary.clear()
+
 # Custom CSS for enhanced visuals
 st.markdown("""
 <style>
@@ -257,7 +269,7 @@ with col1:
     
     if st.button("🌊 Log Water Intake", use_container_width=True):
         current_total = get_today_total()
-        log_water_intake(amount)
+        log_and_refresh(amount)
         st.success(f"✨ Logged {amount} ml of water!")
         
         if current_total < goal and (current_total + amount) >= goal:
@@ -274,20 +286,22 @@ with col1:
     st.markdown("<h4 style='text-align: center; margin-top: 1rem; color: #0d47a1;'>Or use a quick-add button:</h4>", unsafe_allow_html=True)
     q1, q2, q3 = st.columns(3)
     if q1.button("Glass (250ml)", use_container_width=True):
-        log_water_intake(250)
+        log_and_refresh(250)
         st.success("✨ Logged 250 ml of water!")
 
     if q2.button("Bottle (500ml)", use_container_width=True):
-        log_water_intake(500)
+        log_and_refresh(500)
         st.success("✨ Logged 500 ml of water!")
 
     if q3.button("Bottle (1L)", use_container_width=True):
-        log_water_intake(1000)
+        log_and_refresh(1000)
         st.success("✨ Logged 1000 ml of water!")
 
 with col2:
     st.markdown("<h3 style='text-align: center; margin-bottom: 1rem;'>Today's Total</h3>", unsafe_allow_html=True)
-    total = get_today_total()
+    # One snapshot of the log feeds every metric, tip and chart below
+    summary = cached_dashboard_summary(30, datetime.date.today().isoformat())
+    total = summary['today_total']
     st.metric(label="Total (ml)", value=total)
     
     progress = min(total / goal, 1.0)
@@ -362,19 +376,19 @@ st.markdown(f"""
 """, unsafe_allow_html=True)
 
 # Personalized Hydration Tip
-last_7_days_data = get_last_n_days_totals(7)
+last_7_days_data = summary['last_n_days'][-7:]
 personalized_tip = get_personalized_tip(goal, last_7_days_data)
 st.caption(personalized_tip)
 
 
 # 2. Detailed Log View with Edit/Delete
 with st.expander("📜 Today's Log", expanded=False):
-    todays_entries = get_today_entries()
+    todays_entries = summary['today_entries']
     if not todays_entries:
         st.info("No water logged yet today. Start tracking!")
     else:
-        # Sort entries by timestamp descending
-        todays_entries.sort(key=lambda x: x['timestamp'], reverse=True)
+        # Sort entries by timestamp descending (a copy; the log itself is shared)
+        todays_entries = sorted(todays_entries, key=lambda x: x['timestamp'], reverse=True)
         
         for entry in todays_entries:
             ts = entry['timestamp']
@@ -388,6 +402,7 @@ with st.expander("📜 Today's Log", expanded=False):
             with col2:
                 if st.button("Delete", key=f"delete_{ts}"):
                     delete_water_intake_entry(ts)
+                    cached_dashboard_summary.clear()
                     st.rerun()
 
             with col3:
@@ -402,6 +417,7 @@ with st.expander("📜 Today's Log", expanded=False):
                 new_amount = st.number_input("New Amount (ml)", value=amount, key=f"num_{ts}")
                 if st.button("Save", key=f"save_{ts}"):
                     edit_water_intake_entry(ts, new_amount)
+                    cached_dashboard_summary.clear()
                     st.session_state[edit_key] = False
                     st.rerun()
 
@@ -414,7 +430,7 @@ with st.expander("📈 Analytics and Trends", expanded=False):
         </div>
     </div>
     """, unsafe_allow_html=True)
-    days_data_7 = get_last_n_days_totals(7)
+    days_data_7 = last_7_days_data
     df_7 = pd.DataFrame(days_data_7, columns=["Date", "Water (ml)"])
     st.bar_chart(df_7.set_index("Date"), height=250, use_container_width=True)
 
@@ -425,7 +441,7 @@ with st.expander("📈 Analytics and Trends", expanded=False):
         </div>
     </div>
     """, unsafe_allow_html=True)
-    days_data_30 = get_last_n_days_totals(30)
+    days_data_30 = summary['last_n_days']
     df_30 = pd.DataFrame(days_data_30, columns=["Date", "Water (ml)"])
     st.line_chart(df_30.set_index("Date"), height=250, use_container_width=True)
 
@@ -59,7 +59,7 @@ is_dark = current_theme["name"] == "Dark"
 selected_palette = st.session_state.get("palette_name", "Pink").lower()
 
 if is_dark:
-    background_image_path = "static_files/dark.png"
+    background_image_path = "static/dark.png"
 else:
     background_image_path = "static_files/yoga-bg.png"
 
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from core import async_writer
+from core.async_writer import AsyncWriter, pop_failed_writes
+
+
+class TestAsyncWriter(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "nested", "log.jsonl")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def read(self):
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def test_write_appends_every_payload(self):
+        async_writer._write(self.path, [b"a\n", b"b\n"], True)
+        async_writer._write(self.path, [b"c\n"], True)
+        self.assertEqual(self.read(), b"a\nb\nc\n")
+
+    def test_write_replaces_with_newest_payload(self):
+        async_writer._write(self.path, [b"old\n"], True)
+        async_writer._write(self.path, [b"first\n", b"second\n"], False)
+        self.assertEqual(self.read(), b"second\n")
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_group_splits_on_mode_change(self):
+        futures = [object() for _ in range(5)]
+        batch = [
+            ("a", b"1", True, futures[0]),
+            ("b", b"x", False, futures[1]),
+            ("a", b"2", True, futures[2]),
+            ("a", b"R", False, futures[3]),
+            ("a", b"3", True, futures[4]),
+        ]
+        groups = async_writer._group(batch)
+        self.assertEqual(
+            [(path, append, payloads) for path, append, payloads, _ in groups],
+            [("a", True, [b"1", b"2"]), ("b", False, [b"x"]), ("a", False, [b"R"]), ("a", True, [b"3"])]
+        )
+        self.assertEqual(groups[0][3], [futures[0], futures[2]])
+
+    def test_mixed_modes_keep_queue_order(self):
+        writer = AsyncWriter("test-writer", tick_seconds=0.1)
+        futures = [
+            writer.submit(self.path, b"a\n"),
+            writer.submit(self.path, b"R\n", append=False),
+            writer.submit(self.path, b"b\n"),
+        ]
+        writer.flush()
+        self.assertEqual(self.read(), b"R\nb\n")
+        self.assertEqual([f.result() for f in futures], [None, None, None])
+
+    def test_failed_write_is_reported(self):
+        writer = AsyncWriter("test-writer")
+        with mock.patch.object(async_writer, "_write", side_effect=OSError("disk full")):
+            future = writer.submit(self.path, b"a\n")
+            writer.flush()
+        pending = [(self.path, future)]
+        failed = pop_failed_writes(pending)
+        self.assertEqual(pending, [])
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0][0], self.path)
+        self.assertIsInstance(failed[0][1], OSError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import glob
+import json
+import os
+import tempfile
+import unittest
+
+from components import medication_reminder as mr
+
+
+def make_log(i, year):
+    return {"medication_id": "m1", "date": f"{year}-01-{1 + i % 28:02d}", "time_taken": f"{i:05d}", "taken": True}
+
+
+class TestArchiveOldLogs(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        os.mkdir("data")
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def write_logs(self, logs):
+        with open(mr.MEDICATION_LOGS_FILE, "w") as f:
+            f.writelines(json.dumps(log) + "\n" for log in logs)
+
+    def read_jsonl(self, path):
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def test_below_threshold_leaves_file_alone(self):
+        logs = [make_log(i, 2024) for i in range(mr.MAX_LIVE_LOGS + mr.ARCHIVE_BATCH_SIZE - 1)]
+        self.write_logs(logs)
+        live = mr.archive_old_logs()
+        self.assertEqual([mr._stored_fields(log) for log in live], logs)
+        self.assertEqual(glob.glob(mr.MEDICATION_LOGS_ARCHIVE_PATTERN.format(year="*")), [])
+
+    def test_moves_oldest_logs_into_yearly_archives(self):
+        old = [make_log(i, 2023) for i in range(150)]
+        recent = [make_log(i, 2025) for i in range(mr.MAX_LIVE_LOGS + 100)]
+        self.write_logs(recent + old)
+
+        live = mr.archive_old_logs()
+        live_file = self.read_jsonl(mr.MEDICATION_LOGS_FILE)
+        self.assertEqual(len(live_file), mr.MAX_LIVE_LOGS)
+        self.assertEqual([mr._stored_fields(log) for log in live], live_file)
+
+        archived = {
+            year: self.read_jsonl(mr.MEDICATION_LOGS_ARCHIVE_PATTERN.format(year=year))
+            for year in ("2023", "2025")
+        }
+        self.assertEqual(len(archived["2023"]), 150)
+        self.assertEqual(len(archived["2025"]), 100)
+
+        # Every entry ends up in exactly one place, and the newest stay live
+        everything = live_file + archived["2023"] + archived["2025"]
+        key = mr._log_sort_key
+        self.assertEqual(sorted(everything, key=key), sorted(recent + old, key=key))
+        self.assertTrue(min(map(key, live_file)) >= max(map(key, archived["2025"])))
+
+
+if __name__ == "__main__":
+    unittest.main()
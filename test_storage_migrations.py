@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+import unittest
+
+from components import medication_reminder, self_compassion, sleep_hygiene, thought_reframing
+
+
+class MigrationTestCase(unittest.TestCase):
+    """Run each test inside an empty working directory with a data/ folder."""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        os.mkdir("data")
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def write_legacy(self, path, records):
+        with open(path, "w") as f:
+            json.dump(records, f)
+
+    def read_jsonl(self, path):
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+
+class TestStorageMigrations(MigrationTestCase):
+    def test_sleep_data(self):
+        entries = [{"date": "2025-01-01", "duration_hours": 7.5, "quality": 4}]
+        self.write_legacy(sleep_hygiene.LEGACY_SLEEP_DATA_FILE, entries)
+        self.assertEqual(sleep_hygiene.load_sleep_data(), entries)
+        self.assertEqual(self.read_jsonl(sleep_hygiene.SLEEP_DATA_FILE), entries)
+        self.assertTrue(os.path.exists(sleep_hygiene.LEGACY_SLEEP_DATA_FILE))
+
+    def test_reframings(self):
+        reframings = [{"negative_thought": "I always fail", "intensity": 8, "new_intensity": 4,
+                       "timestamp": "2025-01-01T10:00:00"}]
+        self.write_legacy(thought_reframing.LEGACY_REFRAMINGS_FILE, reframings)
+        loaded = thought_reframing.load_saved_reframings()
+        self.assertEqual([r.negative_thought for r in loaded], ["I always fail"])
+        self.assertEqual(self.read_jsonl(thought_reframing.REFRAMINGS_FILE), reframings)
+        self.assertTrue(os.path.exists(thought_reframing.LEGACY_REFRAMINGS_FILE))
+
+    def test_self_compassion(self):
+        path = self_compassion.JOURNAL_PATH
+        entries = [{"date": "2025-01-01", "entry": "kind words"}]
+        self.write_legacy(path[:-1], entries)
+        self_compassion._migrate_legacy_json(path)
+        self.assertEqual(self.read_jsonl(path), entries)
+        self.assertTrue(os.path.exists(path[:-1]))
+
+        # An existing JSONL file is never overwritten
+        self.write_legacy(path[:-1], [])
+        self_compassion._migrate_legacy_json(path)
+        self.assertEqual(self.read_jsonl(path), entries)
+
+    def test_medication_logs(self):
+        logs = [{"medication_id": "m1", "date": "2025-01-01", "time_taken": "08:00", "taken": True}]
+        self.write_legacy(medication_reminder.LEGACY_MEDICATION_LOGS_FILE, logs)
+        loaded = medication_reminder.load_medication_logs()
+        self.assertEqual([medication_reminder._stored_fields(log) for log in loaded], logs)
+        self.assertEqual(self.read_jsonl(medication_reminder.MEDICATION_LOGS_FILE), logs)
+        self.assertTrue(os.path.exists(medication_reminder.LEGACY_MEDICATION_LOGS_FILE))
+
+
+if __name__ == "__main__":
+    unittest.main()
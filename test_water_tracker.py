@@ -0,0 +1,167 @@
+import datetime
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from core import water_tracker
+from core.water_tracker import WaterStore
+
+
+def reference_monthly_statistics(month_data):
+    """Pure-Python version of get_monthly_statistics() from before NumPy."""
+    totals = [amount for amount in month_data.values() if amount > 0]
+    if not totals:
+        return {'total': 0, 'average': 0, 'best_day': None, 'worst_day': None, 'days_logged': 0}
+    best_date = max(month_data.items(), key=lambda x: x[1])
+    worst_date = min((item for item in month_data.items() if item[1] > 0), key=lambda x: x[1])
+    return {
+        'total': sum(totals),
+        'average': round(sum(totals) / len(totals), 2),
+        'best_day': {'date': best_date[0], 'amount': best_date[1]},
+        'worst_day': {'date': worst_date[0], 'amount': worst_date[1]},
+        'days_logged': len(totals),
+        'days_in_month': len(month_data)
+    }
+
+
+def reference_longest_streak(totals, daily_goal_ml):
+    """Pure-Python version of get_longest_streak() from before NumPy."""
+    max_streak = current_streak = 0
+    streak_start = max_streak_start = max_streak_end = None
+    for date_str in sorted(totals):
+        if totals[date_str] >= daily_goal_ml:
+            if current_streak == 0:
+                streak_start = date_str
+            current_streak += 1
+            if current_streak > max_streak:
+                max_streak = current_streak
+                max_streak_start = streak_start
+                max_streak_end = date_str
+        else:
+            current_streak = 0
+    return {'length': max_streak, 'start_date': max_streak_start, 'end_date': max_streak_end}
+
+
+def reference_streak_count(totals, daily_goal_ml):
+    """Day-by-day version of get_streak_count()."""
+    today = datetime.date.today()
+    streak = 0
+    for i in range(365):
+        if totals.get((today - datetime.timedelta(days=i)).isoformat(), 0) >= daily_goal_ml:
+            streak += 1
+        else:
+            break
+    return streak
+
+
+def random_totals(rng, days):
+    today = datetime.date.today()
+    totals = {}
+    for i in range(-2, days):
+        if rng.random() < 0.9:
+            amount = rng.choice([0, 250, 1500, 2000, 2500, 3000])
+            if rng.random() < 0.1:
+                amount += 0.5  # CSV imports can bring in float amounts
+            totals[(today - datetime.timedelta(days=i)).isoformat()] = amount
+    return totals
+
+
+class TestWaterStats(unittest.TestCase):
+    def test_stats_match_reference(self):
+        rng = random.Random(1234)
+        today = datetime.date.today()
+        for _ in range(300):
+            totals = random_totals(rng, rng.choice([0, 5, 40, 400]))
+            goal = rng.choice([1500, 2000, 2500])
+            month_data = water_tracker.get_monthly_data(today.year, today.month, totals=totals)
+            self.assertEqual(
+                water_tracker.get_monthly_statistics(today.year, today.month, totals=totals),
+                reference_monthly_statistics(month_data)
+            )
+            self.assertEqual(water_tracker.get_longest_streak(goal, totals=totals), reference_longest_streak(totals, goal))
+            self.assertEqual(water_tracker.get_streak_count(goal, totals=totals), reference_streak_count(totals, goal))
+            expected_days = [
+                ((today - datetime.timedelta(days=i)).isoformat(), totals.get((today - datetime.timedelta(days=i)).isoformat(), 0))
+                for i in range(29, -1, -1)
+            ]
+            self.assertEqual(water_tracker.get_last_n_days_totals(30, totals=totals), expected_days)
+
+
+class TestWaterStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "water.jsonl")
+        self.legacy_path = os.path.join(self._tmp.name, "water.json")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def lines(self):
+        with open(self.path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def test_append_writes_through(self):
+        store = WaterStore(self.path, self.legacy_path)
+        store.append("2025-01-01", {"amount_ml": 250, "timestamp": "t1"})
+        store.append("2025-01-01", {"amount_ml": 500, "timestamp": "t2"})
+        self.assertEqual([line["timestamp"] for line in self.lines()], ["t1", "t2"])
+        self.assertEqual(store.totals(), {"2025-01-01": 750})
+
+    def test_rewrites_are_buffered_until_flush(self):
+        store = WaterStore(self.path, self.legacy_path, flush_every=3)
+        store.append("2025-01-01", {"amount_ml": 250, "timestamp": "t1"})
+        store.replace({"2025-01-02": [{"amount_ml": 100, "timestamp": "t2"}]})
+        self.assertEqual([line["timestamp"] for line in self.lines()], ["t1"])
+        self.assertEqual(store.totals(), {"2025-01-02": 100})
+        store.flush()
+        self.assertEqual(self.lines(), [{"date": "2025-01-02", "amount_ml": 100, "timestamp": "t2"}])
+
+    def test_append_after_rewrite_writes_both(self):
+        store = WaterStore(self.path, self.legacy_path, flush_every=3)
+        store.replace({"2025-01-02": [{"amount_ml": 100, "timestamp": "t2"}]})
+        store.append("2025-01-03", {"amount_ml": 200, "timestamp": "t3"})
+        self.assertEqual([line["timestamp"] for line in self.lines()], ["t2", "t3"])
+
+    def test_update_swaps_in_new_dicts(self):
+        store = WaterStore(self.path, self.legacy_path)
+        store.append("2025-01-01", {"amount_ml": 250, "timestamp": "t1"})
+        data, totals = store.load(), store.totals()
+
+        def mutate(d):
+            del d["2025-01-01"]
+            return ("2025-01-01",)
+        self.assertTrue(store.update(mutate))
+        self.assertIn("2025-01-01", data)
+        self.assertEqual(totals, {"2025-01-01": 250})
+        self.assertEqual(store.load(), {})
+        self.assertEqual(store.totals(), {})
+
+    def test_reloads_when_file_changes(self):
+        store = WaterStore(self.path, self.legacy_path)
+        store.append("2025-01-01", {"amount_ml": 250, "timestamp": "t1"})
+        with open(self.path, "a") as f:
+            f.write(json.dumps({"date": "2025-01-02", "amount_ml": 300, "timestamp": "t2"}) + "\n")
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(store.totals(), {"2025-01-01": 250, "2025-01-02": 300})
+        self.assertEqual(store.total_for("2025-01-02"), 300)
+
+    def test_legacy_file_is_migrated_and_kept(self):
+        legacy = {"2025-01-01": [{"amount_ml": 250, "timestamp": "t1"}]}
+        with open(self.legacy_path, "w") as f:
+            json.dump(legacy, f)
+        store = WaterStore(self.path, self.legacy_path)
+        self.assertEqual(store.load(), legacy)
+        self.assertTrue(os.path.exists(self.legacy_path))
+        self.assertEqual(self.lines(), [{"date": "2025-01-01", "amount_ml": 250, "timestamp": "t1"}])
+
+        # Once the JSONL file exists the legacy file is never read again
+        with open(self.legacy_path, "w") as f:
+            json.dump({}, f)
+        self.assertEqual(WaterStore(self.path, self.legacy_path).load(), legacy)
+
+
+if __name__ == "__main__":
+    unittest.main()